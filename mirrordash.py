@@ -1,15 +1,30 @@
 #!/usr/bin/env python3
 """
 MirrorDash — Modular terminal dashboard.
-Usage: python3 mirrordash.py [--profile PROFILE] [--list] [--once]
+Usage: python3 mirrordash.py [--profile PROFILE] [--list] [--once] [--connect]
+       python3 mirrordash.py --once --format json [--profile PROFILE]
+       python3 mirrordash.py --export-port PORT [--headless]
+       python3 mirrordash.py --web PORT [--profile PROFILE]
+       python3 mirrordash.py --replay DIR [--speed N] [--once]
+       python3 mirrordash.py --at "2026-10-16 14:30" [--once]
+       python3 mirrordash.py compact [--min-mb N]
+       python3 mirrordash.py serve [--interval S]
+       python3 mirrordash.py gen-data --home DIR [--scale N] [--seed S]
 """
+from __future__ import annotations
 
 import argparse
-import importlib
+import json
+import os
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:   # rich is imported lazily, where it's used
+    from rich.layout import Layout
+    from rich.panel import Panel
 
 try:
     import yaml
@@ -17,29 +32,29 @@ except ImportError:
     print("pip install pyyaml rich")
     sys.exit(1)
 
-try:
-    from rich.console import Console, Group
-    from rich.layout import Layout
-    from rich.live import Live
-    from rich.columns import Columns
-    from rich.panel import Panel
-    from rich.text import Text
-    from rich import box
-except ImportError:
-    print("pip install rich")
-    sys.exit(1)
-
 PROFILES_DIR = Path(__file__).parent / "profiles"
 MODULES_DIR  = Path(__file__).parent / "modules"
-DATA_DIR     = Path.home() / ".mirrordash"
-DATA_DIR.mkdir(exist_ok=True)
 
-console = Console()
+_console = None
+
+
+def get_console():
+    """The shared rich Console, created on first use; `--format json` never asks."""
+    global _console
+    if _console is None:
+        try:
+            from rich.console import Console
+        except ImportError:
+            print("pip install rich")
+            sys.exit(1)
+        _console = Console()
+    return _console
 
 
 def load_profile(name: str) -> dict:
     path = PROFILES_DIR / f"{name}.yaml"
     if not path.exists():
+        console = get_console()
         console.print(f"[red]Profile not found:[/] {name}")
         console.print(f"Available: {', '.join(p.stem for p in PROFILES_DIR.glob('*.yaml'))}")
         sys.exit(1)
@@ -48,17 +63,46 @@ def load_profile(name: str) -> dict:
 
 def load_module(name: str):
     sys.path.insert(0, str(MODULES_DIR.parent))
-    try:
-        return importlib.import_module(f"modules.{name}")
-    except ModuleNotFoundError:
-        return None
+    from modules import collector
+    return collector.load(name)
+
+
+def profile_modules(profile: dict) -> list:
+    """Every module the profile shows, in layout order."""
+    cfg_layout = profile.get("layout")
+    if not cfg_layout:
+        return list(profile.get("modules", []))
+    names = []
+    for side in ("left", "right"):
+        for item in cfg_layout.get(side, []):
+            if isinstance(item, list):
+                names.extend(item)
+            else:
+                names.append(item)
+    return names
+
+
+def new_tick(profile: dict = None, client=None, names=None):
+    """Collection for one refresh, started in the background — see modules/collector.py.
+
+    With a `client`, data comes from the collector daemon (modules/serve.py).
+    `names` defaults to every module in the profile.
+    """
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules import collector, serve
+    profile = profile or {}
+    tick = serve.RemoteTick(client, profile) if client else collector.Tick(profile)
+    return tick.start(profile_modules(profile) if names is None else names, profile)
 
 
-def render_module(name: str, profile: dict) -> Panel:
+def render_module(name: str, profile: dict, tick=None) -> Panel:
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     mod = load_module(name)
     if mod and hasattr(mod, "render"):
         try:
-            return mod.render(profile)
+            return (tick or new_tick()).panel(name, mod, profile)
         except Exception as e:
             return Panel(Text(f"{name}: {e}", style="red"), title=name, border_style="red")
     return Panel(
@@ -67,7 +111,7 @@ def render_module(name: str, profile: dict) -> Panel:
     )
 
 
-def build_layout(profile: dict) -> Layout:
+def build_layout(profile: dict, tick=None, client=None) -> Layout:
     """
     Build a ratio-based Layout that fills the terminal.
 
@@ -78,8 +122,12 @@ def build_layout(profile: dict) -> Layout:
       left_ratio: 2
       right_ratio: 3
 
-    Falls back to auto 2-column grid if no layout key.
+    Falls back to auto 2-column grid if no layout key. A module listed in
+    several cells is collected once.
     """
+    from rich.layout import Layout
+    from rich.panel import Panel
+    tick   = tick or new_tick(profile, client)
     layout = Layout()
     layout.split_column(
         Layout(name="header", size=3),
@@ -110,9 +158,9 @@ def build_layout(profile: dict) -> Layout:
                     # Split row within column
                     cell.split_row(*[Layout(name=f"{col_name}_{i}_{j}") for j in range(len(item))])
                     for j, mod_name in enumerate(item):
-                        layout[f"{col_name}_{i}_{j}"].update(render_module(mod_name, profile))
+                        layout[f"{col_name}_{i}_{j}"].update(render_module(mod_name, profile, tick))
                 else:
-                    cell.update(render_module(item, profile))
+                    cell.update(render_module(item, profile, tick))
 
         build_column("left",  cfg_layout.get("left",  []))
         build_column("right", cfg_layout.get("right", []))
@@ -147,13 +195,13 @@ def build_layout(profile: dict) -> Layout:
         )
         for i, row in enumerate(rows):
             if len(row) == 1:
-                layout[f"row_{i}"].update(render_module(row[0], profile))
+                layout[f"row_{i}"].update(render_module(row[0], profile, tick))
             else:
                 layout[f"row_{i}"].split_row(
                     *[Layout(name=f"row_{i}_col_{j}") for j in range(len(row))]
                 )
                 for j, name in enumerate(row):
-                    layout[f"row_{i}_col_{j}"].update(render_module(name, profile))
+                    layout[f"row_{i}_col_{j}"].update(render_module(name, profile, tick))
 
     return layout
 
@@ -163,10 +211,18 @@ _PULSE_FRAMES = ["◇", "◈", "⟡", "◆", "⟡", "◈"]
 # ECG trace — scrolls across header
 _ECG = "─────────────────╱╲──────────────────────────────────────────────────"
 
+# Live-mode keys that move the dashboard through time; "." returns to now
+TRAVEL_KEYS = {"[": -3600, "]": 3600, "{": -86400, "}": 86400}
+
 
 def make_header(profile: dict, frame: int = 0) -> Panel:
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules.core import as_of, clock
     color  = profile.get("color", "bright_cyan")
-    now    = datetime.now().strftime("%H:%M:%S")
+    now    = datetime.fromtimestamp(clock()).strftime("%H:%M:%S")
     pulse  = _PULSE_FRAMES[frame % len(_PULSE_FRAMES)]
     # Scrolling ECG
     ecg_w  = 28
@@ -181,57 +237,313 @@ def make_header(profile: dict, frame: int = 0) -> Panel:
     t.append(ecg, style=f"dim {color}")
     t.append("  ", style="")
     t.append(profile.get("description", ""), style="grey50")
-    t.append(f"  {now}", style="grey60")
+    if as_of() is not None:
+        t.append(f"  AS OF {datetime.fromtimestamp(as_of()):%Y-%m-%d %H:%M}", style=f"bold {color}")
+    else:
+        t.append(f"  {now}", style="grey60")
+    if profile.get("_replay"):
+        t.append(f"  REPLAY {profile['_replay']:g}×", style=f"bold {color}")
     return Panel(t, box=box.HORIZONTALS, border_style=color, padding=(0, 1))
 
 
-def render_once(profile: dict):
+def render_once(profile: dict, client=None):
     """Print all modules stacked — natural height, scrollable."""
-    modules = profile.get("modules", [])
+    from rich.columns import Columns
+    console = get_console()
+    tick    = new_tick(profile, client)
+    modules = profile_modules(profile)
     wide    = set(profile.get("wide", []))
     cols    = profile.get("columns", 2)
     rows    = []
     buf     = []
 
-    # Also handle structured layout key
-    cfg_layout = profile.get("layout")
-    if cfg_layout:
-        all_mods = []
-        for side in ("left", "right"):
-            for item in cfg_layout.get(side, []):
-                if isinstance(item, list):
-                    all_mods.extend(item)
-                else:
-                    all_mods.append(item)
-        modules = all_mods
-
     for name in modules:
         if name in wide:
             if buf:
-                rows.append(Columns([render_module(m, profile) for m in buf], equal=True, expand=True))
+                rows.append(Columns([render_module(m, profile, tick) for m in buf], equal=True, expand=True))
                 buf = []
-            rows.append(render_module(name, profile))
+            rows.append(render_module(name, profile, tick))
         else:
             buf.append(name)
             if len(buf) == cols:
-                rows.append(Columns([render_module(m, profile) for m in buf], equal=True, expand=True))
+                rows.append(Columns([render_module(m, profile, tick) for m in buf], equal=True, expand=True))
                 buf = []
     if buf:
-        rows.append(Columns([render_module(m, profile) for m in buf], equal=True, expand=True))
+        rows.append(Columns([render_module(m, profile, tick) for m in buf], equal=True, expand=True))
 
     console.print(make_header(profile, frame=0))
     for row in rows:
         console.print(row)
 
 
+def snapshot(profile: dict, name: str, client=None) -> dict:
+    """Every module's collected data in one JSON-able document, without rich.
+
+    Modules that only have render(profile) produce panels, not data, and are
+    left out; a failed collect is reported under "errors".
+    """
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules import collector, core
+    mods = {}
+    for mod_name in profile_modules(profile):
+        mod = load_module(mod_name)
+        if mod is not None and collector.is_split(mod):
+            mods[mod_name] = mod
+    tick   = new_tick(profile, client, list(mods))
+    data   = {}
+    errors = {}
+    for mod_name, mod in mods.items():
+        try:
+            data[mod_name] = tick.collect(mod_name, mod, profile)
+        except Exception as e:
+            errors[mod_name] = f"{type(e).__name__}: {e}"
+    doc = {"profile": name, "generated": core.clock(), "modules": data}
+    if errors:
+        doc["errors"] = errors
+    if client:
+        doc["connected"] = tick.connected
+    return doc
+
+
+def compact_logs(min_mb: float):
+    """Rotate and compress every bus log at least `min_mb` in size."""
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules.core import HOME
+    from modules.eventlog import compact
+    console = get_console()
+    bus_dir = HOME / ".mirrordna/bus"
+    done = False
+    for path in sorted(bus_dir.glob("*.jsonl")):
+        for action in compact(path, min_bytes=int(min_mb * 1024 * 1024)):
+            console.print(f"  [cyan]{path.name:<24}[/] {action}")
+            done = True
+    if not done:
+        console.print(f"  [grey50]nothing to compact in {bus_dir}[/]")
+
+
+def gen_data(home: str, scale: int, seed: int, end: float | None):
+    """Write synthetic data for every source under `home` — see modules/gendata.py."""
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules.gendata import generate
+    console = get_console()
+    for action in generate(home, scale, seed, end):
+        console.print(f"  [cyan]gen-data[/] {action}")
+    console.print(f"\n  MIRRORDASH_HOME={Path(home).expanduser()} python3 mirrordash.py -p glass")
+
+
+def run_daemon(sock: str | None, interval: float):
+    """Collect for every connected dashboard until Ctrl-C."""
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules import serve
+    sock = sock or str(serve.SOCKET)
+    import signal
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))   # unwind so the socket is removed
+    console = get_console()
+    console.print(f"  [cyan]collector[/] serving on {sock} (data refreshed every {interval:g}s)")
+    try:
+        serve.serve(sock, interval=interval)
+    except RuntimeError as e:
+        console.print(f"  [red]{e}[/]")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+def start_replay(src: str, speed: float, to_end: bool = False):
+    """Point the modules at a scratch home fed from `src` on a virtual clock.
+
+    Must run before any module is imported: their paths are fixed at import.
+    With `to_end`, every event is written at once and the clock stops at the
+    last one. See modules/replay.py.
+    """
+    import atexit
+    import shutil
+    import tempfile
+    if not Path(src).expanduser().is_dir():
+        get_console().print(f"[red]Replay source not found:[/] {src}")
+        sys.exit(1)
+    home = tempfile.mkdtemp(prefix="mirrordash-replay-")
+    atexit.register(shutil.rmtree, home, True)
+    os.environ["MIRRORDASH_HOME"] = home
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules import core
+    from modules.replay import Replay
+    replay = Replay(src, home, speed)
+    core.set_clock(replay.clock)
+    if to_end:
+        replay.finish()
+        return replay
+    return replay.run()
+
+
+def travel(at: float | None):
+    """Show everything as of epoch `at`, or live again for None — see core.travel()."""
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules import core
+    core.travel(at)
+
+
+def parse_at(text: str) -> float:
+    """Local "YYYY-MM-DD HH:MM" (any ISO 8601 date or time) as epoch seconds."""
+    return datetime.fromisoformat(text.strip()).timestamp()
+
+
+class Keys:
+    """Single key presses from the terminal while the dashboard runs; none off a TTY."""
+
+    def __init__(self):
+        self.fd  = None
+        self.old = None
+
+    def __enter__(self):
+        try:
+            import termios
+            import tty
+        except ImportError:
+            return self
+        if sys.stdin.isatty():
+            self.fd  = sys.stdin.fileno()
+            self.old = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+        return self
+
+    def __exit__(self, *exc):
+        if self.old is not None:
+            import termios
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old)
+
+    def read(self, timeout: float) -> str:
+        """The next key pressed within `timeout` seconds, or ""."""
+        if self.fd is None:
+            time.sleep(timeout)
+            return ""
+        import select
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        return os.read(self.fd, 1).decode(errors="ignore") if ready else ""
+
+
+def start_exporter(port: int):
+    """Prometheus /metrics on `port`, fed by each refresh — see modules/exporter.py."""
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules.exporter import Exporter
+    try:
+        return Exporter().start(port)
+    except OSError as e:
+        get_console().print(f"  [red]can't export on port {port}: {e}[/]")
+        sys.exit(1)
+
+
+def start_web(port: int, profile: dict):
+    """Browser dashboard on `port`, fed by each refresh — see modules/web.py."""
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules.web import Hub
+    try:
+        return Hub(profile).start(port)
+    except OSError as e:
+        get_console().print(f"  [red]can't serve the web dashboard on port {port}: {e}[/]")
+        sys.exit(1)
+
+
+def run_headless(profile: dict, sinks: list, client=None):
+    """Collect every `refresh` seconds for the exporter and web viewers, without drawing."""
+    refresh = profile.get("refresh", 15)
+    names   = profile_modules(profile)
+    console = get_console()
+    for sink in sinks:
+        host, port = sink.server.server_address[:2]
+        path = "/metrics" if hasattr(sink, "body") else "/"
+        console.print(f"  [cyan]serving[/] http://{host}:{port}{path} (collected every {refresh}s)")
+    try:
+        while True:
+            tick = new_tick(profile, client)
+            for sink in sinks:
+                sink.update(tick, names, profile)
+            time.sleep(refresh)
+    except KeyboardInterrupt:
+        pass
+
+
+def connect(sock: str | None, quiet: bool = False):
+    """Client for the collector daemon; modules collect locally while it's unreachable."""
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules import serve
+    sock = sock or str(serve.SOCKET)
+    client = serve.Client(sock)
+    if client.fetch({}, []) is None and not quiet:
+        get_console().print(f"  [yellow]no collector on {sock} — collecting locally until one starts[/]")
+    return client
+
+
 def main():
     parser = argparse.ArgumentParser(description="MirrorDash")
+    parser.add_argument("command", nargs="?", choices=["compact", "serve", "gen-data"],
+                        help="compact: rotate and compress bus logs; "
+                             "serve: run the shared collector daemon; "
+                             "gen-data: write synthetic data for every source")
     parser.add_argument("--profile", "-p", default="default")
     parser.add_argument("--list",    "-l", action="store_true")
     parser.add_argument("--once",          action="store_true")
+    parser.add_argument("--format", choices=["text", "json"], default="text",
+                        help="--once output: panels, or every module's data as JSON")
+    parser.add_argument("--connect",       action="store_true",
+                        help="render from a running `serve` daemon")
+    parser.add_argument("--socket",
+                        help="serve/--connect: Unix socket path (default ~/.mirrordash/collector.sock)")
+    parser.add_argument("--min-mb", type=float, default=0,
+                        help="compact: skip logs smaller than this")
+    parser.add_argument("--interval", type=float, default=5.0,
+                        help="serve: seconds before shared data is collected again")
+    parser.add_argument("--export-port", type=int, metavar="PORT",
+                        help="serve Prometheus metrics on http://127.0.0.1:PORT/metrics")
+    parser.add_argument("--headless", action="store_true",
+                        help="with --export-port: collect without drawing the dashboard")
+    parser.add_argument("--web", type=int, metavar="PORT",
+                        help="serve the dashboard to browsers on http://127.0.0.1:PORT/")
+    parser.add_argument("--replay", metavar="DIR",
+                        help="replay the logs recorded in DIR (a copy of ~/.mirrordna)")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="--replay: multiple of real time")
+    parser.add_argument("--at", metavar="TIME",
+                        help='show the dashboard as it was at TIME ("YYYY-MM-DD HH:MM", local); '
+                             "gen-data: when the generated history ends (default now)")
+    parser.add_argument("--home", metavar="DIR",
+                        help="gen-data: where to write (use it as MIRRORDASH_HOME)")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="gen-data: days of history and number of git repos")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="gen-data: same seed, scale and --at give the same data")
     args = parser.parse_args()
+    if args.replay and args.connect:
+        parser.error("--replay collects locally and can't be combined with --connect")
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    at = None
+    if args.at:
+        if args.replay or args.connect:
+            parser.error("--at reads the local logs and can't be combined with --replay or --connect")
+        try:
+            at = parse_at(args.at)
+        except ValueError:
+            parser.error(f'--at: expected "YYYY-MM-DD HH:MM", got {args.at!r}')
+
+    if args.command == "compact":
+        compact_logs(args.min_mb)
+        return
+
+    if args.command == "serve":
+        run_daemon(args.socket, args.interval)
+        return
+
+    if args.command == "gen-data":
+        if not args.home:
+            parser.error("gen-data needs --home DIR")
+        if args.scale < 1:
+            parser.error("--scale must be at least 1")
+        gen_data(args.home, args.scale, args.seed, at)
+        return
 
     if args.list:
+        console = get_console()
         console.print("\n[bold]Available profiles:[/]\n")
         for p in sorted(PROFILES_DIR.glob("*.yaml")):
             cfg = yaml.safe_load(p.read_text())
@@ -240,31 +552,74 @@ def main():
         return
 
     profile = load_profile(args.profile)
+    if args.replay:
+        start_replay(args.replay, args.speed, to_end=args.once or args.format == "json")
+        profile["collect_processes"] = False   # worker processes don't share the replay clock
+        profile["_replay"] = args.speed
+    if at is not None:
+        travel(at)
+    # Only now: modules fix their paths at import, and --replay moves HOME
+    sys.path.insert(0, str(MODULES_DIR.parent))
+    from modules.core import DASH_DIR
+    DASH_DIR.mkdir(parents=True, exist_ok=True)
+
+    if args.format == "json":
+        client = connect(args.socket, quiet=True) if args.connect else None
+        print(json.dumps(snapshot(profile, args.profile, client), default=str))
+        return
+
+    console = get_console()
     refresh = profile.get("refresh", 15)
+    client  = connect(args.socket) if args.connect else None
 
     if args.once:
-        render_once(profile)
+        render_once(profile, client)
+        return
+
+    exporter = start_exporter(args.export_port) if args.export_port else None
+    if args.web:
+        sinks = [start_web(args.web, profile)] + ([exporter] if exporter else [])
+        run_headless(profile, sinks, client)
+        return
+    if exporter and args.headless:
+        run_headless(profile, [exporter], client)
         return
 
-    with Live(console=console, refresh_per_second=4, screen=True) as live:
+    from rich.live import Live
+    with Live(console=console, refresh_per_second=4, screen=True) as live, Keys() as keys:
         frame        = 0
         last_rebuild = 0.0
+        layout       = None
+        pending      = None
 
         while True:
             now = time.time()
             profile["_frame"] = frame
 
-            # Rebuild data panels every `refresh` seconds
-            if now - last_rebuild >= refresh:
-                layout       = build_layout(profile)
+            # Start collecting every `refresh` seconds; the panels are swapped
+            # in once it finishes, so the header keeps animating meanwhile
+            if pending is None and now - last_rebuild >= refresh:
+                pending      = new_tick(profile, client)
                 last_rebuild = now
+            if pending is not None and (layout is None or pending.done()):
+                layout  = build_layout(profile, pending)
+                if exporter:
+                    exporter.update(pending, profile_modules(profile), profile)
+                pending = None
 
             # Always update header (drives pulse + ECG animation)
             layout["header"].update(make_header(profile, frame))
             live.update(layout)
 
             frame += 1
-            time.sleep(0.25)   # 4 fps animation tick
+            key = keys.read(0.25)   # 4 fps animation tick
+            if (key in TRAVEL_KEYS or key == ".") and not (args.replay or client):
+                # Step through time: drop the tick in flight and collect at once
+                at = None if key == "." else (at or time.time()) + TRAVEL_KEYS[key]
+                if at is not None and at >= time.time():
+                    at = None
+                travel(at)
+                pending, last_rebuild = None, 0.0
 
 
 if __name__ == "__main__":
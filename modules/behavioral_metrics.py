@@ -1,102 +1,125 @@
 """Behavioral Metrics — the 5 AI governance metrics: Integrity Index, Drift
 Coefficient, Recurrence Rate, Verification Ratio, Stability Half-Life."""
-import json
-import math
-import time
-from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
-from rich.console import Group
-from rich import box
-from .core import clr
-
-SELF_CRITIQUE = Path.home() / ".mirrordna/self_critique.jsonl"
-CC_EVENTS     = Path.home() / ".mirrordna/bus/cc_events.jsonl"
-GATES         = Path.home() / ".mirrordna/bus/hook_decisions.jsonl"
-
-READ_TOOLS  = {"Read", "Glob", "Grep"}
-WRITE_TOOLS = {"Write", "Edit"}
-
-
-def _load_critiques():
-    if not SELF_CRITIQUE.exists():
-        return []
-    entries = []
-    for line in SELF_CRITIQUE.read_text().splitlines():
-        try:
-            entries.append(json.loads(line.strip()))
-        except Exception:
-            pass
-    return entries
-
-
-def _compute_all():
-    entries = _load_critiques()
+from collections import deque
+from .core import clr, HOME, as_of
+from .eventlog import JsonlTail, iter_events
+from .stats import Welford, Windowed
+from . import integrity
+
+SELF_CRITIQUE = HOME / ".mirrordna/self_critique.jsonl"
+
+WINDOWS = (10, 50)   # sessions — `metrics_window` picks one; default is all time
+
+PROFILE_KEYS = ("metrics_window", "integrity_weights", "store")
+
+
+class _CritiqueStats:
+    """Running totals behind metrics 2, 3 and 5, updated once per critique entry."""
+
+    def __init__(self):
+        self.sessions  = 0
+        self.scores    = Welford()
+        self.windowed  = {w: Windowed(w) for w in WINDOWS}
+        self.mistakes  = 0
+        self.recurring = 0
+        self.spans     = {}     # pattern key -> [first, last] session index
+        self.lifetimes = 0      # sum of last - first + 1 over spans
+        self.recent    = deque(maxlen=max(WINDOWS))   # (mistakes, recurring keys)
+        self.last      = None
+
+    def add(self, e):
+        i = self.sessions
+        self.sessions += 1
+        self.last = e
+        score = e.get("score")
+        if isinstance(score, (int, float)):
+            self.scores.add(score)
+        else:
+            score = None
+        for w in self.windowed.values():
+            w.add(score)   # one slot per session, scored or not
+        keys = [r[:50] for r in e.get("recurring", [])]
+        mistakes = len(e.get("mistakes", []))
+        self.mistakes += mistakes
+        self.recurring += len(keys)
+        for key in keys:
+            span = self.spans.get(key)
+            if span is None:
+                self.spans[key] = [i, i]
+                self.lifetimes += 1
+            else:
+                self.lifetimes += i - span[1]   # 0 if already seen this session
+                span[1] = i
+        self.recent.append((mistakes, keys))
+
+    def view(self, window=None):
+        """drift, mistakes, recurring, half-life, patterns, sessions — all
+        time, or over the last `window` sessions."""
+        if window not in self.windowed:
+            shl = self.lifetimes / len(self.spans) if self.spans else None
+            return (self.scores.cv(), self.mistakes, self.recurring, shl,
+                    len(self.spans), self.sessions)
+        recent = list(self.recent)[-window:]
+        spans = {}
+        for i, (_, keys) in enumerate(recent):
+            for key in keys:
+                spans.setdefault(key, [i, i])[1] = i
+        lifetimes = sum(b - a + 1 for a, b in spans.values())
+        return (self.windowed[window].cv(),
+                sum(m for m, _ in recent), sum(len(k) for _, k in recent),
+                lifetimes / len(spans) if spans else None, len(spans), len(recent))
+
+
+_tail  = JsonlTail(str(SELF_CRITIQUE))
+_stats = _CritiqueStats()
+_then  = (None, None)   # (t, stats of the critiques written by t)
+
+
+def _critique_stats():
+    """Fold critique entries appended since the last tick into _stats.
+
+    For an instant in the past, the entries up to it are folded afresh
+    (once per instant); entries without a time always count.
+    """
+    global _stats, _then
+    at = as_of()
+    if at is not None:
+        if _then[0] != at:
+            stats = _CritiqueStats()
+            for e in iter_events(SELF_CRITIQUE, until=at):
+                if isinstance(e, dict):
+                    stats.add(e)
+            _then = (at, stats)
+        return _then[1]
+    _tail.check()
+    if _tail.reset:
+        _stats, _tail.reset = _CritiqueStats(), False
+    for e in _tail.read():
+        if isinstance(e, dict):
+            _stats.add(e)
+    return _stats
+
+
+def _compute_all(profile, window=None):
+    stats = _critique_stats()
     results = {}
 
     # ── 1. Integrity Index (0–100) ─────────────────────────────────────────
-    # Score from risk_score logic (simplified): gate violations + recurring
-    reads = writes = blocks = warns = 0
-    cutoff = time.time() - 3600
-
-    if CC_EVENTS.exists():
-        lines = CC_EVENTS.read_text().splitlines()[-200:]
-        for raw in lines:
-            try:
-                ev = json.loads(raw)
-                t = ev.get("tool", "")
-                if t in READ_TOOLS:  reads += 1
-                if t in WRITE_TOOLS: writes += 1
-            except Exception:
-                pass
-
-    if GATES.exists():
-        for raw in GATES.read_text().splitlines():
-            try:
-                ev = json.loads(raw)
-                if ev.get("epoch", 0) < cutoff:
-                    continue
-                v = ev.get("verdict", ev.get("decision", "")).lower()
-                if "block" in v or "deny" in v: blocks += 1
-                elif "warn" in v: warns += 1
-            except Exception:
-                pass
-
-    rw_ratio = reads / writes if writes > 0 else 99
-    ii = 100
-    if rw_ratio < 1.0:
-        ii -= min(30, int((1.0 - rw_ratio) * 40))
-    elif rw_ratio < 2.0:
-        ii -= 10
-    ii -= min(25, blocks * 8)
-    ii -= min(15, warns * 3)
-    if entries:
-        latest_recurring = len(entries[-1].get("recurring", []))
-        if latest_recurring > 3:
-            ii -= min(20, latest_recurring * 3)
-        elif latest_recurring > 0:
-            ii -= 5
-    results["integrity_index"] = max(0, min(100, ii))
+    # Same engine and inputs as the risk_score panel.
+    engine = integrity.compute(profile)
+    results["integrity_index"] = engine["score"]
+    reads, writes = engine["reads"], engine["writes"]
+
+    drift, total_mistakes, total_recurring, shl, patterns, sessions = stats.view(window)
 
     # ── 2. Drift Coefficient (σ/μ) ─────────────────────────────────────────
     # Coefficient of variation of session scores. 0=stable, >0.3=drifting.
-    scores = [e.get("score", 5) for e in entries if e.get("score") is not None]
-    if len(scores) >= 2:
-        mu = sum(scores) / len(scores)
-        sigma = math.sqrt(sum((s - mu) ** 2 for s in scores) / len(scores))
-        dc = sigma / mu if mu > 0 else 0.0
-    elif scores:
-        dc = 0.0
-    else:
-        dc = None
-    results["drift_coefficient"] = dc
+    # Welford running mean/variance — no pass over past scores.
+    results["drift_coefficient"] = drift
 
     # ── 3. Recurrence Rate ─────────────────────────────────────────────────
     # recurring_count / total_mistakes across all sessions.
     # High = same mistakes keep coming back. Target < 0.20.
-    total_mistakes = sum(len(e.get("mistakes", [])) for e in entries)
-    total_recurring = sum(len(e.get("recurring", [])) for e in entries)
     rr = total_recurring / total_mistakes if total_mistakes > 0 else 0.0
     results["recurrence_rate"] = rr
     results["total_mistakes"]  = total_mistakes
@@ -112,21 +135,10 @@ def _compute_all():
 
     # ── 5. Stability Half-Life ─────────────────────────────────────────────
     # Avg sessions a recurring pattern persists before resolving.
-    # Track each unique pattern (first 50 chars as key): first seen → last seen.
-    pattern_spans = {}
-    for i, e in enumerate(entries):
-        for r in e.get("recurring", []):
-            key = r[:50]
-            if key not in pattern_spans:
-                pattern_spans[key] = {"first": i, "last": i}
-            else:
-                pattern_spans[key]["last"] = i
-
-    lifetimes = [v["last"] - v["first"] + 1 for v in pattern_spans.values()]
-    shl = sum(lifetimes) / len(lifetimes) if lifetimes else None
+    # Each unique pattern (first 50 chars as key): first seen → last seen.
     results["stability_half_life"] = shl
-    results["pattern_count"] = len(pattern_spans)
-    results["session_count"]  = len(entries)
+    results["pattern_count"] = patterns
+    results["session_count"]  = sessions
 
     return results
 
@@ -158,9 +170,35 @@ def _grade(metric, value):
     return "grey50", "?"
 
 
-def render(profile):
+def collect(profile):
+    window = profile.get("metrics_window")
+    return _compute_all(profile, window if window in WINDOWS else None)
+
+
+def metrics(data):
+    return [
+        ("mirrordash_integrity_index", "Integrity score, 0-100",
+         [({}, data["integrity_index"])]),
+        ("mirrordash_drift_coefficient", "Coefficient of variation of session self-scores",
+         [({}, data["drift_coefficient"])]),
+        ("mirrordash_recurrence_rate", "Recurring mistakes / all mistakes",
+         [({}, data["recurrence_rate"])]),
+        ("mirrordash_verification_ratio", "Reads / (reads + writes) over recent tool calls",
+         [({}, data["verification_ratio"])]),
+        ("mirrordash_stability_half_life_sessions", "Sessions a recurring pattern persists",
+         [({}, data["stability_half_life"])]),
+    ]
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.table import Table
+    from rich.console import Group
+    from rich import box
     color = clr(profile.get("color", "deep_sky_blue1"))
-    m = _compute_all()
+    window = profile.get("metrics_window")
+    m = data
 
     metrics = [
         ("Integrity Index",    "integrity_index",    f"{m['integrity_index']:.0f}/100",
@@ -199,6 +237,8 @@ def render(profile):
 
     header = Text()
     header.append(f"  {m['session_count']} sessions", style="bold white")
+    if window in WINDOWS:
+        header.append(f" (last {window})", style="grey50")
     header.append(f" · {m['pattern_count']} patterns tracked\n\n", style="grey50")
 
     frame = profile.get("_frame", 0)
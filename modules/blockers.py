@@ -1,24 +1,26 @@
 """Blockers module — items preventing progress. Blinks red if any active."""
 from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr, DASH_DIR
+from .core import clr, DASH_DIR, parse_list, read_cached
 
 BLOCKERS_FILE = DASH_DIR / "blockers.md"
 
+PROFILE_KEYS = ()
+
 
 def _read_blockers():
-    if not BLOCKERS_FILE.exists():
-        return []
-    lines = BLOCKERS_FILE.read_text().splitlines()
-    return [l.strip().lstrip("- ").strip() for l in lines
-            if l.strip() and not l.strip().startswith("#")]
+    return read_cached(BLOCKERS_FILE, parse_list, [])
+
+
+def collect(profile):
+    return {"blockers": _read_blockers()}
 
 
-def render(profile):
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     color = clr(profile.get("color"))
-    blockers = _read_blockers()
+    blockers = data["blockers"]
 
     t = Text()
     if blockers:
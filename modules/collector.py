@@ -0,0 +1,171 @@
+"""Per-tick collection, shared by every slot that shows a module.
+
+A module may split its work in two:
+
+    PROFILE_KEYS = ("store",)        # profile settings collect() reads
+    PROCESS      = True              # optional: CPU-bound, may run in a worker process
+
+    def collect(profile):            # I/O and analysis -> plain, picklable data
+        ...
+    def render(data, profile):       # data -> Panel, no I/O
+        ...
+
+Within one Tick, collect() runs once per (module, values of PROFILE_KEYS),
+however many layout cells or profiles ask for it. Data holds epochs, not
+ages or countdowns; render() works those out, so data only changes when its
+sources do. A module without
+PROFILE_KEYS is keyed on every profile setting except the presentation ones
+below. Modules that only define render(profile) are still supported; their
+panel is memoized per module and whole profile, so it is built once per tick
+however many cells show it.
+
+Tick.start() hands every collection to a thread pool of `collect_workers`
+threads (0 = collect inline, on first use). With `collect_processes: true`,
+PROCESS modules collect in a worker process of their own instead, off the
+GIL; one process per module keeps its incremental state between ticks, and
+each call carries the instant being shown (core.as_of) with it. Calls into
+one module are never concurrent, so module-level state needs no more locking
+than before.
+"""
+import importlib
+import json
+import multiprocessing
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from . import core
+
+# Profile keys that only affect layout or styling, never collected data
+PRESENTATION = {"name", "description", "color", "refresh", "layout", "modules",
+                "wide", "columns", "left_ratio", "right_ratio"}
+
+WORKERS = 4   # default collect_workers
+
+_lock    = threading.Lock()
+_threads = {}   # size -> ThreadPoolExecutor
+_procs   = {}   # module name -> single-worker ProcessPoolExecutor, None once broken
+_serial  = {}   # module name -> Lock held while it collects
+
+
+def load(name):
+    """modules.<name>, or None if there is no such module."""
+    try:
+        return importlib.import_module(f"{__package__}.{name}")
+    except ModuleNotFoundError:
+        return None
+
+
+def is_split(mod):
+    return hasattr(mod, "collect")
+
+
+def key(name, mod, profile):
+    """Cache key: the module plus the profile settings its collection depends on."""
+    keys = getattr(mod, "PROFILE_KEYS", None)
+    if not is_split(mod):
+        keys = sorted(k for k in profile if not k.startswith("_"))
+    elif keys is None:
+        keys = sorted(k for k in profile if not k.startswith("_") and k not in PRESENTATION)
+    settings = {k: profile.get(k) for k in keys}
+    return name, json.dumps(settings, sort_keys=True, default=str)
+
+
+def _quiet():
+    signal.signal(signal.SIGINT, signal.SIG_IGN)   # Ctrl-C is the dashboard's to handle
+
+
+def _collect_by_name(name, profile, at=None):
+    """Worker-process entry point: import the module there and collect as of `at`."""
+    core.travel(at)
+    return load(name).collect(profile)
+
+
+def _thread_pool(size):
+    with _lock:
+        pool = _threads.get(size)
+        if pool is None:
+            pool = _threads[size] = ThreadPoolExecutor(size, thread_name_prefix="collect")
+        return pool
+
+
+def _process_pool(name):
+    with _lock:
+        if name not in _procs:
+            _procs[name] = ProcessPoolExecutor(
+                1, mp_context=multiprocessing.get_context("spawn"), initializer=_quiet)
+        return _procs[name]
+
+
+def _one_at_a_time(name, fn):
+    with _lock:
+        lock = _serial.setdefault(name, threading.Lock())
+    with lock:
+        return fn()
+
+
+def _call(fn):
+    """Run fn() now, as an already-finished Future."""
+    f = Future()
+    try:
+        f.set_result(fn())
+    except Exception as e:
+        f.set_exception(e)
+    return f
+
+
+class Tick:
+    """Collected results for one refresh. Errors are kept and re-raised per slot."""
+
+    def __init__(self, profile=None):
+        profile = profile or {}
+        self.workers   = profile.get("collect_workers", WORKERS)
+        self.processes = profile.get("collect_processes", False)
+        self.results   = {}   # key -> Future
+
+    def submit(self, name, mod, profile):
+        """A Future for one collection (or, for render-only modules, one panel)."""
+        if is_split(mod):
+            pool = self.processes and getattr(mod, "PROCESS", False) and _process_pool(name)
+            if pool:
+                try:
+                    return pool.submit(_collect_by_name, name, profile, core.as_of())
+                except (BrokenProcessPool, RuntimeError):
+                    _procs[name] = None   # worker died or can't start: use threads from now on
+            fn = lambda: mod.collect(profile)
+        else:
+            fn = lambda: mod.render(profile)
+        if self.workers:
+            return _thread_pool(self.workers).submit(_one_at_a_time, name, fn)
+        return _call(lambda: _one_at_a_time(name, fn))
+
+    def _future(self, name, mod, profile):
+        k = key(name, mod, profile)
+        f = self.results.get(k)
+        if f is None:
+            f = self.results[k] = self.submit(name, mod, profile)
+        return f
+
+    def start(self, names, profile):
+        """Begin collecting `names` in the background (no-op without workers)."""
+        if not self.workers:
+            return self
+        for name in names:
+            mod = load(name)
+            if mod is not None and hasattr(mod, "render"):
+                self._future(name, mod, profile)
+        return self
+
+    def done(self):
+        return all(f.done() for f in self.results.values())
+
+    def collect(self, name, mod, profile):
+        """Data from mod.collect(profile), computed once per key this tick."""
+        return self._future(name, mod, profile).result()
+
+    def panel(self, name, mod, profile):
+        """A module's panel: split modules render cached data, others render once."""
+        if is_split(mod):
+            return mod.render(self.collect(name, mod, profile), profile)
+        return self._future(name, mod, profile).result()
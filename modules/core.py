@@ -1,25 +1,68 @@
-"""Shared utilities for all MirrorDash modules."""
+"""Shared utilities for all MirrorDash modules.
+
+Nothing here imports rich at module level: collectors run without it (see
+`--format json`), and only the render helpers below pull it in.
+"""
+import json
+import os
 import subprocess
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 
-from rich import box
-from rich.panel import Panel
-from rich.text import Text
-
-DASH_DIR = Path.home() / ".mirrordash"
+# MIRRORDASH_HOME points every module at another home, e.g. a replay scratch dir
+HOME = Path(os.environ.get("MIRRORDASH_HOME") or Path.home())
+DASH_DIR = HOME / ".mirrordash"
 TASKS_FILE = DASH_DIR / "tasks.md"
 LOOPS_FILE = DASH_DIR / "loops.md"
 METRICS_FILE = DASH_DIR / "metrics.yaml"
 PRESENCE_FILE = DASH_DIR / "presence.json"
 
 
+_clock = time.time
+
+
+def clock():
+    """Epoch seconds now. Modules ask this rather than time.time(), so that
+    --replay can run them on the recorded timeline's clock."""
+    return _clock()
+
+
+def set_clock(fn=None):
+    """Make clock() return fn(); None restores the wall clock."""
+    global _clock
+    _clock = fn or time.time
+
+
+# ── Time travel ──────────────────────────────────────────────────────────────
+# Under --at, clock() is fixed at the chosen instant and eventlog's readers
+# stop at it, so windows like "last hour" end there. Incremental panels build
+# their state from the LOOKBACK seconds before it instead of their live tails.
+
+LOOKBACK = 86400
+
+_as_of = None
+
+
+def as_of():
+    """The instant the dashboard is showing, or None when it is live."""
+    return _as_of
+
+
+def travel(t=None):
+    """Show everything as of epoch `t`; None returns to the present."""
+    global _as_of
+    _as_of = t
+    set_clock((lambda: t) if t is not None else None)
+
+
 def clr(profile_color):
     return profile_color or "bright_cyan"
 
 
 def _bar(value, max_val, width=14, fill="█", empty="░", color="green"):
+    from rich.text import Text
     filled = int((value / max_val) * width) if max_val else 0
     filled = max(0, min(filled, width))
     t = Text()
@@ -28,6 +71,19 @@ def _bar(value, max_val, width=14, fill="█", empty="░", color="green"):
     return t
 
 
+def _spark(values, width=16, color="cyan"):
+    """Sparkline of the last `width` values, scaled to the window max."""
+    from rich.text import Text
+    vals = list(values)[-width:]
+    top = max(vals) if vals else 0
+    t = Text()
+    t.append("·" * (width - len(vals)), style="grey23")
+    for v in vals:
+        idx = min(int(v / top * 7), 7) if top else 0
+        t.append("▁▂▃▄▅▆▇█"[idx], style=color if v else "grey30")
+    return t
+
+
 def _dot(ok: bool) -> str:
     return "[green]●[/]" if ok else "[red]●[/]"
 
@@ -40,13 +96,81 @@ def _run(cmd: str) -> str:
         return ""
 
 
-def read_tasks():
-    """Read tasks.md — returns (current, queue[], done[])."""
-    if not TASKS_FILE.exists():
-        return None, [], []
-    lines = TASKS_FILE.read_text().splitlines()
+# ── Parsed-file cache ────────────────────────────────────────────────────────
+# Config and notes files change rarely but are read every refresh, often by
+# more than one module. read_cached() re-parses a file only when its mtime or
+# size changes, so an unchanged file costs one stat().
+
+def parse_list(text):
+    """Markdown list file — non-empty, non-heading lines without "- " bullets."""
+    return [l.strip().lstrip("- ").strip() for l in text.splitlines()
+            if l.strip() and not l.strip().startswith("#")]
+
+
+def parse_jsonl(text):
+    """JSON Lines — one decoded value per line; bad lines are skipped."""
+    out = []
+    for line in text.splitlines():
+        try:
+            out.append(json.loads(line))
+        except ValueError:
+            pass
+    return out
+
+
+def _parse_yaml(text):
+    import yaml
+    return yaml.safe_load(text)
+
+
+def _parse_text(text):
+    return text
+
+
+PARSERS = {
+    ".json":  json.loads,
+    ".jsonl": parse_jsonl,
+    ".yaml":  _parse_yaml,
+    ".yml":   _parse_yaml,
+    ".md":    _parse_text,
+}
+
+_parsed      = {}   # (path, parser) -> ((mtime_ns, size), value)
+_parsed_lock = threading.Lock()
+
+
+def read_cached(path, parse=None, default=None):
+    """parse(text of `path`), re-run only when the file's (mtime_ns, size) changes.
+
+    `parse` defaults to the PARSERS entry for the file's suffix; pass a
+    module-level function, since the cache is keyed on it. A missing file
+    gives `default`, and so does one that fails to parse until it changes.
+    The value is shared between callers and must not be mutated.
+    """
+    path = str(path)
+    parse = parse or PARSERS.get(os.path.splitext(path)[1], _parse_text)
+    try:
+        st = os.stat(path)
+    except OSError:
+        _parsed.pop((path, parse), None)
+        return default
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _parsed.get((path, parse))
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    with _parsed_lock:
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                value = parse(f.read())
+        except Exception:
+            value = default
+        _parsed[(path, parse)] = (stamp, value)
+    return value
+
+
+def _parse_tasks(text):
     current, queue, done = None, [], []
-    for line in lines:
+    for line in text.splitlines():
         s = line.strip()
         if s.startswith("## NOW") or s.startswith("## CURRENT"):
             continue
@@ -59,10 +183,11 @@ def read_tasks():
     return current, queue, done
 
 
+def read_tasks():
+    """Read tasks.md — returns (current, queue[], done[])."""
+    return read_cached(TASKS_FILE, _parse_tasks, (None, [], []))
+
+
 def read_loops():
     """Read loops.md — returns list of open loop strings."""
-    if not LOOPS_FILE.exists():
-        return []
-    lines = LOOPS_FILE.read_text().splitlines()
-    return [l.strip().lstrip("- ").strip() for l in lines
-            if l.strip() and not l.strip().startswith("#")]
+    return read_cached(LOOPS_FILE, parse_list, [])
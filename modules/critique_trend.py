@@ -1,13 +1,10 @@
 """Critique Trend — self-assessment scores across sessions."""
-import json
-from pathlib import Path
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich import box
-from .core import clr
+from .core import clr, read_cached, HOME, as_of
+from .eventlog import event_epoch
 
-SELF_CRITIQUE = Path.home() / ".mirrordna/self_critique.jsonl"
+SELF_CRITIQUE = HOME / ".mirrordna/self_critique.jsonl"
+
+PROFILE_KEYS = ()
 
 def _sc(s):
     if s is None: return "grey30"
@@ -19,38 +16,50 @@ def _ch(s):
     if s is None: return "?"
     return "▁▂▃▄▅▆▇█"[min(int(s)-1, 7)] if s else "▁"
 
-def render(profile):
+def collect(profile):
+    """The last 20 self-scores, the all-time average and the latest entry."""
+    if not SELF_CRITIQUE.exists():
+        return None
+    entries = read_cached(SELF_CRITIQUE, default=[])
+    at = as_of()
+    if at is not None:   # entries without a time can't be placed, so they stay
+        entries = [e for e in entries if not isinstance(e, dict) or event_epoch(e) <= at]
+    if not entries:
+        return {"entries": 0}
+    scores = [e.get("score") for e in entries]
+    return {
+        "entries": len(entries),
+        "scores":  scores[-20:],
+        "avg":     sum(s for s in scores if s) / max(len([s for s in scores if s]), 1),
+        "last":    entries[-1],
+    }
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     color = clr(profile.get("color", "deep_sky_blue1"))
 
-    if not SELF_CRITIQUE.exists():
+    if data is None:
         return Panel(Text("  No self-critique entries yet.", style="grey50"),
                      title=f"[{color}]CRITIQUE TREND[/{color}]",
                      border_style="grey30", box=box.SIMPLE_HEAD)
 
-    entries = []
-    with open(SELF_CRITIQUE) as f:
-        for line in f:
-            try:
-                entries.append(json.loads(line.strip()))
-            except Exception:
-                pass
-
-    if not entries:
+    if not data["entries"]:
         return Panel(Text("  No entries.", style="grey50"),
                      title=f"[{color}]CRITIQUE TREND[/{color}]",
                      border_style="grey30", box=box.SIMPLE_HEAD)
 
-    scores = [e.get("score") for e in entries]
+    scores, avg, last = data["scores"], data["avg"], data["last"]
     latest = scores[-1]
-    avg = sum(s for s in scores if s) / max(len([s for s in scores if s]), 1)
-    last = entries[-1]
     recurring = last.get("recurring", [])
 
     t = Text()
 
     # Sparkline
     t.append("  SCORE HISTORY  ", style="grey50")
-    for s in scores[-20:]:
+    for s in scores:
         t.append(_ch(s), style=_sc(s))
     t.append(f"  {latest}/10 ", style=f"bold {_sc(latest)}")
     t.append(f"avg {avg:.1f}\n\n", style="grey50")
@@ -1,30 +1,27 @@
 """Decisions module — recent decisions log."""
 from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr, DASH_DIR
+from .core import clr, DASH_DIR, parse_list, read_cached
 
 DECISIONS_FILE = DASH_DIR / "decisions.md"
 
+PROFILE_KEYS = ()
+
 
 def _read_decisions():
-    if not DECISIONS_FILE.exists():
-        return []
-    lines = DECISIONS_FILE.read_text().splitlines()
-    items = []
-    for line in lines:
-        s = line.strip()
-        if not s or s.startswith("#"):
-            continue
-        # Format: "YYYY-MM-DD: Decision text" or "- Decision text"
-        items.append(s.lstrip("- ").strip())
-    return items
-
-
-def render(profile):
+    # Format: "YYYY-MM-DD: Decision text" or "- Decision text"
+    return read_cached(DECISIONS_FILE, parse_list, [])
+
+
+def collect(profile):
+    return {"decisions": _read_decisions()}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     color = clr(profile.get("color"))
-    decisions = _read_decisions()
+    decisions = data["decisions"]
 
     t = Text()
     if decisions:
@@ -1,9 +1,8 @@
 """Energy module — time-of-day capacity + session timer."""
 from datetime import datetime
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr, _bar
+from .core import clr, _bar, clock
+
+PROFILE_KEYS = ()
 
 # Energy curve by hour (0-23), 0-10 scale
 _CURVE = [2,1,1,1,2,3,5,7,9,10,9,8,6,5,6,7,8,9,7,5,4,3,2,2]
@@ -26,15 +25,22 @@ def _label(hour):
     return "ACTIVE", "white"
 
 
-def render(profile):
+def collect(profile):
+    now = datetime.fromtimestamp(clock())
+    return {"time": now.strftime("%H:%M"), "hour": now.hour, "level": _CURVE[now.hour],
+            "label": _label(now.hour)[0]}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     color = clr(profile.get("color"))
-    now = datetime.now()
-    hour = now.hour
-    level = _CURVE[hour]
+    hour, level = data["hour"], data["level"]
     lbl, lbl_color = _label(hour)
 
     t = Text()
-    t.append(f"  {now.strftime('%H:%M')}  ", style="white")
+    t.append(f"  {data['time']}  ", style="white")
     t.append(f"{lbl}\n\n", style=f"bold {lbl_color}")
     t.append("  CAPACITY  ", style="grey50")
     t.append(_bar(level, 10, width=20, color=lbl_color))
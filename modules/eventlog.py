@@ -0,0 +1,561 @@
+"""Shared readers for the append-only bus and health logs.
+
+LineTail/JsonlTail follow a file across ticks by byte offset, so each refresh
+only decodes lines appended since the last one. read_backward walks a file from
+the end in fixed-size chunks for "most recent N" style queries.
+
+A log may also have rotated siblings — cc_events.jsonl.1, cc_events.jsonl.2.gz,
+cc_events.jsonl.3.zst, higher numbers older — written by compact(). segments()
+lists them oldest first, and iter_lines()/iter_events() read the whole chain as
+one stream, skipping segments the manifest shows to be outside a time window.
+
+Given `until`, the chain readers stop at that instant instead of at the end:
+offset_at() bisects a plain file for the first line stamped after it, so
+reading "the hour before T" touches that hour and not the days around it.
+"""
+import gzip
+import io
+import json
+import os
+import re
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+CHUNK = 64 * 1024       # backward-read step
+BLOCK = 4 * 1024 * 1024  # forward-read step — bounds memory on cold start
+
+_EPOCH_RE = re.compile(rb'"epoch"\s*:\s*([0-9]+(?:\.[0-9]+)?)')
+
+_offsets = {}   # (path, ino, size, t, left) -> offset_at result
+
+
+class LineTail:
+    """Incremental reader for one append-only line-oriented file.
+
+    read_raw() returns lines appended since the previous call. A partial last
+    line (writer mid-append) is left for the next call. If the file shrinks
+    or is replaced, the next read starts over from 0 and sets `reset` so
+    callers can drop state derived from the old contents; callers clear it.
+
+    `match` is an optional tuple of byte substrings, or a compiled bytes
+    pattern: only lines containing a match are returned, and the rest are
+    never split out or decoded.
+
+    With `history=True`, a read that starts over first replays the file's
+    rotated segments, so state rebuilt after a rotation still covers them.
+    """
+
+    def __init__(self, path, match=None, history=False):
+        self.path    = path
+        self.match, self._rx = _matcher(match)
+        self.history = history
+        self.offset  = 0
+        self.ino     = None
+        self.reset   = True
+        self._replay = history
+
+    def resume(self, ino, offset):
+        """Continue from a saved (ino, offset) cursor instead of the start.
+
+        The next check() still starts over if the file is no longer that one.
+        """
+        self.ino, self.offset = ino, offset
+        self.reset = self._replay = False
+
+    def check(self):
+        """stat() the file, resetting the offset if it shrank or was replaced."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            if self.ino is not None:
+                self.offset, self.ino, self.reset = 0, None, True
+                self._replay = self.history
+            return None
+        if st.st_ino != self.ino or st.st_size < self.offset:
+            self.offset, self.ino, self.reset = 0, st.st_ino, True
+            self._replay = self.history
+        return st
+
+    def seek_end(self):
+        """Skip to just past the last complete line; returns that offset."""
+        st = self.check()
+        self._replay = False
+        if st is None:
+            return 0
+        with open(self.path, "rb") as f:
+            self.offset = _last_newline(f, st.st_size)
+        return self.offset
+
+    def iter_raw(self):
+        """Yield new complete lines as raw bytes, BLOCK bytes at a time."""
+        st = self.check()
+        if self._replay:
+            self._replay = False
+            for seg in segments(self.path)[:-1]:
+                yield from _iter_segment(seg, self.match, self._rx)
+        if st is None or st.st_size <= self.offset:
+            return
+        size = st.st_size
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            carry = b""
+            while self.offset + len(carry) < size:
+                buf = carry + f.read(min(BLOCK, size - self.offset - len(carry)))
+                end = buf.rfind(b"\n") + 1
+                if not end:
+                    if len(buf) == len(carry):
+                        return  # short read — file changed under us
+                    carry = buf
+                    continue
+                carry = buf[end:]
+                self.offset += end
+                if self.match:
+                    yield from grep_lines(buf[:end], self.match, self._rx)
+                else:
+                    yield from buf[:end].splitlines()
+
+    def read_raw(self):
+        """New complete lines as raw bytes (without the trailing newline)."""
+        return list(self.iter_raw())
+
+
+class JsonlTail(LineTail):
+    """LineTail that decodes each new line as a JSON event."""
+
+    def read(self):
+        """Yield events appended since the last call; bad lines are skipped."""
+        return _decode(self.iter_raw())
+
+
+def _decode(raws):
+    loads = json.loads
+    for raw in raws:
+        try:
+            yield loads(raw)
+        except ValueError:
+            pass
+
+
+def _needle_re(needles):
+    return re.compile(b"|".join(re.escape(nd) for nd in needles))
+
+
+def _matcher(match):
+    """(match, rx) for a tuple of byte needles or a compiled bytes pattern."""
+    if not match:
+        return None, None
+    if isinstance(match, re.Pattern):
+        return match, match
+    match = tuple(match)
+    return match, _needle_re(match)
+
+
+def grep_lines(buf, needles, rx=None):
+    """Lines of a newline-terminated buffer that contain any of `needles`.
+
+    When matches are sparse, needles are located with bytes.find and only the
+    enclosing lines are sliced out, so most of the buffer is never split.
+    Dense matches fall back to a split-and-test pass, which is cheaper there.
+    A compiled pattern is searched for line by line from each hit onward.
+    """
+    if isinstance(needles, re.Pattern):
+        lines, i = [], 0
+        while m := needles.search(buf, i):
+            s = buf.rfind(b"\n", 0, m.start()) + 1
+            i = buf.find(b"\n", m.start()) + 1
+            lines.append(buf[s:i - 1])
+        return lines
+    hits = sum(buf.count(nd) for nd in needles)
+    if not hits:
+        return []
+    if hits * 8 > buf.count(b"\n"):
+        rx = rx or _needle_re(needles)
+        return list(filter(rx.search, buf.splitlines()))
+    starts = set()
+    for nd in needles:
+        i = buf.find(nd)
+        while i >= 0:
+            s = buf.rfind(b"\n", 0, i) + 1
+            e = buf.find(b"\n", i)
+            starts.add(s)
+            i = buf.find(nd, e)
+    return [buf[s:buf.find(b"\n", s)] for s in sorted(starts)]
+
+
+def event_epoch(ev, default=0.0):
+    """Event time as epoch seconds — `epoch` if present, else ISO `ts`."""
+    epoch = ev.get("epoch")
+    if epoch:
+        return epoch
+    ts = ev.get("ts")
+    if ts:
+        try:
+            return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+        except (ValueError, AttributeError):
+            pass
+    return default
+
+
+def _line_epoch(raw):
+    """Epoch of a raw line, or None if it has no time."""
+    m = _EPOCH_RE.search(raw)
+    if m:
+        return float(m.group(1))
+    try:
+        ev = json.loads(raw)
+    except ValueError:
+        return None
+    return event_epoch(ev, None) if isinstance(ev, dict) else None
+
+
+def _after(epoch, t, left):
+    return epoch >= t if left else epoch > t
+
+
+def _next_timed(f, pos, size):
+    """Epoch of the first timed line starting at or after `pos`, or None."""
+    f.seek(pos - 1 if pos else 0)
+    if pos:
+        f.readline()   # finish the line `pos` falls in
+    while f.tell() < size:
+        epoch = _line_epoch(f.readline())
+        if epoch is not None:
+            return epoch
+    return None
+
+
+def offset_at(path, t, left=False):
+    """Offset of the first line stamped after `t` (at or after, with `left`).
+
+    Bisects the file, so it reads a few lines per halving rather than the file.
+    Lines are taken to be in time order; untimed lines go with the timed line
+    after them and are kept when none follows. Results are memoized while the
+    file is unchanged.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return 0
+    key = (str(path), st.st_ino, st.st_size, t, left)
+    hit = _offsets.get(key)
+    if hit is not None:
+        return hit
+    with open(path, "rb") as f:
+        size = _last_newline(f, st.st_size)
+        lo, hi = 0, size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            epoch = _next_timed(f, mid, size)
+            if epoch is not None and _after(epoch, t, left):
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo and lo < size:
+            f.seek(lo - 1)
+            f.readline()
+            lo = f.tell()
+    if len(_offsets) > 1024:
+        _offsets.clear()
+    _offsets[key] = lo
+    return lo
+
+
+def _last_newline(f, size):
+    """Offset just past the last b'\\n' before `size` (0 if there is none)."""
+    pos = size
+    while pos > 0:
+        step = min(CHUNK, pos)
+        pos -= step
+        f.seek(pos)
+        i = f.read(step).rfind(b"\n")
+        if i >= 0:
+            return pos + i + 1
+    return 0
+
+
+def read_backward(path, end=None, chunk=CHUNK):
+    """Yield complete raw lines from `end` (default EOF) back to the start.
+
+    Reads `chunk` bytes at a time, so stopping early costs only the chunks
+    actually touched.
+    """
+    with open(path, "rb") as f:
+        if end is None:
+            end = f.seek(0, os.SEEK_END)
+        pos = _last_newline(f, end)
+        tail = b""
+        while pos > 0:
+            step = min(chunk, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + tail
+            lines = buf.split(b"\n")
+            # lines[0] may be cut mid-line unless we've reached the start
+            tail = lines[0] if pos > 0 else b""
+            for line in reversed(lines[1:] if pos > 0 else lines):
+                if line:
+                    yield line
+        if tail:
+            yield tail
+
+
+# ── Rotated segments ─────────────────────────────────────────────────────────
+
+def _rotated(path):
+    """[(n, Path, codec suffix)] for rotated siblings of `path`, newest first."""
+    path = Path(path)
+    rx = re.compile(rf"^{re.escape(path.name)}\.(\d+)(\.gz|\.zst)?$")
+    try:
+        names = os.listdir(path.parent)
+    except OSError:
+        return []
+    found = []
+    for name in names:
+        m = rx.match(name)
+        if m:
+            found.append((int(m.group(1)), path.parent / name, m.group(2) or ""))
+    return sorted(found)
+
+
+def has_log(path):
+    """True if the live file or any rotated segment of it exists."""
+    return os.path.exists(path) or bool(_rotated(path))
+
+
+def manifest_path(path):
+    return Path(f"{path}.manifest.json")
+
+
+def read_manifest(path):
+    """Segment name -> {first, last, lines, bytes}; empty if there is none."""
+    try:
+        return json.loads(manifest_path(path).read_text()).get("segments", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def segments(path, since=None, until=None):
+    """Segment paths for `path`, oldest first, ending with the live file.
+
+    With `since`, rotated segments whose manifest range ends before it are
+    left out, and with `until`, those that start after it. Segments missing
+    from the manifest are always kept.
+    """
+    man = read_manifest(path) if since is not None or until is not None else {}
+    out = []
+    for _, seg, _ in reversed(_rotated(path)):
+        info = man.get(seg.name)
+        if info and since is not None and info.get("last") and info["last"] < since:
+            continue
+        if info and until is not None and info.get("first") and info["first"] > until:
+            continue
+        out.append(seg)
+    out.append(Path(path))
+    return out
+
+
+def open_segment(path):
+    """Binary stream over a segment, decompressing .gz/.zst as it reads."""
+    path = str(path)
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        import zstandard   # optional — only needed once .zst segments exist
+        fh = open(path, "rb")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(fh, closefd=True))
+    return open(path, "rb")
+
+
+def _iter_segment(path, match=None, rx=None, start=0, stop=None):
+    """Complete raw lines of one segment, BLOCK bytes at a time.
+
+    A trailing line without a newline is only returned for rotated segments;
+    on the live file it is a writer mid-append. `start` and `stop` are line
+    offsets bounding a plain file.
+    """
+    try:
+        f = open_segment(path)
+    except (OSError, ImportError):
+        return
+    with f:
+        if start:
+            f.seek(start)
+        left = None if stop is None else stop - start
+        carry = b""
+        while True:
+            block = f.read(BLOCK if left is None else max(min(BLOCK, left), 0))
+            if not block:
+                break
+            if left is not None:
+                left -= len(block)
+            buf = carry + block
+            end = buf.rfind(b"\n") + 1
+            carry = buf[end:]
+            if end:
+                if match:
+                    yield from grep_lines(buf[:end], match, rx)
+                else:
+                    yield from buf[:end].splitlines()
+    rotated = re.search(r"\.\d+(\.gz|\.zst)?$", str(path))
+    if carry and rotated and (not match or (rx or _matcher(match)[1]).search(carry)):
+        yield carry
+
+
+def _compressed(seg):
+    return str(seg).endswith((".gz", ".zst"))
+
+
+def _until(raws, until):
+    """Lines stamped at or before `until`; untimed ones are kept."""
+    for raw in raws:
+        epoch = _line_epoch(raw)
+        if epoch is None or epoch <= until:
+            yield raw
+
+
+def iter_lines(path, since=None, match=None, until=None):
+    """Raw lines across every segment of `path`, oldest first.
+
+    With `until` the stream ends there, and plain files are entered at
+    `since` by bisection instead of read from the top.
+    """
+    match, rx = _matcher(match)
+    for seg in segments(path, since, until):
+        if until is None:
+            yield from _iter_segment(seg, match, rx)
+        elif _compressed(seg):
+            yield from _until(_iter_segment(seg, match, rx), until)
+        else:
+            start = offset_at(seg, since, left=True) if since is not None else 0
+            yield from _iter_segment(seg, match, rx, start, offset_at(seg, until))
+
+
+def iter_events(path, since=None, match=None, until=None):
+    """Decoded events across every segment of `path`, oldest first.
+
+    `since` only skips whole segments (or seeks, with `until`); callers
+    still filter by event time.
+    """
+    return _decode(iter_lines(path, since, match, until))
+
+
+def iter_backward(path, end=None, until=None):
+    """Raw lines newest first across the live file and its rotated segments.
+
+    `end` bounds the live file, as in read_backward; `until` starts every
+    segment at that instant instead.
+    """
+    if os.path.exists(path):
+        if until is not None:
+            end = offset_at(path, until)
+        yield from read_backward(path, end)
+    for seg in reversed(segments(path, until=until)[:-1]):
+        if _compressed(seg):
+            lines = _iter_segment(seg)
+            yield from reversed(list(lines if until is None else _until(lines, until)))
+        else:
+            yield from read_backward(seg, offset_at(seg, until) if until is not None else None)
+
+
+def last_events(path, n, keep=None, until=None):
+    """The newest `n` decoded events (oldest first), optionally filtered by `keep`."""
+    out = []
+    if n <= 0:
+        return out
+    for raw in iter_backward(path, until=until):
+        if not raw.strip():
+            continue
+        try:
+            ev = json.loads(raw)
+        except ValueError:
+            continue
+        if keep is None or keep(ev):
+            out.append(ev)
+            if len(out) >= n:
+                break
+    out.reverse()
+    return out
+
+
+# ── Compaction ───────────────────────────────────────────────────────────────
+
+def _zstd():
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def _segment_info(path):
+    first = last = None
+    lines = 0
+    for raw in _iter_segment(path):
+        lines += 1
+        m = _EPOCH_RE.search(raw)
+        if m:
+            e = float(m.group(1))
+            first = e if first is None or e < first else first
+            last = e if last is None or e > last else last
+    return {"first": first, "last": last, "lines": lines,
+            "bytes": os.path.getsize(path)}
+
+
+def _compress(src, codec):
+    dst = Path(f"{src}.{codec}")
+    tmp = Path(f"{dst}.tmp")
+    with open(src, "rb") as fi:
+        if codec == "zst":
+            with open(tmp, "wb") as raw, _zstd().ZstdCompressor(level=10).stream_writer(raw) as fo:
+                shutil.copyfileobj(fi, fo, BLOCK)
+        else:
+            with gzip.open(tmp, "wb", compresslevel=6) as fo:
+                shutil.copyfileobj(fi, fo, BLOCK)
+    os.replace(tmp, dst)
+    os.unlink(src)
+    return dst
+
+
+def compact(path, min_bytes=0, codec=None):
+    """Rotate `path` to `.1` and compress every older plain segment.
+
+    Existing segments shift up by one (.1 -> .2, .2.gz -> .3.gz, ...). `.1`
+    stays uncompressed so tail readers that were mid-file can still finish
+    it. The manifest records each segment's epoch range and line count so
+    windowed reads can skip whole segments. Returns a list of actions taken.
+    """
+    path = Path(path)
+    codec = codec or ("zst" if _zstd() else "gz")
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return []
+    if not size or size < min_bytes:
+        return []
+
+    man = read_manifest(path)
+    for n, seg, suffix in reversed(_rotated(path)):
+        dst = path.parent / f"{path.name}.{n + 1}{suffix}"
+        os.replace(seg, dst)
+        if seg.name in man:
+            man[dst.name] = man.pop(seg.name)
+    rotated = path.parent / f"{path.name}.1"
+    os.replace(path, rotated)
+    man[rotated.name] = _segment_info(rotated)
+    actions = [f"rotated {path.name} -> {rotated.name} ({size // 1024}KB)"]
+
+    for n, seg, suffix in _rotated(path):
+        if n >= 2 and not suffix:
+            info = man.pop(seg.name, None) or _segment_info(seg)
+            dst = _compress(seg, codec)
+            info["bytes"] = dst.stat().st_size
+            man[dst.name] = info
+            actions.append(f"compressed {seg.name} -> {dst.name}")
+
+    live = {seg.name for _, seg, _ in _rotated(path)}
+    man = {k: v for k, v in sorted(man.items()) if k in live}
+    tmp = Path(f"{manifest_path(path)}.tmp")
+    tmp.write_text(json.dumps({"segments": man}, indent=1))
+    os.replace(tmp, manifest_path(path))
+    return actions
@@ -0,0 +1,110 @@
+"""Prometheus/OpenMetrics exporter — /metrics from the last collected data.
+
+    python3 mirrordash.py -p glass --export-port 9464
+
+A module opts in with a metrics(data) function next to collect(); it turns the
+data collect() returned into metric families:
+
+    def metrics(data):
+        return [("mirrordash_widgets", "Widgets seen in the last hour",
+                 [({"kind": "blue"}, data["blue"]), ({"kind": "red"}, data["red"])])]
+
+Every value is exported as a gauge. The dashboard calls update() once per
+refresh with the tick it just collected, and the exposition text is built
+then. A scrape only copies that text out, so it never runs a collector or
+touches a log, however often it comes. The first module to report a metric
+name wins, so modules sharing an engine (risk_score and behavioral_metrics)
+can both report it.
+"""
+import http.server
+import math
+import threading
+import time
+
+from . import collector
+
+HOST = "127.0.0.1"   # local only; put a proxy in front to scrape remotely
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _sample(name, labels, value):
+    if labels:
+        inner = ",".join(f'{k}="{_escape(v)}"' for k, v in sorted(labels.items()))
+        name = f"{name}{{{inner}}}"
+    return f"{name} {float(value)!r}"
+
+
+def exposition(families):
+    """Text exposition format for {name: (help, [(labels, value), ...])}."""
+    lines = []
+    for name, (help_, samples) in families.items():
+        samples = [(l, v) for l, v in samples
+                   if isinstance(v, (int, float)) and not math.isnan(v)]
+        if not samples:
+            continue
+        lines.append(f"# HELP {name} {_escape(help_)}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.extend(_sample(name, labels, value) for labels, value in samples)
+    return "\n".join(lines) + "\n"
+
+
+class Exporter:
+    """Holds the latest exposition and serves it over HTTP."""
+
+    def __init__(self):
+        self.lock   = threading.Lock()
+        self.body   = b""
+        self.server = None
+
+    def update(self, tick, names, profile):
+        """Rebuild the exposition from a collected tick."""
+        families = {}
+        errors   = 0
+        for name in dict.fromkeys(names):
+            mod = collector.load(name)
+            if mod is None or not collector.is_split(mod) or not hasattr(mod, "metrics"):
+                continue
+            try:
+                found = mod.metrics(tick.collect(name, mod, profile))
+            except Exception:
+                errors += 1
+                continue
+            for metric, help_, samples in found:
+                families.setdefault(metric, (help_, samples))
+        families["mirrordash_collect_errors"] = (
+            "Modules whose collect or metrics failed in the last refresh", [({}, errors)])
+        families["mirrordash_last_refresh_timestamp_seconds"] = (
+            "When the exported data was collected", [({}, time.time())])
+        body = exposition(families).encode()
+        with self.lock:
+            self.body = body
+
+    def start(self, port, host=HOST):
+        """Serve /metrics from a daemon thread; returns self."""
+        exporter = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                with exporter.lock:
+                    body = exporter.body
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass   # the terminal belongs to the dashboard
+
+        self.server = http.server.ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="exporter",
+                         daemon=True).start()
+        return self
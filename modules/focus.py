@@ -1,13 +1,20 @@
 """Focus module — current task, big and unmissable."""
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
 from .core import read_tasks, clr
 
+PROFILE_KEYS = ()
 
-def render(profile):
-    color = clr(profile.get("color"))
+
+def collect(profile):
     current, queue, done = read_tasks()
+    return {"current": current, "queue": queue, "done": done}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color"))
+    current, queue, done = data["current"], data["queue"], data["done"]
 
     t = Text()
     if current:
@@ -1,14 +1,12 @@
 """Gate Activity — live hook decisions: what was allowed, warned, blocked and why."""
 import json
-import time
-from pathlib import Path
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich import box
-from .core import clr
+from .core import clr, HOME, as_of, clock
+from .eventlog import iter_backward, iter_events, has_log
+from . import store
 
-HOOK_DECISIONS = Path.home() / ".mirrordna/bus/hook_decisions.jsonl"
+HOOK_DECISIONS = HOME / ".mirrordna/bus/hook_decisions.jsonl"
+
+PROFILE_KEYS = ("store",)
 
 DECISION_STYLE = {
     "allow": ("·", "grey42"),
@@ -19,33 +17,74 @@ DECISION_STYLE = {
 }
 
 
-def render(profile):
-    color = clr(profile.get("color", "deep_sky_blue1"))
-
-    if not HOOK_DECISIONS.exists():
-        return Panel(Text("  No hook decisions logged yet.", style="grey50"),
-                     title=f"[{color}]GATE ACTIVITY[/{color}]",
-                     border_style="grey30", box=box.SIMPLE_HEAD)
-
-    now = time.time()
+def _recent(cutoff, n):
+    """Newest `n` decisions since `cutoff`, read backward from the end."""
+    out = []
+    for raw in iter_backward(HOOK_DECISIONS, until=as_of()):
+        try:
+            ev = json.loads(raw)
+        except ValueError:
+            continue
+        if ev.get("epoch", 0) < cutoff:
+            break
+        out.append(ev)
+        if len(out) >= n:
+            break
+    out.reverse()
+    return out
+
+
+def collect(profile):
+    """Decision counts over 24h, overall and per hook, and the newest of the last hour."""
+    if not has_log(HOOK_DECISIONS):
+        return None
+
+    now = clock()
     counts = {"allow": 0, "warn": 0, "block": 0, "deny": 0, "pass": 0}
+    hooks  = {}   # hook -> decision -> count
     recent = []
 
-    with open(HOOK_DECISIONS) as f:
-        all_lines = f.readlines()
-
-    for raw in all_lines:
-        try:
-            ev = json.loads(raw)
+    if store.enabled(profile, now - 86400):
+        for (hook, d), n in store.gate_counts(now - 86400).items():
+            counts[d] = counts.get(d, 0) + n
+            by = hooks.setdefault(hook, {})
+            by[d] = by.get(d, 0) + n
+        recent = _recent(now - 3600, 14)
+    else:
+        for ev in iter_events(HOOK_DECISIONS, since=now - 86400, until=as_of()):
             d = ev.get("decision", "allow")
             if ev.get("epoch", 0) >= now - 86400:
                 counts[d] = counts.get(d, 0) + 1
+                by = hooks.setdefault(ev.get("hook", ""), {})
+                by[d] = by.get(d, 0) + 1
             if ev.get("epoch", 0) >= now - 3600:
                 recent.append(ev)
-        except Exception:
-            pass
+        recent = recent[-14:]
+
+    return {"counts": counts, "hooks": hooks, "recent": recent}
+
+
+def metrics(data):
+    if data is None:
+        return []
+    return [("mirrordash_gate_decisions", "Gate decisions in the last 24h by hook and decision",
+             [({"hook": hook, "decision": d}, n)
+              for hook, by in sorted(data["hooks"].items()) for d, n in sorted(by.items())])]
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color", "deep_sky_blue1"))
+
+    if data is None:
+        return Panel(Text("  No hook decisions logged yet.", style="grey50"),
+                     title=f"[{color}]GATE ACTIVITY[/{color}]",
+                     border_style="grey30", box=box.SIMPLE_HEAD)
 
-    recent = recent[-14:]
+    now, counts, recent = clock(), data["counts"], data["recent"]
     total = sum(counts.values())
     blocked = counts.get("deny", 0) + counts.get("block", 0)
     warned = counts.get("warn", 0)
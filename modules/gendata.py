@@ -0,0 +1,279 @@
+"""Synthetic data for every mirrordash source, for scale and load testing.
+
+    python3 mirrordash.py gen-data --scale 7 --home /tmp/dash --seed 1
+    MIRRORDASH_HOME=/tmp/dash python3 mirrordash.py -p glass
+
+`scale` is days of history and the number of git repos under repos/. A day
+is about six agent sessions of a few hundred tool calls each, with
+gate decisions from every hook rule_compliance knows and a self-critique at
+the end of each session. The newest session is still running at `end`
+(default now), so live panels have something to show.
+
+Everything is drawn from one seeded generator and stamped relative to
+`end`, so the same seed, scale and end produce identical files and commits.
+"""
+import json
+import os
+import random
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .rule_compliance import HOOK_TO_RULES
+
+DAY              = 86400
+SESSION_MINUTES  = (20, 150)
+GAP_MINUTES      = (40, 240)   # idle time between sessions, longer than summaries.IDLE
+CALL_SECONDS     = 8.0         # mean time between tool calls
+GATE_EVERY       = 12          # tool calls per gate decision, on average
+COMMITS_PER_DAY  = (0, 6)      # per repo
+
+TOOLS = {   # tool -> weight in a typical session
+    "Read": 30, "Grep": 8, "Glob": 5, "Edit": 15, "Write": 6, "Bash": 20,
+    "WebFetch": 3, "WebSearch": 2, "Task": 2, "TaskOutput": 1,
+    "mcp__github__create_issue": 1, "mcp__github__get_pull_request": 2,
+    "mcp__filesystem__read_file": 2, "mcp__slack__post_message": 1,
+    "mcp__mobile__screenshot": 1,
+}
+DECISIONS = {"allow": 70, "warn": 18, "deny": 8, "block": 4}
+
+COMMANDS = ["pytest -q", "git status", "git diff --stat", "ls -la", "make build",
+            "python3 -m compileall -q .", "npm test", "docker ps"]
+CURLS    = ["curl -s https://api.openai.com/v1/models",
+            "curl -s https://api.groq.com/openai/v1/chat/completions -d @req.json",
+            "curl -s https://api.anthropic.com/v1/messages -d @req.json",
+            "curl -s https://generativelanguage.googleapis.com/v1beta/models",
+            "curl -s http://localhost:11434/api/tags   # ollama",
+            "curl -sI https://github.com/",
+            "curl -s https://pypi.org/pypi/rich/json"]
+URLS     = ["https://docs.python.org/3/library/sqlite3.html",
+            "https://github.com/Textualize/rich/issues",
+            "https://prometheus.io/docs/instrumenting/exposition_formats/",
+            "https://developer.mozilla.org/en-US/docs/Web/API/EventSource",
+            "https://www.sqlite.org/wal.html", "https://peps.python.org/pep-0008/"]
+QUERIES  = ["python bisect jsonl by timestamp", "sqlite wal checkpoint", "rich live screen flicker",
+            "server-sent events reconnect", "zstandard streaming python"]
+FILES    = ["src/app.py", "src/config.py", "src/store.py", "tests/test_app.py",
+            "README.md", "pyproject.toml", "docs/design.md"]
+PATTERNS = ["Edited a file without reading it first",
+            "Claimed done without running the tests",
+            "Rebuilt a helper that already existed",
+            "Explored instead of executing the plan",
+            "Stated an API detail from memory",
+            "Skipped the publish gate",
+            "Apologised instead of fixing",
+            "Ran a side-effectful command to test a theory",
+            "Changed more files than the task needed",
+            "Ignored a failing check"]
+WORDS    = ["cache", "exporter", "replay", "summaries", "rollup", "gate", "dashboard",
+            "collector", "profile", "session", "metrics", "vault", "sidecar", "index"]
+PEOPLE   = ["ana", "bo", "chen", "dara", "eli", "farah", "gus", "hana"]
+
+
+def _iso(epoch):
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _line(rec):
+    return json.dumps(rec, separators=(", ", ": ")) + "\n"
+
+
+def _pick(rng, weights):
+    return rng.choices(list(weights), list(weights.values()))[0]
+
+
+def _phrase(rng, n=3):
+    return " ".join(rng.sample(WORDS, n))
+
+
+def _sessions(rng, start, end):
+    """[(session_id, first, last)] from `start` to `end`, the last one still running."""
+    out = []
+    t = end
+    while t > start:
+        length = rng.uniform(*SESSION_MINUTES) * 60
+        first = max(start, t - length)
+        out.append((f"{rng.getrandbits(64):016x}", first, t))
+        t = first - rng.uniform(*GAP_MINUTES) * 60
+    out.reverse()
+    return out
+
+
+def _target(rng, tool, home, repo):
+    if tool in ("Read", "Edit", "Write"):
+        where = rng.random()
+        if where < 0.6:
+            return str(home / "repos" / repo / rng.choice(FILES))
+        if where < 0.8:
+            return str(home / "MirrorDNA-Vault" / rng.choice(["Projects", "Notes", "Daily"])
+                       / f"{rng.choice(WORDS)}.md")
+        if where < 0.95:
+            return str(home / ".mirrordna" / rng.choice(["CONTINUITY.md", "FACTS.md", "MISTAKES.md"]))
+        return f"/tmp/{rng.choice(WORDS)}-{rng.randrange(100)}.log"
+    if tool in ("Grep", "Glob"):
+        return rng.choice(["**/*.py", "def collect", "TODO", "*.md", "import rich"])
+    if tool == "Bash":
+        return rng.choice(CURLS) if rng.random() < 0.15 else rng.choice(COMMANDS)
+    if tool == "WebFetch":
+        return rng.choice(URLS)
+    if tool == "WebSearch":
+        return rng.choice(QUERIES)
+    if tool in ("Task", "TaskOutput"):
+        return f"Investigate {_phrase(rng, 2)}"
+    return _phrase(rng)
+
+
+def _logs(rng, home, sessions, repos):
+    """cc_events, hook_decisions and self_critique lines, each in time order."""
+    hooks = list(HOOK_TO_RULES)
+    events, gates, critiques = [], [], []
+    for n, (sid, first, last) in enumerate(sessions):
+        # Each session leans its own way, so integrity and drift have signal
+        mix = dict(TOOLS)
+        for tool in ("Edit", "Write"):
+            mix[tool] *= rng.uniform(0.4, 2.5)
+        repo = rng.choice(repos)
+        t = first
+        while t <= last:
+            tool = _pick(rng, mix)
+            target = _target(rng, tool, home, repo)
+            events.append((t, _line({"ts": _iso(t), "epoch": round(t, 3), "session_id": sid,
+                                     "tool": tool, "type": "tool_use", "target": target})))
+            if rng.random() < 1 / GATE_EVERY:
+                # The first gates go round every hook, so each one shows up
+                hook = hooks[len(gates) % len(hooks)] if len(gates) < len(hooks) else rng.choice(hooks)
+                decision = _pick(rng, DECISIONS)
+                gates.append((t, _line({"ts": _iso(t), "epoch": round(t + 0.001, 3), "hook": hook,
+                                        "decision": decision, "session_id": sid, "tool": tool,
+                                        "reason": f"{hook.replace('_', ' ')}: {decision} {tool}"})))
+            t += rng.expovariate(1 / CALL_SECONDS)
+        if n == len(sessions) - 1:
+            break   # still running: no critique yet
+        at = last + rng.uniform(30, 300)
+        recurring = sorted({PATTERNS[min(int(rng.paretovariate(1.2)) - 1, len(PATTERNS) - 1)]
+                            for _ in range(rng.randrange(4))})
+        mistakes = recurring + [f"Missed {_phrase(rng, 2)}" for _ in range(rng.randrange(3))]
+        critiques.append((at, _line({"ts": _iso(at), "epoch": round(at, 3), "session_id": sid,
+                                     "score": max(1, min(10, round(rng.gauss(6.5, 1.8)))),
+                                     "mistakes": mistakes, "recurring": recurring})))
+    return events, gates, critiques
+
+
+def _write_log(path, lines):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        f.writelines(line for _, line in sorted(lines, key=lambda x: x[0]))
+    return f"wrote {path} ({len(lines)} lines)"
+
+
+def _write(path, text, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return f"wrote {path}"
+
+
+def _repo(rng, path, start, end):
+    """A git repo with a few commits a day, built in one fast-import."""
+    path.mkdir(parents=True, exist_ok=True)
+    env = {**os.environ, "GIT_CONFIG_GLOBAL": os.devnull, "GIT_CONFIG_NOSYSTEM": "1"}
+    git = lambda *args, **kw: subprocess.run(["git", "-C", str(path), *args], env=env,
+                                             check=True, capture_output=True, **kw)
+    git("init", "-q")
+    git("symbolic-ref", "HEAD", "refs/heads/main")
+    stamps = sorted(rng.uniform(start, end) for _ in range(
+        sum(rng.randint(*COMMITS_PER_DAY) for _ in range(max(1, round((end - start) / DAY))))))
+    who = rng.choice(PEOPLE)
+    stream, notes = [], ""
+    for i, t in enumerate(stamps or [start]):
+        msg = f"{rng.choice(['Add', 'Fix', 'Refactor', 'Speed up', 'Document'])} {_phrase(rng, 2)}\n"
+        notes += f"- {_iso(t)} {msg}"
+        stream.append(f"commit refs/heads/main\nmark :{i + 1}\n"
+                      f"author {who} <{who}@example.com> {int(t)} +0000\n"
+                      f"committer {who} <{who}@example.com> {int(t)} +0000\n"
+                      f"data {len(msg.encode())}\n{msg}"
+                      + (f"from :{i}\n" if i else "")
+                      + f"M 644 inline NOTES.md\ndata {len(notes.encode())}\n{notes}\n")
+    git("fast-import", "--quiet", input="".join(stream).encode())
+    git("reset", "-q", "--hard")
+    return f"wrote {path} ({len(stamps)} commits)"
+
+
+def _markdown(rng, home, sessions, end):
+    """The hand-kept files: tasks, loops, blockers, decisions, pipeline, MISTAKES.md..."""
+    dash, dna = home / ".mirrordash", home / ".mirrordna"
+    tasks = ["## NOW", f"> Ship the {_phrase(rng, 2)} change", "", "## QUEUE"]
+    tasks += [f"- [ ] {rng.choice(['Fix', 'Add', 'Review', 'Profile'])} {_phrase(rng, 2)}"
+              for _ in range(rng.randint(4, 10))]
+    tasks += [f"- [x] {rng.choice(['Fixed', 'Added', 'Reviewed'])} {_phrase(rng, 2)}"
+              for _ in range(rng.randint(2, 6))]
+    stages = ["LEAD", "QUALIFIED", "PROPOSAL", "NEGOTIATION", "CLOSED"]
+    mistakes = ["# MISTAKES", ""]
+    for p in PATTERNS:
+        mistakes += [f"## {p}", f"- Rule: {rng.choice(['Read', 'Verify', 'Ask', 'Check'])} before acting",
+                     f"- Check: {_phrase(rng, 2)}", ""]
+    days = [datetime.fromtimestamp(end - d * DAY).strftime("%Y-%m-%d") for d in range(6)]
+    out = [
+        _write(dash / "tasks.md", "\n".join(tasks) + "\n"),
+        _write(dash / "loops.md", "# Open loops\n" + "".join(
+            f"- Follow up on {_phrase(rng, 2)}\n" for _ in range(rng.randint(3, 8)))),
+        _write(dash / "blockers.md", "".join(
+            f"- Waiting on {_phrase(rng, 2)}\n" for _ in range(rng.randint(0, 3)))),
+        _write(dash / "decisions.md", "".join(
+            f"{d}: Use {_phrase(rng, 2)}\n" for d in days)),
+        _write(dash / "pipeline.md", "".join(
+            f"{rng.choice(stages)}: {rng.choice(WORDS).title()} Inc (${rng.randrange(5, 200)}k)\n"
+            for _ in range(rng.randint(3, 9)))),
+        _write(dash / "metrics.yaml", "".join(f"{k}: {v}\n" for k, v in {
+            "mrr": rng.randrange(5000, 90000), "mrr_delta": rng.randrange(-2000, 8000),
+            "burn": rng.randrange(20000, 120000), "runway_months": rng.randrange(4, 30),
+            "pipeline": rng.randrange(50000, 900000), "prospects": rng.randrange(3, 40)}.items())),
+        _write(dash / "services.yaml", "".join(
+            f"- name: {name}\n  port: {port}\n" for name, port in
+            [("api", 8080), ("web", 3000), ("postgres", 5432), ("redis", 6379),
+             ("ollama", 11434), ("dash-web", 8750)])),
+        _write(dash / "presence.json", json.dumps([
+            {"name": p, "status": rng.choice(["flow", "deep", "blocked", "active", "offline"]),
+             "task": f"{rng.choice(['Fixing', 'Writing', 'Reviewing'])} {_phrase(rng, 2)}"}
+            for p in PEOPLE[:rng.randint(3, len(PEOPLE))]], indent=1) + "\n"),
+        _write(dna / "MISTAKES.md", "\n".join(mistakes), end - rng.uniform(0, DAY)),
+    ]
+    for name in ("CONTINUITY.md", "CC_MEMORY.md", "SHIPLOG.md", "FACTS.md", "INFRASTRUCTURE.md"):
+        out.append(_write(dna / name, f"# {name[:-3]}\n\n{_phrase(rng, 6)}\n",
+                          end - rng.uniform(0, 3 * DAY)))
+    sid, first, _ = sessions[-1]
+    out.append(_write(dna / "bus/continuity/live_state.json", json.dumps(
+        {"session": sid, "started": _iso(first), "phase": "executing",
+         "focus": _phrase(rng, 2)}, indent=1) + "\n"))
+    lines, t = [], end - DAY
+    while t < end:
+        level = _pick(rng, {"INFO": 90, "WARN": 8, "ERROR": 2})
+        stamp = datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S")
+        lines.append(f"[{stamp}] {level} {rng.choice(['disk', 'bus', 'ollama', 'vault'])}: {_phrase(rng)}\n")
+        t += rng.uniform(60, 600)
+    out.append(_write(dna / "health/health.log", "".join(lines)))
+    out.append(_write(dna / "health/proactive_alerts.json", json.dumps([
+        {"level": rng.choice(["info", "warning", "error"]), "message": f"{_phrase(rng)} needs attention",
+         "ts": _iso(end - rng.uniform(0, DAY))} for _ in range(rng.randint(2, 8))], indent=1) + "\n"))
+    return out
+
+
+def generate(home, scale=1, seed=0, end=None):
+    """Write `scale` days of data and `scale` repos under `home`; returns actions taken."""
+    home = Path(home).expanduser().resolve()
+    end = time.time() if end is None else end
+    start = end - scale * DAY
+    rng = random.Random(seed)
+    repos = [f"{rng.choice(WORDS)}-{i:02d}" for i in range(scale)]
+    sessions = _sessions(rng, start, end)
+    events, gates, critiques = _logs(rng, home, sessions, repos)
+    bus = home / ".mirrordna/bus"
+    actions = [_write_log(bus / "cc_events.jsonl", events),
+               _write_log(bus / "hook_decisions.jsonl", gates),
+               _write_log(home / ".mirrordna/self_critique.jsonl", critiques)]
+    actions += _markdown(rng, home, sessions, end)
+    for name in repos:
+        actions.append(_repo(rng, home / "repos" / name, max(start, end - 14 * DAY), end))
+    return actions
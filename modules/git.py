@@ -1,15 +1,12 @@
 """Git module — recent activity, branch, status."""
 import os
 from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
 from .core import clr, _run
 
+PROFILE_KEYS = ()
 
-def render(profile):
-    color = clr(profile.get("color"))
 
+def collect(profile):
     # Use CWD or first git repo found
     cwd = Path(os.getcwd())
     branch = _run(f"git -C '{cwd}' rev-parse --abbrev-ref HEAD 2>/dev/null") or "—"
@@ -17,6 +14,17 @@ def render(profile):
     log = _run(f"git -C '{cwd}' log --oneline -5 --format='%h %s' 2>/dev/null")
 
     changed = len([l for l in status.splitlines() if l.strip()]) if status else 0
+    commits = [line.split(" ", 1) for line in log.splitlines()[:5]] if log else []
+    return {"branch": branch, "changed": changed,
+            "commits": [c for c in commits if len(c) == 2]}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color"))
+    branch, changed = data["branch"], data["changed"]
 
     t = Text()
     t.append(f"  branch  ", style="grey50")
@@ -27,13 +35,11 @@ def render(profile):
     else:
         t.append("  working tree clean\n", style="green")
 
-    if log:
+    if data["commits"]:
         t.append("\n")
-        for line in log.splitlines()[:5]:
-            parts = line.split(" ", 1)
-            if len(parts) == 2:
-                t.append(f"  {parts[0]} ", style="grey42")
-                t.append(f"{parts[1]}\n", style="grey85")
+        for sha, subject in data["commits"]:
+            t.append(f"  {sha} ", style="grey42")
+            t.append(f"{subject}\n", style="grey85")
 
     return Panel(t, title=f"[{color}]GIT[/{color}]",
                  border_style="grey30", box=box.SIMPLE_HEAD, padding=(0, 1))
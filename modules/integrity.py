@@ -0,0 +1,246 @@
+"""Integrity score engine shared by risk_score and behavioral_metrics.
+
+Signals come from incremental sources: the last WINDOW tool calls, gate blocks
+and warns in the last hour, and the last few self-critiques. They are read
+once per tick whichever panels ask, and the scored result is memoized per set
+of weights. For an instant in the past (core.as_of) the same inputs come from
+reads bounded at it instead. Deductions are configurable per profile:
+
+    integrity_weights:
+      block_each: 10
+      recurring_max: 30
+
+Weights are whole points; fractional values are rounded.
+"""
+import json
+import threading
+import time
+from collections import deque
+
+from .core import HOME, as_of, clock
+from .eventlog import JsonlTail, iter_backward, last_events
+from . import store
+
+CC_EVENTS   = HOME / ".mirrordna/bus/cc_events.jsonl"
+GATES       = HOME / ".mirrordna/bus/hook_decisions.jsonl"
+CRITIQUES   = HOME / ".mirrordna/self_critique.jsonl"
+
+READ_TOOLS  = {"Read", "Glob", "Grep"}
+WRITE_TOOLS = {"Write", "Edit"}
+
+WINDOW         = 200    # tool calls behind the read:write signal
+GATE_SPAN      = 3600   # seconds of gate decisions counted
+TTL            = 1.0    # seconds a scored result is reused across panels
+CRITIQUES_KEPT = 50     # upper bound for the recurring_sessions weight
+
+WEIGHTS = {
+    "rw_slope":          40,   # per unit of read:write below 1.0 ...
+    "rw_max":            30,   # ... capped here
+    "rw_borderline":     10,   # read:write in [1.0, 2.0)
+    "block_each":         8,
+    "block_max":         25,
+    "warn_each":          3,
+    "warn_max":          15,
+    "recurring_sessions": 5,   # critiques whose recurring patterns count
+    "recurring_many":     3,   # more patterns than this is the heavy case
+    "recurring_each":     3,
+    "recurring_max":     20,
+    "recurring_few":      5,
+    "self_score_each":    3,   # per point of self-score below 5
+}
+
+_lock    = threading.Lock()
+_tools   = JsonlTail(str(CC_EVENTS))
+_gates   = JsonlTail(str(GATES))
+_crits   = JsonlTail(str(CRITIQUES))
+_recent  = deque(maxlen=WINDOW)   # tool names, oldest first
+_hits    = deque()                # (epoch, verdict) for gate blocks/warns
+_last    = deque(maxlen=CRITIQUES_KEPT)
+_read_at = 0.0
+_memo    = {}                     # (weights, use_store) -> result since last read
+_at      = None                   # past instant _memo and _then are for
+_then    = None                   # (tools, hits, critiques) as of _at
+
+
+def weights(profile):
+    """WEIGHTS with the profile's overrides, rounded to whole points.
+
+    Unknown keys and values that are not non-negative numbers are ignored.
+    """
+    w = dict(WEIGHTS)
+    over = profile.get("integrity_weights")
+    for k, v in (over.items() if isinstance(over, dict) else ()):
+        if k in w and isinstance(v, (int, float)) and not isinstance(v, bool) and 0 <= v < float("inf"):
+            w[k] = round(v)
+    return w
+
+
+def _follow(tail, seed):
+    """New events from `tail`; on (re)start, `seed()` supplies the recent past."""
+    tail.check()
+    if tail.reset:
+        tail.seek_end()
+        tail.reset = False
+        return seed(), True
+    return list(tail.read()), False
+
+
+def _seed_gates(until=None):
+    cutoff = clock() - GATE_SPAN
+    out = []
+    for raw in iter_backward(GATES, until=until):
+        try:
+            ev = json.loads(raw)
+        except ValueError:
+            continue
+        if ev.get("epoch", 0) < cutoff:
+            break
+        out.append(ev)
+    out.reverse()
+    return out
+
+
+def _refresh():
+    """Pull new lines from all three logs, at most once per TTL.
+
+    Returns True if it read, i.e. memoized scores are now stale.
+    """
+    global _read_at
+    now = time.monotonic()
+    if now - _read_at < TTL:
+        return False
+    _read_at = now
+
+    evs, fresh = _follow(_tools, lambda: last_events(CC_EVENTS, WINDOW))
+    if fresh:
+        _recent.clear()
+    _recent.extend(ev.get("tool", "") for ev in evs)
+
+    evs, fresh = _follow(_gates, _seed_gates)
+    if fresh:
+        _hits.clear()
+    _hits.extend(_verdicts(evs))
+    cutoff = clock() - GATE_SPAN
+    while _hits and _hits[0][0] < cutoff:
+        _hits.popleft()
+
+    evs, fresh = _follow(_crits, lambda: last_events(CRITIQUES, _last.maxlen))
+    if fresh:
+        _last.clear()
+    _last.extend(e for e in evs if isinstance(e, dict))
+    return True
+
+
+def _verdicts(evs):
+    """(epoch, verdict) for the gate blocks and warns among `evs`."""
+    for ev in evs:
+        v = str(ev.get("verdict", ev.get("decision", ""))).lower()
+        if "block" in v or "deny" in v or "warn" in v:
+            yield ev.get("epoch", 0), v
+
+
+def _past(t):
+    """(tools, hits, critiques) as they stood at `t`, read backward from it."""
+    tools = [ev.get("tool", "") for ev in last_events(CC_EVENTS, WINDOW, until=t)]
+    hits  = list(_verdicts(_seed_gates(t)))
+    crits = last_events(CRITIQUES, CRITIQUES_KEPT, keep=lambda e: isinstance(e, dict), until=t)
+    return tools, hits, crits
+
+
+def _score(w, use_store, tools, hits, crits):
+    score = 100
+    signals = []
+
+    # --- Signal 1: Read:Write ratio (last WINDOW tool calls) ---
+    reads = sum(1 for t in tools if t in READ_TOOLS)
+    writes = sum(1 for t in tools if t in WRITE_TOOLS)
+    ratio = reads / writes if writes > 0 else 99
+    if ratio < 1.0:
+        deduct = min(w["rw_max"], int((1.0 - ratio) * w["rw_slope"]))
+        score -= deduct
+        signals.append((f"Read:Write {ratio:.1f}x — writing without reading", "red", deduct))
+    elif ratio < 2.0:
+        score -= w["rw_borderline"]
+        signals.append((f"Read:Write {ratio:.1f}x — borderline", "yellow", w["rw_borderline"]))
+    else:
+        signals.append((f"Read:Write {ratio:.1f}x", "green", 0))
+
+    # --- Signal 2: Gate blocks/warns in last hour ---
+    blocks = warns = 0
+    if use_store:
+        verdicts = ((d, n) for (_, d), n in store.gate_counts(clock() - GATE_SPAN).items())
+    else:
+        verdicts = ((v, 1) for _, v in hits)
+    for v, n in verdicts:
+        if "block" in v or "deny" in v:
+            blocks += n
+        elif "warn" in v:
+            warns += n
+    if blocks > 0:
+        deduct = min(w["block_max"], blocks * w["block_each"])
+        score -= deduct
+        signals.append((f"{blocks} gate block(s) in last hour", "red", deduct))
+    if warns > 0:
+        deduct = min(w["warn_max"], warns * w["warn_each"])
+        score -= deduct
+        signals.append((f"{warns} gate warn(s) in last hour", "yellow", deduct))
+    if blocks == 0 and warns == 0:
+        signals.append(("No gate violations", "green", 0))
+
+    # --- Signal 3: Recurring mistake patterns in the last few critiques ---
+    n = min(int(w["recurring_sessions"]), CRITIQUES_KEPT)
+    recent = list(crits)[-n:] if n > 0 else []
+    recurring = sum(len(c.get("recurring", [])) for c in recent)
+    if recurring > w["recurring_many"]:
+        deduct = min(w["recurring_max"], recurring * w["recurring_each"])
+        score -= deduct
+        signals.append((f"{recurring} recurring mistake patterns", "red", deduct))
+    elif recurring > 0:
+        score -= w["recurring_few"]
+        signals.append((f"{recurring} recurring pattern(s)", "yellow", w["recurring_few"]))
+    else:
+        signals.append(("No recurring patterns", "green", 0))
+
+    # --- Signal 4: Latest self-score ---
+    latest = crits[-1].get("score") if crits else None
+    if isinstance(latest, (int, float)) and latest < 5:
+        deduct = int((5 - latest) * w["self_score_each"])
+        score -= deduct
+        signals.append((f"Self-score {latest}/10", "yellow", deduct))
+    elif latest is not None:
+        signals.append((f"Self-score {latest}/10", "green", 0))
+
+    return {
+        "score":     max(0, min(100, int(score))),
+        "signals":   signals,
+        "reads":     reads,
+        "writes":    writes,
+        "blocks":    blocks,
+        "warns":     warns,
+        "recurring": recurring,
+        "self_score": latest,
+    }
+
+
+def compute(profile):
+    """Integrity score and its signals for `profile`'s weights, memoized per tick."""
+    global _at, _then
+    w = weights(profile)
+    use_store = store.enabled(profile, clock() - GATE_SPAN)
+    key = (tuple(sorted(w.items())), use_store)
+    at = as_of()
+    with _lock:
+        if at is None:
+            if _refresh() or _at is not None:
+                _memo.clear()
+            inputs = (_recent, _hits, _last)
+        else:
+            if at != _at:
+                _memo.clear()
+                _then = _past(at)
+            inputs = _then
+        _at = at
+        hit = _memo.get(key)
+        if hit is None:
+            hit = _memo[key] = _score(w, use_store, *inputs)
+        return hit
@@ -1,46 +1,156 @@
-"""Logs module — recent alerts + system log tail."""
+"""Logs module — recent alerts + merged follow-mode tail of health and bus logs."""
+import glob
+import heapq
 import json
-import time
+import os
+import re
+from collections import deque
+from datetime import datetime
 from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr
+from .core import clr, HOME
+from .eventlog import LineTail, read_backward
 
-ALERTS_FILE  = Path.home() / ".mirrordna/health/proactive_alerts.json"
-HEALTH_LOG   = Path.home() / ".mirrordna/health/health.log"
-BUS_DIR      = Path.home() / ".mirrordna/bus"
+ALERTS_FILE  = HOME / ".mirrordna/health/proactive_alerts.json"
+HEALTH_LOG   = HOME / ".mirrordna/health/health.log"
+BUS_DIR      = HOME / ".mirrordna/bus"
+
+# Followed by default; a profile can override with `log_files: [path/glob, ...]`
+LOG_FILES = [str(HEALTH_LOG), str(BUS_DIR / "*.log")]
+RING      = 50     # merged lines kept across ticks
+
+PROFILE_KEYS = ("log_files",)
+
+_SEVERITY = re.compile(r"(ERROR|CRITICAL)|(WARN)")
+_TS_RE    = re.compile(r"^\[?(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?)")
+
+# Per resolved log_files, so profiles following different files keep their
+# own tails and ring: pattern tuple -> ({path: [LineTail, last seen ts]}, ring)
+_follows  = {}
+_alerts   = (None, [])   # ((mtime_ns, size), parsed alerts)
 
 
 def _load_alerts():
-    if not ALERTS_FILE.exists():
+    """Re-parse proactive_alerts.json only when its mtime or size changes."""
+    global _alerts
+    try:
+        st = ALERTS_FILE.stat()
+    except OSError:
+        _alerts = (None, [])
         return []
+    key = (st.st_mtime_ns, st.st_size)
+    if key == _alerts[0]:
+        return _alerts[1]
     try:
         data = json.loads(ALERTS_FILE.read_text())
-        if isinstance(data, list):
-            return data[-10:]
-        return []
+        alerts = data[-10:] if isinstance(data, list) else []
     except Exception:
-        return []
+        alerts = []
+    _alerts = (key, alerts)
+    return alerts
 
 
-def _tail_log(path, n=8):
-    if not path.exists():
-        return []
-    try:
-        lines = path.read_text().splitlines()
-        return [l for l in lines if l.strip()][-n:]
-    except Exception:
-        return []
+def _severity(line):
+    m = _SEVERITY.search(line)
+    if not m:
+        return "info"
+    return "error" if m.group(1) else "warn"
+
+
+def _stamp(line, fallback):
+    """Leading ISO-ish timestamp as epoch; continuation lines inherit `fallback`."""
+    m = _TS_RE.match(line)
+    if m:
+        try:
+            return datetime.fromisoformat(m.group(1)).timestamp()
+        except ValueError:
+            pass
+    return fallback
+
+
+def _label(path):
+    p = Path(path)
+    return p.name if p.parent == BUS_DIR or p == HEALTH_LOG else str(p)
+
+
+def _entries(path, state, raws):
+    """Decode raw lines for one file into (ts, source, line, severity)."""
+    label = _label(path)
+    out = []
+    for raw in raws:
+        line = raw.decode(errors="replace").rstrip()
+        if not line.strip():
+            continue
+        state[1] = _stamp(line, state[1])
+        out.append((state[1], label, line, _severity(line)))
+    return out
+
+
+def _follow(patterns):
+    """Pull new lines from every followed file and merge them by timestamp."""
+    patterns = tuple(os.path.expanduser(pat) for pat in patterns)
+    if patterns not in _follows:
+        _follows[patterns] = ({}, deque(maxlen=RING))
+    tails, ring = _follows[patterns]
+    paths = []
+    for pat in patterns:
+        paths.extend(sorted(glob.glob(pat)) if glob.has_magic(pat) else [pat])
+
+    batches, seeded = [], False
+    for path in paths:
+        state = tails.get(path)
+        if state is None:
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            state = tails[path] = [LineTail(path), mtime]
+        tail = state[0]
+        tail.check()
+        if tail.reset:
+            # New (or replaced) file — seed with its last RING lines, then follow
+            end = tail.seek_end()
+            tail.reset, seeded = False, True
+            raws = []
+            if end:
+                for raw in read_backward(path, end):
+                    if raw.strip():
+                        raws.append(raw)
+                        if len(raws) >= RING:
+                            break
+                raws.reverse()
+        else:
+            raws = tail.read_raw()
+        if raws:
+            batches.append(_entries(path, state, raws))
+
+    for path in set(tails) - set(paths):
+        del tails[path]
+
+    # Each file is already in time order; merge across files. A file seeded
+    # mid-run may hold lines older than the ring, so re-sort in that case.
+    merged = heapq.merge(*batches, key=lambda e: e[0])
+    if seeded and ring:
+        merged = sorted([*ring, *merged], key=lambda e: e[0])
+        ring.clear()
+    ring.extend(merged)
+    return list(ring)
+
+
+def collect(profile):
+    """Recent alerts and the newest merged log lines as (ts, source, line, severity)."""
+    log_lines = _follow(profile.get("log_files", LOG_FILES))
+    return {"alerts": _load_alerts(), "lines": log_lines[-5:],
+            "multi": len({e[1] for e in log_lines}) > 1}
 
 
-def render(profile):
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     color = clr(profile.get("color"))
-    alerts = _load_alerts()
-    log_lines = _tail_log(HEALTH_LOG)
+    alerts, log_lines, multi = data["alerts"], data["lines"], data["multi"]
 
     t = Text()
-    now = time.time()
 
     # Alerts section
     if alerts:
@@ -67,14 +177,11 @@ def render(profile):
     # Log tail
     if log_lines:
         t.append("  LOG TAIL\n", style=f"bold {color}")
-        for line in log_lines[-5:]:
-            # Color ERROR/WARN lines
-            if "ERROR" in line or "CRITICAL" in line:
-                t.append(f"  {line[:70]}\n", style="red")
-            elif "WARN" in line:
-                t.append(f"  {line[:70]}\n", style="yellow")
-            else:
-                t.append(f"  {line[:70]}\n", style="grey42")
+        for _, source, line, sev in log_lines:
+            style = "red" if sev == "error" else "yellow" if sev == "warn" else "grey42"
+            if multi:
+                t.append(f"  {source[:12]:<12}", style="grey30")
+            t.append(f"  {line[:70]}\n", style=style)
     else:
         t.append("  No log file at ~/.mirrordna/health/health.log\n", style="grey30")
 
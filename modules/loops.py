@@ -1,13 +1,19 @@
 """Loops module — open items / blockers."""
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
 from .core import read_loops, clr
 
+PROFILE_KEYS = ()
 
-def render(profile):
+
+def collect(profile):
+    return {"loops": read_loops()}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     color = clr(profile.get("color"))
-    loops = read_loops()
+    loops = data["loops"]
 
     t = Text()
     if loops:
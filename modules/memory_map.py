@@ -1,16 +1,8 @@
 """Memory Map — CONTINUITY, CC_MEMORY, bus state, handoffs, freshness."""
-import json
-import time
 from pathlib import Path
 from datetime import datetime
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.console import Group
-from rich import box
-from .core import clr
-
-HOME = Path.home()
+from .core import clr, read_cached, HOME, clock
+
 MIRRORDNA = HOME / ".mirrordna"
 
 MEMORY_FILES = {
@@ -21,13 +13,16 @@ MEMORY_FILES = {
     "MISTAKES.md":       MIRRORDNA / "MISTAKES.md",
     "INFRASTRUCTURE.md": MIRRORDNA / "INFRASTRUCTURE.md",
 }
+BUS_STATE   = MIRRORDNA / "bus/continuity/live_state.json"
+HANDOFF_DIR = MIRRORDNA / "handoff/pending"
+
+PROFILE_KEYS = ()
 
 
-def _age(path: Path) -> tuple[str, str]:
-    """Return (age_str, color)."""
-    if not path.exists():
+def _age(age_s) -> tuple[str, str]:
+    """Return (age_str, color) for an age in seconds; None means missing."""
+    if age_s is None:
         return "missing", "red"
-    age_s = time.time() - path.stat().st_mtime
     if age_s < 300:
         return f"{int(age_s)}s", "green"
     if age_s < 3600:
@@ -37,8 +32,46 @@ def _age(path: Path) -> tuple[str, str]:
     return f"{int(age_s/86400)}d", "red"
 
 
-def render(profile):
+def _stat(path: Path):
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def collect(profile):
+    """Memory file mtimes and sizes, the bus live state and pending handoffs."""
+    files = []
+    for label, path in MEMORY_FILES.items():
+        st = _stat(path)
+        files.append({"file": label,
+                      "mtime": st.st_mtime if st else None,
+                      "size": st.st_size if st else None})
+
+    # None: no live state file; False: present but unreadable
+    state = None
+    if BUS_STATE.exists():
+        state = read_cached(BUS_STATE)
+        if not isinstance(state, dict):
+            state = False
+
+    handoffs = None
+    if HANDOFF_DIR.exists():
+        pickups = sorted(((p.name, _stat(p)) for p in HANDOFF_DIR.glob("*.md")),
+                         key=lambda x: x[1].st_mtime if x[1] else 0, reverse=True)
+        handoffs = [(name, st.st_mtime if st else None) for name, st in pickups[:3]]
+
+    return {"files": files, "bus_state": state, "handoffs": handoffs}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich.console import Group
+    from rich import box
     color = clr(profile.get("color", "deep_sky_blue1"))
+    now = clock()
 
     t = Text()
     t.append("  MEMORY FILES\n", style=f"bold {color}")
@@ -48,37 +81,34 @@ def render(profile):
     tbl.add_column("age",   width=8,  no_wrap=True)
     tbl.add_column("size",  width=8,  no_wrap=True)
 
-    for label, path in MEMORY_FILES.items():
-        age_str, age_color = _age(path)
-        size = f"{path.stat().st_size // 1024}KB" if path.exists() else "—"
+    for f in data["files"]:
+        age_str, age_color = _age(now - f["mtime"] if f["mtime"] is not None else None)
+        size = f"{f['size'] // 1024}KB" if f["size"] is not None else "—"
         tbl.add_row(
-            Text(label, style="grey70"),
+            Text(f["file"], style="grey70"),
             Text(age_str, style=age_color),
             Text(size, style="grey42"),
         )
 
     # Bus state
-    bus_state = MIRRORDNA / "bus/continuity/live_state.json"
+    state = data["bus_state"]
     bus_txt = Text("\n  BUS STATE\n", style=f"bold {color}")
-    if bus_state.exists():
-        try:
-            state = json.loads(bus_state.read_text())
-            for k, v in list(state.items())[:6]:
-                bus_txt.append(f"  {str(k):<18}", style="grey50")
-                bus_txt.append(f"{str(v)[:35]}\n", style="grey70")
-        except Exception:
-            bus_txt.append("  (unreadable)\n", style="grey30")
+    if isinstance(state, dict):
+        for k, v in list(state.items())[:6]:
+            bus_txt.append(f"  {str(k):<18}", style="grey50")
+            bus_txt.append(f"{str(v)[:35]}\n", style="grey70")
+    elif state is False:
+        bus_txt.append("  (unreadable)\n", style="grey30")
     else:
         bus_txt.append("  No live state file.\n", style="grey30")
 
     # Handoff history
-    handoff_dir = MIRRORDNA / "handoff/pending"
+    pickups = data["handoffs"]
     handoff_txt = Text("\n  HANDOFFS\n", style=f"bold {color}")
-    if handoff_dir.exists():
-        pickups = sorted(handoff_dir.glob("*.md"), key=lambda p: p.stat().st_mtime, reverse=True)
-        for p in pickups[:3]:
-            age_str, ac = _age(p)
-            handoff_txt.append(f"  {p.name[:30]:<32}", style="grey60")
+    if pickups is not None:
+        for name, mtime in pickups:
+            age_str, ac = _age(now - mtime if mtime is not None else None)
+            handoff_txt.append(f"  {name[:30]:<32}", style="grey60")
             handoff_txt.append(f"{age_str}\n", style=ac)
         if not pickups:
             handoff_txt.append("  No pending handoffs.\n", style="grey30")
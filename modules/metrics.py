@@ -1,9 +1,8 @@
 """Metrics module — founder KPIs (MRR, runway, pipeline)."""
 from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr, METRICS_FILE
+from .core import clr, METRICS_FILE, read_cached
+
+PROFILE_KEYS = ()
 
 _DEFAULTS = {
     "mrr": 0, "mrr_delta": 0,
@@ -13,18 +12,22 @@ _DEFAULTS = {
 
 
 def _load():
-    if not METRICS_FILE.exists():
-        return _DEFAULTS
     try:
-        import yaml
-        return {**_DEFAULTS, **yaml.safe_load(METRICS_FILE.read_text())}
+        return {**_DEFAULTS, **(read_cached(METRICS_FILE) or {})}
     except Exception:
         return _DEFAULTS
 
 
-def render(profile):
+def collect(profile):
+    return {**_load(), "configured": METRICS_FILE.exists()}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     color = clr(profile.get("color"))
-    m = _load()
+    m = data
 
     t = Text()
 
@@ -43,7 +46,7 @@ def render(profile):
     stat("PIPELINE", f"${m['pipeline']:,.0f}",
          f"{m['prospects']} prospects", "cyan")
 
-    if not METRICS_FILE.exists():
+    if not m["configured"]:
         t.append("\n  Set metrics in ~/.mirrordash/metrics.yaml\n", style="grey30")
 
     return Panel(t, title=f"[{color}]METRICS[/{color}]",
@@ -1,21 +1,16 @@
 """Mistake Patterns — documented failures from MISTAKES.md + critique recurring."""
-import json
 import re
-from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr
+from .core import clr, parse_jsonl, read_cached, HOME, as_of
+from .eventlog import event_epoch
 
-MISTAKES_FILE = Path.home() / ".mirrordna/MISTAKES.md"
-SELF_CRITIQUE = Path.home() / ".mirrordna/self_critique.jsonl"
+MISTAKES_FILE = HOME / ".mirrordna/MISTAKES.md"
+SELF_CRITIQUE = HOME / ".mirrordna/self_critique.jsonl"
 
+PROFILE_KEYS = ()
 
-def _load_mistakes():
+
+def _parse_mistakes(text):
     """Parse MISTAKES.md — return list of {title, rule, check} dicts."""
-    if not MISTAKES_FILE.exists():
-        return []
-    text = MISTAKES_FILE.read_text()
     entries = []
     blocks = re.split(r'\n## ', text)
     for block in blocks[1:]:
@@ -27,40 +22,64 @@ def _load_mistakes():
     return entries
 
 
-def _load_recurring():
+def _load_mistakes():
+    return read_cached(MISTAKES_FILE, _parse_mistakes, [])
+
+
+def _parse_recurring(text):
     """Aggregate recurring patterns across all critique sessions."""
-    if not SELF_CRITIQUE.exists():
-        return {}
+    return _count_recurring(parse_jsonl(text))
+
+
+def _count_recurring(entries):
     counts = {}
-    with open(SELF_CRITIQUE) as f:
-        for raw in f:
-            try:
-                entry = json.loads(raw)
-                for r in entry.get("recurring", []):
-                    key = r[:60]
-                    counts[key] = counts.get(key, 0) + 1
-            except Exception:
-                pass
+    for entry in entries:
+        try:
+            for r in entry.get("recurring", []):
+                key = r[:60]
+                counts[key] = counts.get(key, 0) + 1
+        except Exception:
+            pass
     return dict(sorted(counts.items(), key=lambda x: -x[1]))
 
 
-def render(profile):
-    color = clr(profile.get("color", "deep_sky_blue1"))
+def _load_recurring():
+    at = as_of()
+    if at is None:
+        return read_cached(SELF_CRITIQUE, _parse_recurring, {})
+    # In the past: only critiques written by then (untimed ones always count)
+    entries = read_cached(SELF_CRITIQUE, parse_jsonl, [])
+    return _count_recurring(e for e in entries
+                            if not isinstance(e, dict) or event_epoch(e) <= at)
+
+
+def collect(profile):
+    """The five most recurring critique patterns and the first documented mistakes."""
     mistakes = _load_mistakes()
-    recurring = _load_recurring()
+    return {"recurring": dict(list(_load_recurring().items())[:5]),
+            "mistakes": mistakes[:6], "mistake_count": len(mistakes)}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color", "deep_sky_blue1"))
+    mistakes = data["mistakes"]
+    recurring = data["recurring"]
 
     t = Text()
 
     if recurring:
         t.append("  RECURRING PATTERNS\n", style="bold red")
-        for pattern, count in list(recurring.items())[:5]:
+        for pattern, count in recurring.items():
             t.append(f"  [{count}x] ", style="bold red")
             t.append(f"{pattern}\n", style="grey70")
         t.append("\n")
 
     if mistakes:
-        t.append(f"  DOCUMENTED MISTAKES  ({len(mistakes)} total)\n", style=f"bold {color}")
-        for m in mistakes[:6]:
+        t.append(f"  DOCUMENTED MISTAKES  ({data['mistake_count']} total)\n", style=f"bold {color}")
+        for m in mistakes:
             t.append(f"  ▸ {m['title'][:55]}\n", style="grey85")
             if m.get("rule"):
                 t.append(f"    {m['rule'][:50]}\n", style="grey42")
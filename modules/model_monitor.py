@@ -1,31 +1,178 @@
 """Model Monitor — models loaded, weights, quantization, context, tokens, API calls."""
+import http.client
 import json
+import re
+import threading
 import time
-import urllib.request
-from pathlib import Path
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.console import Group
-from rich import box
-from .core import clr
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from .core import clr, HOME, as_of
+from .eventlog import JsonlTail, iter_backward
 
 OLLAMA_BASE = "http://localhost:11434"
-CC_EVENTS   = Path.home() / ".mirrordna/bus/cc_events.jsonl"
+CC_EVENTS   = HOME / ".mirrordna/bus/cc_events.jsonl"
+
+TAGS_TTL    = 300    # the on-disk model list rarely changes
+BACKOFF_MIN = 2      # first retry delay once Ollama is found offline
+BACKOFF_MAX = 120
+
+PROFILE_KEYS = ()
+
+# Two workers so /api/ps and /api/tags go out at once; each keeps its own
+# keep-alive connection, reused across ticks.
+_pool  = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ollama")
+_local = threading.local()
+
+_tags       = None   # last good /api/tags response
+_tags_at    = 0.0
+_fails      = 0
+_retry_at   = 0.0
+
+
+def _conn(fresh=False):
+    c = getattr(_local, "conn", None)
+    if c is None or fresh:
+        if c is not None:
+            c.close()
+        u = urlsplit(OLLAMA_BASE)
+        c = _local.conn = http.client.HTTPConnection(u.hostname, u.port or 80, timeout=2)
+    return c
 
 
 def _ollama(path: str, body: dict = None):
-    try:
-        if body:
-            data = json.dumps(body).encode()
-            req  = urllib.request.Request(f"{OLLAMA_BASE}{path}", data=data,
-                                          headers={"Content-Type": "application/json"})
-        else:
-            req = f"{OLLAMA_BASE}{path}"
-        with urllib.request.urlopen(req, timeout=2) as r:
-            return json.loads(r.read())
-    except Exception:
-        return None
+    method  = "POST" if body else "GET"
+    data    = json.dumps(body).encode() if body else None
+    headers = {"Content-Type": "application/json"} if body else {}
+    reused  = getattr(_local, "conn", None) is not None
+    for attempt in range(2 if reused else 1):
+        c = _conn(fresh=attempt > 0)
+        try:
+            c.request(method, path, body=data, headers=headers)
+            r = c.getresponse()
+            raw = r.read()
+            if r.status != 200:
+                return None
+            return json.loads(raw)
+        except (http.client.HTTPException, ConnectionError, OSError):
+            # A kept-alive socket the server already closed fails once —
+            # retry on a fresh connection before calling Ollama offline.
+            c.close()
+            _local.conn = None
+        except ValueError:
+            return None
+    return None
+
+
+def _poll():
+    """Return (ps, tags, retry_in). ps is None while offline or backing off."""
+    global _tags, _tags_at, _fails, _retry_at
+    now = time.time()
+    if now < _retry_at:
+        return None, _tags, _retry_at - now
+
+    ps_f   = _pool.submit(_ollama, "/api/ps")
+    tags_f = _pool.submit(_ollama, "/api/tags") if now - _tags_at >= TAGS_TTL else None
+    ps     = ps_f.result()
+    tags   = tags_f.result() if tags_f else None
+
+    if ps is None:
+        _fails += 1
+        delay = min(BACKOFF_MAX, BACKOFF_MIN * 2 ** (_fails - 1))
+        _retry_at = now + delay
+        return None, _tags, delay
+    _fails, _retry_at = 0, 0.0
+    if tags is not None:
+        _tags, _tags_at = tags, now
+    return ps, _tags, 0
+
+
+# THIS SESSION counters, carried between ticks. Only lines appended since
+# the last tick are examined; a backward scan happens on cold start. Each
+# raw line's session_id is pulled out with a byte regex, and only lines that
+# can affect a counter are json-decoded.
+_tail = JsonlTail(CC_EVENTS)
+_sess = {"id": None, "api": {}, "mcp": {}}
+_then = (None, None)   # (t, counters of the session running at t)
+
+APIS = ("groq", "openai", "anthropic", "gemini", "ollama")
+
+_SID_RE      = re.compile(rb'"session_id"\s*:\s*"([^"]*)"')
+_RELEVANT_RE = re.compile(rb"mcp__|WebFetch|WebSearch|" + b"|".join(a.encode() for a in APIS),
+                          re.IGNORECASE)
+
+
+def _count(ev, api_counts, mcp_counts):
+    tool   = ev.get("tool", "")
+    target = ev.get("target", "").lower()
+    # MCP tool calls
+    if tool.startswith("mcp__"):
+        parts_name = tool.split("__")
+        srv = parts_name[1] if len(parts_name) > 1 else tool
+        mcp_counts[srv] = mcp_counts.get(srv, 0) + 1
+    # API calls via Bash
+    elif tool == "Bash":
+        for api in APIS:
+            if api in target:
+                api_counts[api] = api_counts.get(api, 0) + 1
+    elif tool in ("WebFetch", "WebSearch"):
+        api_counts["web"] = api_counts.get("web", 0) + 1
+
+
+def _count_raw(raw, sess):
+    if _RELEVANT_RE.search(raw):
+        try:
+            _count(json.loads(raw), sess["api"], sess["mcp"])
+        except (ValueError, AttributeError, TypeError):
+            pass   # not JSON, not an object, or fields of the wrong type
+
+
+def _sid(raw):
+    m = _SID_RE.search(raw)
+    return m.group(1).decode(errors="replace") if m else None
+
+
+def _newest_session(raws):
+    """Counters for the session of the first line in `raws` (newest first)."""
+    sess = {"id": None, "api": {}, "mcp": {}}
+    for raw in raws:
+        sid = _sid(raw)
+        if sid and sess["id"] is None:
+            sess["id"] = sid
+        elif sid and sid != sess["id"]:
+            break
+        if sid == sess["id"]:
+            _count_raw(raw, sess)
+    return sess
+
+
+def _cold_start():
+    """Walk back from EOF until the first event from an earlier session."""
+    end = _tail.seek_end()
+    _tail.reset = False
+    if not end:
+        return {"id": None, "api": {}, "mcp": {}}
+    return _newest_session(iter_backward(CC_EVENTS, end))
+
+
+def _session_counts():
+    """Return (api_counts, mcp_counts) for the most recent session_id."""
+    global _sess, _then
+    at = as_of()
+    if at is not None:   # the session running at that instant, walked back from it
+        if _then[0] != at:
+            _then = (at, _newest_session(iter_backward(CC_EVENTS, until=at)))
+        return _then[1]["api"], _then[1]["mcp"]
+    _tail.check()
+    if not _tail.reset:
+        for raw in _tail.iter_raw():
+            sid = _sid(raw)
+            if sid and sid != _sess["id"]:
+                _sess = {"id": sid, "api": {}, "mcp": {}}
+            if sid == _sess["id"]:
+                _count_raw(raw, _sess)
+    if _tail.reset:
+        _sess = _cold_start()
+    return _sess["api"], _sess["mcp"]
 
 
 def _quant_color(q: str) -> str:
@@ -36,11 +183,23 @@ def _quant_color(q: str) -> str:
     return "grey50"
 
 
-def render(profile):
+def collect(profile):
+    """Ollama's loaded and on-disk models, and this session's API/MCP call counts."""
+    ps, tags, _ = _poll()
+    api_counts, mcp_counts = _session_counts()
+    return {"ps": ps, "tags": tags, "retry_at": _retry_at if ps is None else None,
+            "api": dict(api_counts), "mcp": dict(mcp_counts)}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich.console import Group
+    from rich import box
     color = clr(profile.get("color", "deep_sky_blue1"))
 
-    ps         = _ollama("/api/ps")
-    all_models = _ollama("/api/tags")
+    ps, all_models = data["ps"], data["tags"]
 
     parts = []
 
@@ -49,7 +208,8 @@ def render(profile):
     parts.append(hot_txt)
 
     if ps is None:
-        parts.append(Text("  Ollama offline\n", style="red"))
+        retry_in = max(0.0, (data["retry_at"] or 0.0) - time.time())
+        parts.append(Text(f"  Ollama offline — retry in {retry_in:.0f}s\n", style="red"))
     elif not ps.get("models"):
         parts.append(Text("  No models loaded\n", style="grey50"))
     else:
@@ -130,36 +290,7 @@ def render(profile):
     api_txt = Text("\n  THIS SESSION\n", style=f"bold {color}")
     parts.append(api_txt)
 
-    session_id = None
-    api_counts = {}
-    mcp_counts = {}
-
-    if CC_EVENTS.exists():
-        with open(CC_EVENTS) as f:
-            lines = list(f)
-        for raw in reversed(lines):
-            try:
-                ev = json.loads(raw)
-                if not session_id and ev.get("session_id"):
-                    session_id = ev["session_id"]
-                if ev.get("session_id") != session_id:
-                    continue
-                tool   = ev.get("tool", "")
-                target = ev.get("target", "").lower()
-                # MCP tool calls
-                if tool.startswith("mcp__"):
-                    parts_name = tool.split("__")
-                    srv = parts_name[1] if len(parts_name) > 1 else tool
-                    mcp_counts[srv] = mcp_counts.get(srv, 0) + 1
-                # API calls via Bash
-                elif tool == "Bash":
-                    for api in ["groq", "openai", "anthropic", "gemini", "ollama"]:
-                        if api in target:
-                            api_counts[api] = api_counts.get(api, 0) + 1
-                elif tool in ("WebFetch", "WebSearch"):
-                    api_counts["web"] = api_counts.get("web", 0) + 1
-            except Exception:
-                pass
+    api_counts, mcp_counts = data["api"], data["mcp"]
 
     sess_tbl = Table(show_header=False, box=None, padding=(0, 1), expand=True)
     sess_tbl.add_column("name",  width=18, no_wrap=True)
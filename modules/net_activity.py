@@ -1,57 +1,127 @@
 """Net Activity — web fetches, searches, curl calls extracted from tool log."""
-import json
 import re
-import time
-from pathlib import Path
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.console import Group
-from rich import box
-from .core import clr
+from collections import deque
+from urllib.parse import urlsplit
+from .core import clr, HOME, LOOKBACK, as_of, clock
+from .eventlog import JsonlTail, event_epoch, has_log, iter_events
+from .topk import WindowedTopK
 
-CC_EVENTS = Path.home() / ".mirrordna/bus/cc_events.jsonl"
+CC_EVENTS = HOME / ".mirrordna/bus/cc_events.jsonl"
 
 URL_RE = re.compile(r'https?://[^\s\'">{)\]]+')
 CURL_RE = re.compile(r'curl\s+.*?(https?://[^\s\'">{)\]]+)', re.IGNORECASE)
 
 
+RECENT     = 8       # calls shown per section
+LOCAL      = ("localhost", "localho", "127.0.0.1")
+
+PROFILE_KEYS = ()
+
+# Only web-tool and curl lines are decoded; the rest are skipped as raw bytes
+MATCH    = re.compile(rb'"Web(?:Fetch|Search)"|curl', re.IGNORECASE)
+_tail    = JsonlTail(CC_EVENTS, match=MATCH, history=True)
+_index   = {}
+_then    = (None, None)   # (t, index of the LOOKBACK before t)
+
+
 def _extract_urls(target: str) -> list[str]:
     return URL_RE.findall(target)
 
 
-def render(profile):
+def _domain(url: str) -> str:
+    try:
+        return (urlsplit(url).hostname or "").removeprefix("www.")
+    except ValueError:
+        return ""
+
+
+def _new_index():
+    return {
+        "web":     deque(maxlen=RECENT),   # (tool, url, epoch)
+        "curl":    deque(maxlen=RECENT),   # (url, epoch)
+        "n_web":   0,
+        "n_curl":  0,
+        "domains": WindowedTopK(k=32, bucket=3600, retain=86400),
+    }
+
+
+def _ingest():
+    """Extract URLs from newly appended events only."""
+    global _index
+    _tail.check()
+    if _tail.reset or not _index:
+        _index = _new_index()
+        _tail.reset = False
+    now = clock()
+    for ev in _tail.read():
+        _add(_index, ev, now)
+    return _index
+
+
+def _index_at(t):
+    """A fresh index of the LOOKBACK before `t`; its totals cover only that."""
+    global _then
+    if _then[0] != t:
+        ix = _new_index()
+        for ev in iter_events(CC_EVENTS, since=t - LOOKBACK, match=MATCH, until=t):
+            if event_epoch(ev, t) >= t - LOOKBACK:
+                _add(ix, ev, t)
+        _then = (t, ix)
+    return _then[1]
+
+
+def _add(ix, ev, now):
+    tool = ev.get("tool", "")
+    if tool in ("WebFetch", "WebSearch"):
+        target = ev.get("target", "")
+        epoch = event_epoch(ev, now)
+        ix["web"].append((tool, target[:80], epoch))
+        ix["n_web"] += 1
+        if tool == "WebFetch" and (d := _domain(target)):
+            ix["domains"].add(d, epoch)
+    elif tool == "Bash":
+        target = ev.get("target", "")
+        if "curl" not in target.lower():
+            return
+        epoch = event_epoch(ev, now)
+        for url in _extract_urls(target):
+            if any(skip in url for skip in LOCAL):
+                continue
+            ix["curl"].append((url[:80], epoch))
+            ix["n_curl"] += 1
+            if d := _domain(url):
+                ix["domains"].add(d, epoch)
+
+
+def collect(profile):
+    """Recent web and curl calls, their totals and the top domains of the last 24h.
+
+    Totals are all-time, or over the LOOKBACK before a past instant (`span`).
+    """
+    if not has_log(CC_EVENTS):
+        return None
+    at = as_of()
+    ix = _index_at(at) if at is not None else _ingest()
+    top = ix["domains"].window(86400, clock())
+    return {"web": list(ix["web"]), "curl": list(ix["curl"]),
+            "n_web": ix["n_web"], "n_curl": ix["n_curl"], "span": "in 24h" if at else None,
+            "domains": top.top(5), "domain_calls": top.total}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich.console import Group
+    from rich import box
     color = clr(profile.get("color", "deep_sky_blue1"))
 
-    if not CC_EVENTS.exists():
+    if data is None:
         return Panel(Text("  No events logged.", style="grey50"),
                      title=f"[{color}]NET ACTIVITY[/{color}]",
                      border_style="grey30", box=box.SIMPLE_HEAD)
 
-    web_events = []
-    curl_urls = []
-    cutoff = time.time() - 86400
-
-    with open(CC_EVENTS) as f:
-        for raw in f:
-            try:
-                ev = json.loads(raw)
-                tool = ev.get("tool", "")
-                target = ev.get("target", "")
-                epoch = ev.get("epoch", 0)
-
-                if tool in ("WebFetch", "WebSearch"):
-                    web_events.append({
-                        "tool": tool,
-                        "url": target[:80],
-                        "age": time.time() - epoch if epoch else 0,
-                    })
-                elif tool == "Bash" and "curl" in target.lower():
-                    for url in _extract_urls(target):
-                        if not any(skip in url for skip in ["localhost", "localho", "127.0.0.1"]):
-                            curl_urls.append({"url": url[:80], "age": time.time() - epoch if epoch else 0})
-            except Exception:
-                pass
+    ix, now = data, clock()
 
     def age_str(s):
         if s < 60: return f"{int(s)}s"
@@ -61,18 +131,18 @@ def render(profile):
     t = Text()
 
     # Web tool calls
-    if web_events:
-        t.append(f"  WEB TOOL CALLS  ({len(web_events)} total)\n", style=f"bold {color}")
+    if ix["n_web"]:
+        t.append(f"  WEB TOOL CALLS  ({ix['n_web']} {ix['span'] or 'total'})\n", style=f"bold {color}")
         tbl = Table(show_header=False, box=None, padding=(0, 1), expand=True)
         tbl.add_column("tool",  width=12, no_wrap=True)
         tbl.add_column("url",   no_wrap=False, overflow="fold")
         tbl.add_column("age",   width=6,  no_wrap=True)
-        for ev in reversed(web_events[-8:]):
-            tc = "cyan" if ev["tool"] == "WebFetch" else "blue"
+        for tool, url, epoch in reversed(ix["web"]):
+            tc = "cyan" if tool == "WebFetch" else "blue"
             tbl.add_row(
-                Text(ev["tool"], style=tc),
-                Text(ev["url"], style="grey60"),
-                Text(age_str(ev["age"]), style="grey30"),
+                Text(tool, style=tc),
+                Text(url, style="grey60"),
+                Text(age_str(now - epoch), style="grey30"),
             )
     else:
         t.append("  No WebFetch/WebSearch calls logged.\n", style="grey50")
@@ -80,21 +150,28 @@ def render(profile):
 
     # Curl external calls
     ext_txt = Text()
-    if curl_urls:
-        ext_txt.append(f"\n  EXTERNAL CURL  ({len(curl_urls)} calls)\n", style="bold yellow")
+    if ix["n_curl"]:
+        ext_txt.append(f"\n  EXTERNAL CURL  ({ix['n_curl']} {ix['span'] or 'calls'})\n",
+                       style="bold yellow")
         ctbl = Table(show_header=False, box=None, padding=(0, 1), expand=True)
         ctbl.add_column("url", no_wrap=False, overflow="fold")
         ctbl.add_column("age", width=6, no_wrap=True)
-        for ev in reversed(curl_urls[-8:]):
-            ctbl.add_row(Text(ev["url"], style="grey60"), Text(age_str(ev["age"]), style="grey30"))
-        from rich.console import Group as G
-        content = G(t, tbl, ext_txt, ctbl) if tbl else G(t, ext_txt, ctbl)
+        for url, epoch in reversed(ix["curl"]):
+            ctbl.add_row(Text(url, style="grey60"), Text(age_str(now - epoch), style="grey30"))
+        content = Group(t, tbl, ext_txt, ctbl) if tbl else Group(t, ext_txt, ctbl)
     else:
         ext_txt.append("\n  No external curl calls in log.\n", style="grey30")
-        from rich.console import Group as G
-        content = G(t, tbl, ext_txt) if tbl else G(t, ext_txt)
+        content = Group(t, tbl, ext_txt) if tbl else Group(t, ext_txt)
+
+    # Top external domains over the last 24h, from the hourly domain buckets
+    if ix["domain_calls"]:
+        dom_txt = Text(f"\n  TOP DOMAINS / 24h  ({ix['domain_calls']} calls)\n", style=f"bold {color}")
+        for domain, count in ix["domains"]:
+            dom_txt.append(f"  {count:>4}x ", style="grey42")
+            dom_txt.append(f"{domain[:50]}\n", style="grey70")
+        content = Group(content, dom_txt)
 
-    total_external = len(web_events) + len(curl_urls)
+    total_external = ix["n_web"] + ix["n_curl"]
     border = "yellow" if total_external > 10 else color
     title_suffix = f" ({total_external} external)" if total_external else ""
 
@@ -1,12 +1,11 @@
 """Pipeline module — founder deal pipeline stages."""
 from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr, DASH_DIR, METRICS_FILE
+from .core import clr, DASH_DIR, METRICS_FILE, parse_list, read_cached
 
 PIPELINE_FILE = DASH_DIR / "pipeline.md"
 
+PROFILE_KEYS = ()
+
 STAGES = ["LEAD", "QUALIFIED", "PROPOSAL", "NEGOTIATION", "CLOSED"]
 STAGE_COLORS = {
     "LEAD": "grey50",
@@ -19,35 +18,33 @@ STAGE_COLORS = {
 
 def _load_pipeline():
     """Read pipeline.md — lines like: STAGE: Description ($value)"""
-    if not PIPELINE_FILE.exists():
-        return []
-    items = []
-    for line in PIPELINE_FILE.read_text().splitlines():
-        s = line.strip()
-        if not s or s.startswith("#"):
-            continue
-        items.append(s.lstrip("- ").strip())
-    return items
+    return read_cached(PIPELINE_FILE, parse_list, [])
+
+
+def collect(profile):
+    m = read_cached(METRICS_FILE)
+    if not isinstance(m, dict):
+        m = {}
+    return {"items": _load_pipeline(),
+            "pipeline": m.get("pipeline", 0), "prospects": m.get("prospects", 0)}
 
 
-def render(profile):
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     color = clr(profile.get("color"))
-    items = _load_pipeline()
+    items = data["items"]
 
     t = Text()
 
-    # Load metrics for pipeline total
-    pipeline_total = 0
+    # Metrics for pipeline total
     try:
-        import yaml
-        if METRICS_FILE.exists():
-            m = yaml.safe_load(METRICS_FILE.read_text()) or {}
-            pipeline_total = m.get("pipeline", 0)
-            prospects = m.get("prospects", 0)
-            if pipeline_total:
-                t.append(f"  ${pipeline_total:,.0f}", style="bold green")
-                t.append(f" pipeline  ", style="grey50")
-                t.append(f"{prospects} prospects\n\n", style="grey70")
+        pipeline_total, prospects = data["pipeline"], data["prospects"]
+        if pipeline_total:
+            t.append(f"  ${pipeline_total:,.0f}", style="bold green")
+            t.append(f" pipeline  ", style="grey50")
+            t.append(f"{prospects} prospects\n\n", style="grey70")
     except Exception:
         pass
 
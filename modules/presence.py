@@ -1,16 +1,23 @@
 """Presence module — team member status."""
-import json
 from datetime import datetime, timezone
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr, PRESENCE_FILE
+from .core import clr, PRESENCE_FILE, read_cached
 
+PROFILE_KEYS = ()
 
-def render(profile):
-    color = clr(profile.get("color"))
 
+def collect(profile):
     if not PRESENCE_FILE.exists():
+        return None
+    return read_cached(PRESENCE_FILE, default=[])
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color"))
+
+    if data is None:
         t = Text()
         t.append("  No team presence data.\n", style="grey50")
         t.append("  Write JSON to ~/.mirrordash/presence.json\n\n", style="grey30")
@@ -18,10 +25,7 @@ def render(profile):
         return Panel(t, title=f"[{color}]PRESENCE[/{color}]",
                      border_style=color, box=box.HEAVY_HEAD, padding=(0, 1))
 
-    try:
-        members = json.loads(PRESENCE_FILE.read_text())
-    except Exception:
-        members = []
+    members = data
 
     STATUS_COLORS = {
         "flow": "green", "deep": "cyan", "blocked": "yellow",
@@ -0,0 +1,181 @@
+"""Processes module — top-N CPU and RSS consumers from incremental /proc sampling."""
+import heapq
+import os
+import time
+from .core import clr
+
+PROC = "/proc"
+
+PROFILE_KEYS = ("top_processes",)
+
+try:
+    _CLK_TCK = os.sysconf("SC_CLK_TCK")
+    _PAGE    = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _CLK_TCK, _PAGE = 100, 4096
+
+# pid -> (starttime, cpu_ticks) from the previous tick. starttime guards
+# against pid reuse between samples.
+_prev = {}
+_prev_wall = 0.0
+_mem_total = 0
+
+
+def _mem_total_bytes():
+    global _mem_total
+    if not _mem_total:
+        try:
+            with open(f"{PROC}/meminfo", "rb") as f:
+                for line in f:
+                    if line.startswith(b"MemTotal:"):
+                        _mem_total = int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            pass
+    return _mem_total
+
+
+def _read_stat(pid: str):
+    """One read of /proc/<pid>/stat — returns (comm, starttime, ticks, rss_bytes)."""
+    try:
+        fd = os.open(f"{PROC}/{pid}/stat", os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        raw = os.read(fd, 1024)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    # comm may contain spaces and parens — it runs to the *last* ')'
+    lp = raw.find(b"(")
+    rp = raw.rfind(b")")
+    if lp < 0 or rp < 0:
+        return None
+    comm = raw[lp + 1:rp].decode(errors="replace")
+    f = raw[rp + 2:].split()
+    # f[0] is field 3 (state): utime=14, stime=15, starttime=22, rss=24
+    try:
+        return comm, int(f[19]), int(f[11]) + int(f[12]), int(f[21]) * _PAGE
+    except (IndexError, ValueError):
+        return None
+
+
+def _sample():
+    """Sample every pid once.
+
+    Returns (rows, have_delta) where rows are (pid, comm, cpu_pct, rss_bytes).
+    CPU needs a previous tick, so the first call reports RSS only.
+    """
+    global _prev, _prev_wall
+    now = time.monotonic()
+    dt = now - _prev_wall if _prev_wall else 0.0
+    prev, cur, rows = _prev, {}, []
+
+    try:
+        entries = os.scandir(PROC)
+    except OSError:
+        return None
+    with entries:
+        for e in entries:
+            name = e.name
+            if not name.isdigit():
+                continue
+            st = _read_stat(name)
+            if st is None:
+                continue  # exited between scandir and read
+            comm, start, ticks, rss = st
+            pid = int(name)
+            cur[pid] = (start, ticks)
+            p = prev.get(pid)
+            if p and p[0] == start and dt > 0:
+                cpu = (ticks - p[1]) / _CLK_TCK / dt * 100
+            else:
+                cpu = 0.0
+            rows.append((pid, comm, cpu, rss))
+
+    _prev, _prev_wall = cur, now
+    return rows, dt > 0
+
+
+def _fmt_bytes(n):
+    if n >= 1024**3: return f"{n / 1024**3:.1f}G"
+    if n >= 1024**2: return f"{n / 1024**2:.0f}M"
+    return f"{n // 1024}K"
+
+
+def collect(profile):
+    """Top `top_processes` rows (pid, comm, cpu%, rss) by CPU and by RSS."""
+    top_n = profile.get("top_processes", 6)
+    sample = _sample() if os.path.isdir(PROC) else None
+    if sample is None:
+        return None
+    rows, have_delta = sample
+    return {
+        "count":      len(rows),
+        "have_delta": have_delta,
+        "by_cpu":     heapq.nlargest(top_n, rows, key=lambda r: r[2]),
+        "by_rss":     heapq.nlargest(top_n, rows, key=lambda r: r[3]),
+        "mem_total":  _mem_total_bytes(),
+    }
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich.console import Group
+    from rich import box
+    color = clr(profile.get("color"))
+
+    if data is None:
+        return Panel(Text("  /proc not available on this system.", style="grey50"),
+                     title=f"[{color}]PROCESSES[/{color}]",
+                     border_style="grey30", box=box.SIMPLE_HEAD)
+
+    have_delta, by_cpu, by_rss = data["have_delta"], data["by_cpu"], data["by_rss"]
+    mem_total = data["mem_total"]
+
+    def table():
+        tbl = Table(show_header=False, box=None, padding=(0, 1), expand=True)
+        tbl.add_column("pid",  width=7, no_wrap=True)
+        tbl.add_column("name", no_wrap=True)
+        tbl.add_column("val",  width=7, no_wrap=True)
+        tbl.add_column("alt",  width=7, no_wrap=True)
+        return tbl
+
+    head = Text()
+    head.append(f"  {data['count']}", style="bold white")
+    head.append(" processes\n\n", style="grey50")
+    head.append("  TOP CPU\n", style=f"bold {color}")
+
+    cpu_tbl = table()
+    hot = 0.0
+    if not have_delta:
+        head.append("  sampling…\n", style="grey30")
+        by_cpu = []
+    for pid, comm, cpu, rss in by_cpu:
+        hot = max(hot, cpu)
+        cc = "red" if cpu > 85 else "yellow" if cpu > 40 else "grey85"
+        cpu_tbl.add_row(Text(str(pid), style="grey42"), Text(comm[:24], style="grey70"),
+                        Text(f"{cpu:.0f}%", style=f"bold {cc}"),
+                        Text(_fmt_bytes(rss), style="grey42"))
+
+    rss_head = Text("\n  TOP RSS\n", style=f"bold {color}")
+    rss_tbl = table()
+    for pid, comm, cpu, rss in by_rss:
+        pct = rss / mem_total * 100 if mem_total else 0
+        rc = "red" if pct > 25 else "yellow" if pct > 10 else "grey85"
+        rss_tbl.add_row(Text(str(pid), style="grey42"), Text(comm[:24], style="grey70"),
+                        Text(_fmt_bytes(rss), style=f"bold {rc}"),
+                        Text(f"{pct:.0f}%", style="grey42"))
+
+    frame = profile.get("_frame", 0)
+    if hot > 85:
+        border = "bright_red" if frame % 2 == 0 else "red"
+    else:
+        border = "grey30"
+
+    return Panel(Group(head, cpu_tbl, rss_head, rss_tbl),
+                 title=f"[{color}]PROCESSES[/{color}]",
+                 border_style=border, box=box.SIMPLE_HEAD, padding=(0, 1))
@@ -1,13 +1,20 @@
 """Queue module — ordered task list."""
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
 from .core import read_tasks, clr
 
+PROFILE_KEYS = ()
 
-def render(profile):
-    color = clr(profile.get("color"))
+
+def collect(profile):
     _, queue, done = read_tasks()
+    return {"queue": queue, "done": done}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color"))
+    queue, done = data["queue"], data["done"]
 
     t = Text()
     for item in done[-3:]:
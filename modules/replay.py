@@ -0,0 +1,146 @@
+"""Replay recorded logs on a virtual clock.
+
+    python3 mirrordash.py -p glass --replay ~/incident/.mirrordna --speed 20
+
+The source is a copy of ~/.mirrordna, or of just its bus/ directory (the
+live ones work too; they are only read). Everything in it is copied into a
+scratch home that MIRRORDASH_HOME points the modules at, except the JSONL
+logs: those start empty, and their recorded lines, rotated segments
+included, are appended in event-time order as the clock passes each one.
+Modules read them through their usual incremental tails, and core.clock()
+returns the replay time, so every panel shows what it would have shown at
+that moment.
+
+The logs are streamed, not loaded: each is read in order and the readers are
+merged on event time, so memory does not grow with the recording. A line
+without a time, or older than the one before it, goes out with its
+predecessor.
+
+The clock starts at the first recorded event and runs at `speed` times real
+time. The same recording always produces the same sequence of appends, which
+also makes a replay a repeatable load for profiling.
+"""
+import heapq
+import json
+import re
+import shutil
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from .eventlog import event_epoch, iter_lines
+
+_LOG = re.compile(r"^(.+\.jsonl)(\.\d+(\.gz|\.zst)?|\.manifest\.json)?$")   # a log and its segments
+
+
+class Replay:
+    """The recorded events of `src`, written into `home` as the clock reaches them."""
+
+    def __init__(self, src, home, speed=1.0):
+        self.src   = Path(src).expanduser()
+        self.dest  = Path(home) / ".mirrordna"
+        if not (self.src / "bus").is_dir():
+            self.dest = self.dest / "bus"   # src is a bus directory itself
+        self.speed = speed
+        self.pos   = 0      # lines written
+        self._stop = threading.Event()
+        self._copy_static()
+        self.logs   = sorted({p.parent / _LOG.match(p.name).group(1)
+                              for p in self.src.rglob("*") if _LOG.match(p.name)})
+        self._lines = self._load()
+        self._head  = deque()   # lines read from _lines but not yet written
+        # Untimed lines sort first, so the first timed one is the earliest
+        n = 0
+        while self._peek(n) is not None and self._head[n][0] <= 0:
+            n += 1
+        first       = self._peek(n)
+        self.start  = first[0] if first else time.time()
+        self.end    = self.start   # latest event time written so far
+        self._t0    = time.monotonic()
+        self._frozen = None
+
+    def _copy_static(self):
+        for path in self.src.rglob("*"):
+            rel = path.relative_to(self.src)
+            if path.is_dir() or _LOG.match(path.name):
+                continue
+            (self.dest / rel).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, self.dest / rel)   # keeps mtimes, which memory_map shows as ages
+
+    def _load(self):
+        """Empty the copies of the logs; (epoch, log index, raw line) of all, in replay order."""
+        streams = []
+        for i, log in enumerate(self.logs):
+            out = self.dest / log.relative_to(self.src)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_bytes(b"")
+            streams.append(_timed(log, i))
+        return heapq.merge(*streams, key=lambda e: e[:2])
+
+    def _peek(self, n=0):
+        """The `n`th line not yet written, or None past the last one."""
+        while len(self._head) <= n:
+            line = next(self._lines, None)
+            if line is None:
+                return None
+            self._head.append(line)
+        return self._head[n]
+
+    def clock(self):
+        """Replay time: the first event's epoch plus elapsed time times speed."""
+        if self._frozen is not None:
+            return self._frozen
+        return self.start + (time.monotonic() - self._t0) * self.speed
+
+    def feed(self, until):
+        """Append every recorded line due by `until`; returns how many."""
+        batch = {}
+        while self._peek() is not None and self._head[0][0] <= until:
+            epoch, i, raw = self._head.popleft()
+            batch.setdefault(i, []).append(raw)
+            self.end = max(self.end, epoch)
+            self.pos += 1
+        for i, lines in batch.items():
+            with open(self.dest / self.logs[i].relative_to(self.src), "ab") as f:
+                f.write(b"".join(line + b"\n" for line in lines))
+        return sum(len(v) for v in batch.values())
+
+    @property
+    def done(self):
+        return self._peek() is None
+
+    def finish(self):
+        """Write everything and stop the clock at the last event."""
+        self.feed(float("inf"))
+        self._frozen = self.end
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.feed(self.clock())
+            if self.done:
+                return
+            due = (self._head[0][0] - self.clock()) / self.speed
+            self._stop.wait(min(max(due, 0.01), 0.5))
+
+    def run(self):
+        """Feed in real time (scaled by speed) from a daemon thread; returns self."""
+        self._t0 = time.monotonic()
+        threading.Thread(target=self._run, name="replay", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+
+def _timed(log, i):
+    """(epoch, i, raw line) for each line of `log`, times held non-decreasing."""
+    last = 0.0
+    for raw in iter_lines(log):
+        try:
+            ev = json.loads(raw)
+        except ValueError:
+            ev = None
+        if isinstance(ev, dict):
+            last = max(last, event_epoch(ev, 0.0))
+        yield last, i, raw
@@ -1,14 +1,12 @@
 """Rule Compliance — which rules fired in the last 24h."""
-import json
-import time
-from pathlib import Path
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich import box
-from .core import clr
+from .core import clr, HOME, as_of, clock
+from .eventlog import iter_events, has_log
+from . import store
 
-HOOK_DECISIONS = Path.home() / ".mirrordna/bus/hook_decisions.jsonl"
+HOOK_DECISIONS = HOME / ".mirrordna/bus/hook_decisions.jsonl"
+
+PROFILE_KEYS = ("store",)
+PROCESS      = True   # without the store this parses a day of decisions
 
 RULES = {
     1: "No side-effectful test-fires",
@@ -33,29 +31,41 @@ HOOK_TO_RULES = {
 }
 
 
-def render(profile):
-    color = clr(profile.get("color", "deep_sky_blue1"))
-
+def collect(profile):
+    """Per-rule allow/warn/block counts and fires per hook over the last 24h."""
     rule_hits = {r: {"warn": 0, "block": 0, "allow": 0} for r in RULES}
     hook_totals = {}
 
-    if HOOK_DECISIONS.exists():
-        cutoff = time.time() - 86400
-        with open(HOOK_DECISIONS) as f:
-            for raw in f:
-                try:
-                    ev = json.loads(raw)
-                    if ev.get("epoch", 0) < cutoff:
-                        continue
-                    hook = ev.get("hook", "")
-                    d = ev.get("decision", "allow")
-                    hook_totals[hook] = hook_totals.get(hook, 0) + 1
-                    for rn in HOOK_TO_RULES.get(hook, []):
-                        if rn in rule_hits:
-                            bucket = "block" if d in ("deny","block") else "warn" if d == "warn" else "allow"
-                            rule_hits[rn][bucket] += 1
-                except Exception:
-                    pass
+    def tally(hook, d, n=1):
+        hook_totals[hook] = hook_totals.get(hook, 0) + n
+        for rn in HOOK_TO_RULES.get(hook, []):
+            if rn in rule_hits:
+                bucket = "block" if d in ("deny","block") else "warn" if d == "warn" else "allow"
+                rule_hits[rn][bucket] += n
+
+    if has_log(HOOK_DECISIONS):
+        cutoff = clock() - 86400
+        if store.enabled(profile, cutoff):
+            for (hook, d), n in store.gate_counts(cutoff).items():
+                tally(hook, d, n)
+        else:
+            for ev in iter_events(HOOK_DECISIONS, since=cutoff, until=as_of()):
+                if ev.get("epoch", 0) < cutoff:
+                    continue
+                tally(ev.get("hook", ""), ev.get("decision", "allow"))
+
+    # JSON object keys are strings; keep the data the same either way
+    return {"rules": {str(rn): h for rn, h in rule_hits.items()}, "hooks": hook_totals}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color", "deep_sky_blue1"))
+    rule_hits = {int(rn): h for rn, h in data["rules"].items()}
+    hook_totals = data["hooks"]
 
     tbl = Table(show_header=False, box=None, padding=(0, 1), expand=True)
     tbl.add_column("num", width=7, no_wrap=True)
@@ -0,0 +1,172 @@
+"""Parallel full scan of large JSONL logs for cold start and rebuilds.
+
+The file is mmap'd and cut into newline-aligned byte ranges. Each range is
+aggregated in a worker process, and the partial results are merged in range
+order into one summary. Steady-state updates belong to eventlog's tail
+readers; `offset` in the result is where such a reader should take over.
+"""
+import json
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+BLOCK        = 4 * 1024 * 1024    # bytes sliced out of the map at a time
+MIN_PARALLEL = 32 * 1024 * 1024   # below this, worker startup costs more than it saves
+
+
+def _new():
+    return {"lines": 0, "bad": 0, "counts": {}, "decisions": {},
+            "hours": {}, "minutes": {}, "sessions": {}}
+
+
+def _fold(agg, raw, key, minutes_since=None):
+    try:
+        ev = json.loads(raw)
+    except ValueError:
+        ev = None
+    if not isinstance(ev, dict):
+        agg["bad"] += 1
+        return
+    agg["lines"] += 1
+    k = ev.get(key) or "?"
+    counts = agg["counts"]
+    counts[k] = counts.get(k, 0) + 1
+
+    d = ev.get("decision") or ev.get("verdict")
+    if d:
+        per = agg["decisions"].setdefault(k, {})
+        per[d] = per.get(d, 0) + 1
+
+    epoch = ev.get("epoch") or 0
+    if epoch:
+        hour = agg["hours"].setdefault(int(epoch // 3600) * 3600, {})
+        hour[k] = hour.get(k, 0) + 1
+        if minutes_since is not None and epoch >= minutes_since:
+            minute = agg["minutes"].setdefault(int(epoch // 60) * 60, {})
+            minute[k] = minute.get(k, 0) + 1
+
+    sid = ev.get("session_id")
+    if sid:
+        s = agg["sessions"].get(sid)
+        if s is None:
+            s = agg["sessions"][sid] = {"first": epoch, "last": epoch, "events": 0, "counts": {}}
+        s["events"] += 1
+        if epoch:
+            if not s["first"] or epoch < s["first"]:
+                s["first"] = epoch
+            if epoch > s["last"]:
+                s["last"] = epoch
+        s["counts"][k] = s["counts"].get(k, 0) + 1
+
+
+def _scan_range(path, start, end, key, minutes_since=None):
+    """Aggregate the complete lines in [start, end) of `path`."""
+    agg = _new()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = start
+        while pos < end:
+            stop = min(end, pos + BLOCK)
+            if stop < end:
+                nl = mm.rfind(b"\n", pos, stop)
+                stop = nl + 1 if nl >= 0 else (mm.find(b"\n", stop, end) + 1 or end)
+            for raw in mm[pos:stop].splitlines():
+                if raw:
+                    _fold(agg, raw, key, minutes_since)
+            pos = stop
+    return agg
+
+
+def split_ranges(path, parts):
+    """Cut `path` into up to `parts` byte ranges, each ending on a newline.
+
+    A trailing partial line (writer mid-append) is left out of every range.
+    """
+    size = os.path.getsize(path)
+    if not size:
+        return []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = mm.rfind(b"\n") + 1
+        bounds = [0]
+        for i in range(1, parts):
+            nl = mm.find(b"\n", max(bounds[-1], size * i // parts), end)
+            if nl < 0 or nl + 1 >= end:
+                break
+            bounds.append(nl + 1)
+    bounds.append(end)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def merge(parts):
+    """Merge partial aggregates in order; output keys are sorted."""
+    out = _new()
+    for p in parts:
+        out["lines"] += p["lines"]
+        out["bad"] += p["bad"]
+        for k, n in p["counts"].items():
+            out["counts"][k] = out["counts"].get(k, 0) + n
+        for k, per in p["decisions"].items():
+            dst = out["decisions"].setdefault(k, {})
+            for d, n in per.items():
+                dst[d] = dst.get(d, 0) + n
+        for field in ("hours", "minutes"):
+            for b, per in p[field].items():
+                dst = out[field].setdefault(b, {})
+                for k, n in per.items():
+                    dst[k] = dst.get(k, 0) + n
+        for sid, s in p["sessions"].items():
+            dst = out["sessions"].get(sid)
+            if dst is None:
+                out["sessions"][sid] = {**s, "counts": dict(s["counts"])}
+                continue
+            dst["events"] += s["events"]
+            if s["first"] and (not dst["first"] or s["first"] < dst["first"]):
+                dst["first"] = s["first"]
+            dst["last"] = max(dst["last"], s["last"])
+            for k, n in s["counts"].items():
+                dst["counts"][k] = dst["counts"].get(k, 0) + n
+
+    def ordered(d):
+        return {k: d[k] for k in sorted(d, key=str)}
+
+    out["counts"]    = ordered(out["counts"])
+    out["decisions"] = ordered({k: ordered(v) for k, v in out["decisions"].items()})
+    out["hours"]     = ordered({h: ordered(v) for h, v in out["hours"].items()})
+    out["minutes"]   = ordered({m: ordered(v) for m, v in out["minutes"].items()})
+    out["sessions"]  = ordered({sid: {**s, "counts": ordered(s["counts"])}
+                                for sid, s in out["sessions"].items()})
+    return out
+
+
+def scan(path, key="tool", workers=None, minutes_since=None):
+    """Aggregate a whole JSONL log: counts by `key`, decisions, hours, sessions.
+
+    `key` is "tool" for cc_events.jsonl and "hook" for hook_decisions.jsonl.
+    With `minutes_since`, events at or after that epoch are also counted
+    per minute.
+    Returns the merged summary plus `offset`, the byte just past the last
+    complete line, and `ino` so a tail reader can continue from there.
+    """
+    path = str(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {**_new(), "offset": 0, "ino": None}
+    workers = workers or os.cpu_count() or 1
+    if st.st_size < MIN_PARALLEL:
+        workers = 1
+    ranges = split_ranges(path, workers)
+    if len(ranges) <= 1:
+        parts = [_scan_range(path, a, b, key, minutes_since) for a, b in ranges]
+    else:
+        # spawn, not fork: scan() runs on collector threads, and a forked
+        # child can inherit a lock some other thread was holding
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(ranges), mp_context=ctx) as pool:
+            futs = [pool.submit(_scan_range, path, a, b, key, minutes_since)
+                    for a, b in ranges]
+            parts = [f.result() for f in futs]
+    out = merge(parts)
+    out["offset"] = ranges[-1][1] if ranges else 0
+    out["ino"] = st.st_ino
+    return out
@@ -0,0 +1,193 @@
+"""Collector daemon — one process collects, any number of dashboards render.
+
+    python3 mirrordash.py serve                     # listens on ~/.mirrordash/collector.sock
+    python3 mirrordash.py -p glass --connect        # renders from it
+
+Each client refresh sends one JSON line, {"profile": ..., "modules": [...]},
+over the Unix socket and gets one line back with every split module's data.
+Results are shared by collector key (module + PROFILE_KEYS values) and
+re-collected at most once per `interval` seconds however many clients ask.
+A stale entry is answered from its last result while the fresh one is
+collected in the background, so clients never wait on a collector after
+the first refresh. Each entry carries a sequence number that goes up when
+its data is replaced.
+
+Modules with only render(profile) produce panels, not data, so clients still
+build those themselves.
+"""
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+from . import collector
+from .core import DASH_DIR
+
+SOCKET   = DASH_DIR / "collector.sock"
+INTERVAL = 5.0    # seconds before a shared result is collected again
+TIMEOUT  = 30.0   # seconds a client waits for an answer
+
+
+class Shared:
+    """Collected results shared across clients, refreshed at most every `interval`."""
+
+    def __init__(self, interval=INTERVAL, workers=collector.WORKERS, processes=False):
+        self.interval = interval
+        self.tick     = collector.Tick({"collect_workers": workers,
+                                        "collect_processes": processes})
+        self.lock     = threading.RLock()   # done callbacks may run inline
+        self.entries  = {}   # key -> {"seq", "at", "pending", "last"}
+
+    def _finish(self, entry, f):
+        with self.lock:
+            entry["pending"] = None
+            entry["last"] = f
+            entry["seq"] += 1
+
+    def get(self, name, profile):
+        """(seq, done Future) for one module, or None if it has no collect()."""
+        mod = collector.load(name)
+        if mod is None or not collector.is_split(mod):
+            return None
+        k = collector.key(name, mod, profile)
+        with self.lock:
+            e = self.entries.get(k)
+            if e is None:
+                e = self.entries[k] = {"seq": 0, "at": 0.0, "pending": None, "last": None}
+            now = time.monotonic()
+            if e["pending"] is None and now - e["at"] >= self.interval:
+                e["at"] = now
+                f = e["pending"] = self.tick.submit(name, mod, profile)
+                f.add_done_callback(lambda f, e=e: self._finish(e, f))
+            last, pending, seq = e["last"], e["pending"], e["seq"]
+        if last is None:
+            # Nothing collected yet: this caller waits for the first result
+            pending.exception()
+            return seq + 1, pending
+        return seq, last
+
+    def answer(self, profile, names):
+        out = {}
+        for name in dict.fromkeys(names):
+            hit = self.get(name, profile)
+            if hit is None:
+                continue
+            seq, f = hit
+            err = f.exception()
+            out[name] = ({"seq": seq, "error": f"{type(err).__name__}: {err}"} if err
+                         else {"seq": seq, "data": f.result()})
+        return {"modules": out}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                req = json.loads(line)
+            except ValueError:
+                return
+            reply = self.server.shared.answer(req.get("profile") or {}, req.get("modules") or [])
+            self.wfile.write(json.dumps(reply, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def _in_use(path):
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        s.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+
+def serve(path=SOCKET, interval=INTERVAL, workers=collector.WORKERS, processes=False):
+    """Run the daemon until interrupted. Refuses to start over a live one."""
+    path = Path(path)
+    if path.exists():
+        if _in_use(path):
+            raise RuntimeError(f"a collector is already serving on {path}")
+        path.unlink()   # left behind by a daemon that died
+    path.parent.mkdir(parents=True, exist_ok=True)
+    server = _Server(str(path), _Handler)
+    os.chmod(path, 0o600)
+    server.shared = Shared(interval, workers, processes)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+class Client:
+    """Connection to the daemon; reconnects on the next fetch after a failure."""
+
+    def __init__(self, path=SOCKET, timeout=TIMEOUT):
+        self.path    = Path(path)
+        self.timeout = timeout
+        self._file   = None
+
+    def close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def fetch(self, profile, names):
+        """The daemon's answer for `names`, or None if it can't be reached."""
+        try:
+            if self._file is None:
+                s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                s.settimeout(self.timeout)
+                try:
+                    s.connect(str(self.path))
+                except OSError:
+                    s.close()
+                    raise
+                self._file = s.makefile("rwb")
+                s.close()   # the file object keeps the connection open
+            req = {"profile": profile, "modules": list(names)}
+            self._file.write(json.dumps(req, default=str).encode() + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+            if not line:
+                raise OSError("collector closed the connection")
+            return json.loads(line)
+        except (OSError, ValueError):
+            self.close()
+            return None
+
+
+class RemoteTick(collector.Tick):
+    """A Tick filled from the daemon; anything it doesn't serve is collected here."""
+
+    def __init__(self, client, profile=None):
+        super().__init__(profile)
+        self.client    = client
+        self.connected = False
+        self.seqs      = {}   # module name -> daemon sequence number
+
+    def start(self, names, profile):
+        reply = self.client.fetch(profile, names)
+        if reply is not None:
+            self.connected = True
+            for name, entry in reply["modules"].items():
+                f = Future()
+                if "error" in entry:
+                    f.set_exception(RuntimeError(entry["error"]))
+                else:
+                    f.set_result(entry["data"])
+                self.results[collector.key(name, collector.load(name), profile)] = f
+                self.seqs[name] = entry["seq"]
+        return super().start(names, profile)
@@ -1,46 +1,64 @@
 """Services module — port/process health check."""
 import socket
+import time
 from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr, DASH_DIR, _run
+from .core import clr, DASH_DIR, _run, read_cached
 
 SERVICES_FILE = DASH_DIR / "services.yaml"
 
+PROFILE_KEYS = ()
+
 _DEFAULTS = [
     {"name": "localhost:8080", "port": 8080},
 ]
 
 
 def _load_services():
-    if not SERVICES_FILE.exists():
-        return _DEFAULTS
-    try:
-        import yaml
-        return yaml.safe_load(SERVICES_FILE.read_text()) or _DEFAULTS
-    except Exception:
-        return _DEFAULTS
+    return read_cached(SERVICES_FILE) or _DEFAULTS
 
 
 def _check(port):
+    """Seconds to connect, or None if nothing answers."""
+    start = time.monotonic()
     try:
         with socket.create_connection(("localhost", port), timeout=0.5):
-            return True
+            return time.monotonic() - start
     except Exception:
-        return False
+        return None
 
 
-def render(profile):
-    color = clr(profile.get("color"))
+def collect(profile):
     services = _load_services()
+    checked = []
+    for svc in services[:12]:
+        port = svc.get("port")
+        latency = _check(port) if port else None
+        checked.append({"name": svc.get("name", str(svc.get("port", "?"))), "port": port,
+                        "up": latency is not None, "latency": latency})
+    return {"services": checked, "total": len(services),
+            "configured": SERVICES_FILE.exists()}
+
+
+def metrics(data):
+    labels = [({"service": s["name"], "port": s["port"]}, s) for s in data["services"]]
+    return [
+        ("mirrordash_service_up", "1 if the service's port accepts connections",
+         [(l, int(s["up"])) for l, s in labels]),
+        ("mirrordash_service_latency_seconds", "Time to connect to the service's port",
+         [(l, s["latency"]) for l, s in labels if s["up"]]),
+    ]
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color"))
 
     t = Text()
     up = 0
-    for svc in services[:12]:
-        name = svc.get("name", str(svc.get("port", "?")))
-        port = svc.get("port")
-        ok = _check(port) if port else False
+    for svc in data["services"]:
+        name, port, ok = svc["name"], svc["port"], svc["up"]
         if ok:
             up += 1
         dot = "[green]●[/]" if ok else "[red]●[/]"
@@ -52,10 +70,10 @@ def render(profile):
             t.append(f" :{port}", style="grey30")
         t.append("\n")
 
-    total = len(services)
+    total = data["total"]
     t.append(f"\n  {up}/{total} up", style="green" if up == total else "yellow")
 
-    if not SERVICES_FILE.exists():
+    if not data["configured"]:
         t.append("  — configure ~/.mirrordash/services.yaml\n", style="grey30")
 
     frame = profile.get("_frame", 0)
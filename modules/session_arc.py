@@ -1,13 +1,10 @@
 """Session Arc — horizontal timeline of this session's tool calls as colored blocks."""
 import json
-import time
-from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr
+from .core import clr, HOME, LOOKBACK, as_of, clock
+from .eventlog import iter_backward, iter_events, has_log
+from . import summaries
 
-CC_EVENTS = Path.home() / ".mirrordna/bus/cc_events.jsonl"
+CC_EVENTS = HOME / ".mirrordna/bus/cc_events.jsonl"
 
 READ_TOOLS   = {"Read", "Glob", "Grep"}
 WRITE_TOOLS  = {"Write", "Edit"}
@@ -15,6 +12,8 @@ EXEC_TOOLS   = {"Bash"}
 WEB_TOOLS    = {"WebFetch", "WebSearch"}
 AGENT_TOOLS  = {"Task", "TaskOutput"}
 
+PROFILE_KEYS = ()
+
 
 def _tool_color(tool: str) -> str:
     if tool in READ_TOOLS:   return "cyan"
@@ -36,23 +35,18 @@ def _tool_char(tool: str) -> str:
     return "·"
 
 
-def render(profile):
-    color = clr(profile.get("color", "deep_sky_blue1"))
-
-    if not CC_EVENTS.exists():
-        return Panel(Text("  No session events.", style="grey50"),
-                     title=f"[{color}]SESSION ARC[/{color}]",
-                     border_style="grey30", box=box.SIMPLE_HEAD)
+def collect(profile):
+    """This session's tool counts, a sampled timeline, phases and the session before."""
+    if not has_log(CC_EVENTS):
+        return None
 
     # Load current session — use last session_id or last 2 hours
     events = []
-    cutoff = time.time() - 7200
-    with open(CC_EVENTS) as f:
-        all_lines = list(f)
-
+    cutoff = clock() - 7200
     # Find current session_id from most recent event
     session_id = None
-    for raw in reversed(all_lines):
+    at = as_of()
+    for raw in iter_backward(CC_EVENTS, until=at):
         try:
             ev = json.loads(raw)
             sid = ev.get("session_id", "")
@@ -62,54 +56,90 @@ def render(profile):
         except Exception:
             pass
 
-    # Collect this session's events
-    for raw in all_lines:
-        try:
-            ev = json.loads(raw)
-            if session_id and ev.get("session_id") == session_id:
+    # Collect this session's events — the id as a byte needle skips the rest.
+    # In the past, only the LOOKBACK before that instant is searched.
+    if session_id:
+        since = at - LOOKBACK if at is not None else None
+        for ev in iter_events(CC_EVENTS, since=since, match=(session_id.encode(),), until=at):
+            if ev.get("session_id") == session_id:
                 events.append(ev)
-            elif not session_id and ev.get("epoch", 0) >= cutoff:
-                events.append(ev)
-        except Exception:
-            pass
+    else:
+        events = [ev for ev in iter_events(CC_EVENTS, since=cutoff, until=at)
+                  if ev.get("epoch", 0) >= cutoff]
+
+    if not events:
+        return {"total": 0}
+
+    # Stats
+    total = len(events)
+    tools = [e.get("tool", "?") for e in events]
+    data = {
+        "total":  total,
+        "reads":  sum(1 for t in tools if t in READ_TOOLS),
+        "writes": sum(1 for t in tools if t in WRITE_TOOLS),
+        "execs":  sum(1 for t in tools if t in EXEC_TOOLS),
+        "mobile": sum(1 for t in tools if "mobile" in t.lower()),
+    }
+
+    # Timeline — compress to terminal width (max 80 chars)
+    max_blocks = 76
+    step = max(1, total // max_blocks)
+    data["timeline"] = tools if total <= max_blocks else tools[::step]
+
+    # Phase detection — find where activity clusters
+    data["phases"] = []
+    if total >= 10:
+        chunk = total // 3
+        phases = [tools[:chunk], tools[chunk:2*chunk], tools[2*chunk:]]
+        for phase, label in zip(phases, ["EARLY", "MID", "LATE"]):
+            if not phase:
+                continue
+            dominant = {}
+            for tool in phase:
+                k = _tool_char(tool)
+                dominant[k] = dominant.get(k, 0) + 1
+            top = sorted(dominant.items(), key=lambda x: -x[1])[:2]
+            data["phases"].append((label, "+".join(k for k, _ in top)))
+
+    # Previous session, from the materialized summaries
+    summaries.update()
+    data["previous"] = next((s for s in summaries.load(2, until=at)
+                             if s["session_id"] != session_id), None)
+    return data
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color", "deep_sky_blue1"))
+
+    if data is None:
+        return Panel(Text("  No session events.", style="grey50"),
+                     title=f"[{color}]SESSION ARC[/{color}]",
+                     border_style="grey30", box=box.SIMPLE_HEAD)
 
     t = Text()
 
-    if not events:
+    if not data["total"]:
         t.append("  No events this session.\n", style="grey50")
         return Panel(t, title=f"[{color}]SESSION ARC[/{color}]",
                      border_style=color, box=box.HEAVY_HEAD, padding=(0, 1))
 
-    # Stats
-    total = len(events)
-    reads  = sum(1 for e in events if e.get("tool") in READ_TOOLS)
-    writes = sum(1 for e in events if e.get("tool") in WRITE_TOOLS)
-    execs  = sum(1 for e in events if e.get("tool") in EXEC_TOOLS)
-    mobile = sum(1 for e in events if "mobile" in e.get("tool","").lower())
-
     t.append(f"  ", style="grey50")
-    t.append(f"{total}", style="bold white")
+    t.append(f"{data['total']}", style="bold white")
     t.append(f" tool calls   ", style="grey50")
-    t.append(f"R:", style="grey50"); t.append(f"{reads} ", style="bold cyan")
-    t.append(f"W:", style="grey50"); t.append(f"{writes} ", style="bold yellow")
-    t.append(f"X:", style="grey50"); t.append(f"{execs} ", style="bold green")
-    if mobile:
-        t.append(f"M:", style="grey50"); t.append(f"{mobile} ", style="bold bright_magenta")
+    t.append(f"R:", style="grey50"); t.append(f"{data['reads']} ", style="bold cyan")
+    t.append(f"W:", style="grey50"); t.append(f"{data['writes']} ", style="bold yellow")
+    t.append(f"X:", style="grey50"); t.append(f"{data['execs']} ", style="bold green")
+    if data["mobile"]:
+        t.append(f"M:", style="grey50"); t.append(f"{data['mobile']} ", style="bold bright_magenta")
     t.append("\n\n")
 
-    # Timeline bar — compress to terminal width (max 80 chars)
-    max_blocks = 76
-    step = max(1, total // max_blocks)
+    # Timeline bar
     t.append("  ", style="")
-
-    for i, ev in enumerate(events):
-        if i % step != 0 and total > max_blocks:
-            continue
-        tool = ev.get("tool", "?")
-        char = _tool_char(tool)
-        c = _tool_color(tool)
-        t.append(char, style=c)
-
+    for tool in data["timeline"]:
+        t.append(_tool_char(tool), style=_tool_color(tool))
     t.append("\n\n")
 
     # Legend
@@ -120,25 +150,24 @@ def render(profile):
         t.append(f"={label}  ", style="grey42")
     t.append("\n")
 
-    # Phase detection — find where activity clusters
-    if total >= 10:
-        chunk = total // 3
-        phases = [events[:chunk], events[chunk:2*chunk], events[2*chunk:]]
-        phase_labels = ["EARLY", "MID", "LATE"]
+    if data["phases"]:
         t.append("\n  PHASES   ", style="grey30")
-        for phase, label in zip(phases, phase_labels):
-            if not phase:
-                continue
-            dominant = {}
-            for ev in phase:
-                tool = ev.get("tool", "?")
-                k = _tool_char(tool)
-                dominant[k] = dominant.get(k, 0) + 1
-            top = sorted(dominant.items(), key=lambda x: -x[1])[:2]
-            top_str = "+".join(k for k, _ in top)
+        for label, top_str in data["phases"]:
             t.append(f"{label}:{top_str}  ", style="grey50")
         t.append("\n")
 
+    prev = data["previous"]
+    if prev:
+        rw = prev["rw_ratio"]
+        t.append("\n  PREVIOUS ", style="grey30")
+        t.append(f"{prev['events']} calls  ", style="grey50")
+        t.append(f"R:W {rw:.1f}x  " if rw is not None else "R:W —  ", style="grey50")
+        if prev["blocks"] or prev["warns"]:
+            t.append(f"✗{prev['blocks']} !{prev['warns']}  ", style="yellow")
+        if prev["score"] is not None:
+            t.append(f"score {prev['score']}/10", style="grey50")
+        t.append("\n")
+
     return Panel(t,
                  title=f"[{color}]SESSION ARC[/{color}]",
                  border_style=color, box=box.HEAVY_HEAD, padding=(0, 1))
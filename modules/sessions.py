@@ -0,0 +1,159 @@
+"""Sessions — the current session against the last N: duration, tool mix,
+read/write ratio, gate hits and self-critique score per session."""
+from datetime import datetime
+from .core import as_of, clock, clr
+from . import summaries
+
+SORTS = {
+    "recent":   lambda r: -r["end"],
+    "duration": lambda r: -(r["end"] - r["start"]),
+    "events":   lambda r: -r["events"],
+    "blocks":   lambda r: -(r["blocks"] * 1000 + r["warns"]),
+    "score":    lambda r: r["score"] if r["score"] is not None else 99,
+}
+
+MIX = [("read", "R", "cyan"), ("write", "W", "yellow"), ("exec", "X", "green"),
+       ("web", "N", "blue"), ("agent", "A", "magenta"), ("mobile", "M", "bright_magenta")]
+
+PROFILE_KEYS = ("sessions_limit",)
+
+_shown = 0   # renders so far; long lists show their next page each time
+
+
+def _rows(limit):
+    """Open sessions plus the last `limit` closed ones, newest first.
+
+    Summary records are used when the sidecar can be maintained; otherwise
+    one bounded group-by pass over the raw events. Open ones have `open` set.
+    """
+    try:
+        summaries.update()
+    except OSError:
+        now = clock()
+        return [{**r, "open": now - r["end"] < summaries.IDLE} for r in summaries.group_by(limit)]
+    at = as_of()
+    if at is not None:
+        running, done = summaries.open_at(at), summaries.load(limit, until=at)
+    else:
+        running, done = summaries.open_sessions(), summaries.load(limit)
+    return ([{**r, "open": True} for r in running] + done)[:limit]
+
+
+def _dur(seconds):
+    m = int(seconds // 60)
+    return f"{m // 60}h{m % 60:02d}" if m >= 60 else f"{m}m"
+
+
+def _mix(tools, width=10):
+    from rich.text import Text
+    t = Text()
+    total = sum(tools.values())
+    if not total:
+        return t.append("·" * width, style="grey23")
+    used = 0
+    for key, char, c in MIX:
+        n = round(tools.get(key, 0) / total * width)
+        n = min(n, width - used)
+        t.append(char * n, style=c)
+        used += n
+    t.append("·" * (width - used), style="grey30")
+    return t
+
+
+def _avg(rows, key):
+    vals = [r[key] for r in rows if r[key] is not None]
+    return sum(vals) / len(vals) if vals else None
+
+
+def _cmp(t, label, cur, avg, fmt):
+    t.append(f"  {label} ", style="grey50")
+    t.append(fmt(cur) if cur is not None else "—", style="bold white")
+    t.append(f" ({fmt(avg) if avg is not None else '—'})", style="grey42")
+
+
+def collect(profile):
+    """The current session followed by up to `sessions_limit` before it."""
+    rows = _rows(profile.get("sessions_limit", 20) + 1)
+    for r in rows:
+        r["duration"] = r["end"] - r["start"] if r["start"] else 0
+    return {"rows": rows}
+
+
+def render(data, profile):
+    global _shown
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich.console import Group
+    from rich import box
+    color = clr(profile.get("color", "deep_sky_blue1"))
+    page_size = profile.get("sessions_page_size", 8)
+    sort = profile.get("sessions_sort", "recent")
+
+    rows = data["rows"]
+    if not rows:
+        return Panel(Text("  No sessions logged yet.", style="grey50"),
+                     title=f"[{color}]SESSIONS[/{color}]",
+                     border_style="grey30", box=box.SIMPLE_HEAD)
+
+    current = rows[0] if rows[0].get("open") else None
+    past = rows[1:] if current else rows
+    cur = current or dict.fromkeys(("events", "duration", "rw_ratio", "score"))
+
+    # Current vs the average of the sessions before it
+    head = Text()
+    head.append(f"  {'NOW' if current else 'NONE OPEN'} vs LAST {len(past)}\n", style=f"bold {color}")
+    _cmp(head, "calls", cur["events"], _avg(past, "events"), lambda v: f"{v:.0f}")
+    _cmp(head, "dur", cur["duration"], _avg(past, "duration"), _dur)
+    _cmp(head, "R:W", cur["rw_ratio"], _avg(past, "rw_ratio"), lambda v: f"{v:.1f}x")
+    _cmp(head, "score", cur["score"], _avg(past, "score"), lambda v: f"{v:.1f}")
+    head.append("\n")
+
+    ordered = sorted(rows, key=SORTS.get(sort, SORTS["recent"]))
+    pages = max(1, -(-len(ordered) // page_size))
+    page = profile.get("sessions_page", _shown) % pages
+    _shown += 1
+
+    tbl = Table(box=None, padding=(0, 1), expand=True, header_style="grey42")
+    tbl.add_column("session", no_wrap=True)
+    tbl.add_column("start",   width=11, no_wrap=True)
+    tbl.add_column("dur",     width=5,  no_wrap=True, justify="right")
+    tbl.add_column("calls",   width=5,  no_wrap=True, justify="right")
+    tbl.add_column("mix",     width=10, no_wrap=True)
+    tbl.add_column("R:W",     width=5,  no_wrap=True, justify="right")
+    tbl.add_column("gates",   width=7,  no_wrap=True)
+    tbl.add_column("score",   width=5,  no_wrap=True, justify="right")
+
+    for r in ordered[page * page_size:(page + 1) * page_size]:
+        live = r is current
+        start = datetime.fromtimestamp(r["start"]).strftime("%m-%d %H:%M") if r["start"] else "?"
+        rw = r["rw_ratio"]
+        gates = Text()
+        if r["blocks"]:
+            gates.append(f"✗{r['blocks']} ", style="red")
+        if r["warns"]:
+            gates.append(f"!{r['warns']}", style="yellow")
+        if not gates:
+            gates.append("·", style="grey30")
+        score = r["score"]
+        sc = "grey30" if score is None else "green" if score >= 7 else "yellow" if score >= 4 else "red"
+        tbl.add_row(
+            Text(("▶ " if live else "  ") + r["session_id"][:14],
+                 style=f"bold {color}" if live else "grey70"),
+            Text(start, style="grey50"),
+            Text(_dur(r["duration"]), style="grey70"),
+            Text(str(r["events"]), style="grey85"),
+            _mix(r["tools"]),
+            Text(f"{rw:.1f}" if rw is not None else "—",
+                 style="red" if rw is not None and rw < 1 else "grey70"),
+            gates,
+            Text(f"{score}" if score is not None else "—", style=sc),
+        )
+
+    foot = Text()
+    if pages > 1:
+        foot.append(f"\n  page {page + 1}/{pages} · sorted by {sort}", style="grey30")
+
+    return Panel(Group(head, tbl, foot),
+                 title=f"[{color}]SESSIONS[/{color}]",
+                 border_style=color, box=box.HEAVY_HEAD, padding=(0, 1))
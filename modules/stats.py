@@ -0,0 +1,65 @@
+"""Constant-time running statistics for metrics that grow with history.
+
+Welford keeps mean and variance in one pass without storing the values.
+Windowed keeps the same over the last `size` slots, removing each value as
+it leaves the window; a slot may be empty.
+"""
+import math
+from collections import deque
+
+
+class Welford:
+    """Running mean and population variance (Welford, 1962)."""
+
+    def __init__(self):
+        self.n    = 0
+        self.mean = 0.0
+        self._m2  = 0.0
+
+    def add(self, x):
+        self.n += 1
+        d = x - self.mean
+        self.mean += d / self.n
+        self._m2 += d * (x - self.mean)
+
+    def remove(self, x):
+        """Undo an earlier add(x)."""
+        if self.n <= 1:
+            self.n, self.mean, self._m2 = 0, 0.0, 0.0
+            return
+        d = x - self.mean
+        self.n -= 1
+        self.mean -= d / self.n
+        self._m2 = max(0.0, self._m2 - d * (x - self.mean))
+
+    @property
+    def var(self):
+        return self._m2 / self.n if self.n else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.var)
+
+    def cv(self):
+        """Coefficient of variation σ/μ; None without data, 0.0 for one value."""
+        if not self.n:
+            return None
+        if self.n < 2 or self.mean <= 0:
+            return 0.0
+        return self.std / self.mean
+
+
+class Windowed(Welford):
+    """Welford over the values in the last `size` slots only."""
+
+    def __init__(self, size):
+        super().__init__()
+        self.values = deque(maxlen=size)
+
+    def add(self, x):
+        """Fill the next slot with `x`; None leaves it empty."""
+        if len(self.values) == self.values.maxlen and self.values[0] is not None:
+            super().remove(self.values[0])
+        self.values.append(x)
+        if x is not None:
+            super().add(x)
@@ -0,0 +1,280 @@
+"""Optional SQLite rollup store for the bus logs.
+
+Enabled per profile with `store: true`. sync() folds lines appended to
+cc_events and hook_decisions since the previous sync into per-minute and
+per-hour rollups in ~/.mirrordash/events.db. The ingest cursor
+lives in the database too, so a restart picks up where the last run stopped
+instead of rescanning history. Window queries then read a few hundred indexed
+rows. Modules keep their raw-log path as the fallback when the store is off.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from itertools import chain
+
+from .core import DASH_DIR, HOME, clock
+from .eventlog import LineTail, event_epoch, iter_lines, segments
+from . import scan
+
+DB_PATH        = DASH_DIR / "events.db"
+BUS_DIR        = HOME / ".mirrordna/bus"
+CC_EVENTS      = BUS_DIR / "cc_events.jsonl"
+HOOK_DECISIONS = BUS_DIR / "hook_decisions.jsonl"
+
+MINUTE_RETAIN = 2 * 86400   # per-minute rows older than this are dropped
+BATCH         = 20000       # lines folded in memory between executemany flushes
+SYNC_EVERY    = 1.0         # seconds — queries within one tick share a sync
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cursors (source TEXT PRIMARY KEY, ino INTEGER, offset INTEGER);
+CREATE TABLE IF NOT EXISTS tool_min  (ts INTEGER, tool TEXT, n INTEGER,
+                                      PRIMARY KEY (ts, tool)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS tool_hour (ts INTEGER, tool TEXT, n INTEGER,
+                                      PRIMARY KEY (ts, tool)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS gate_min  (ts INTEGER, hook TEXT, decision TEXT, n INTEGER,
+                                      PRIMARY KEY (ts, hook, decision)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS gate_hour (ts INTEGER, hook TEXT, decision TEXT, n INTEGER,
+                                      PRIMARY KEY (ts, hook, decision)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL);
+INSERT OR IGNORE INTO meta VALUES ('minutes_from', 0);
+"""
+
+UPSERT = {
+    "tool_min":      "INSERT INTO tool_min VALUES (?,?,?) "
+                     "ON CONFLICT DO UPDATE SET n = n + excluded.n",
+    "tool_hour":     "INSERT INTO tool_hour VALUES (?,?,?) "
+                     "ON CONFLICT DO UPDATE SET n = n + excluded.n",
+    "gate_min":      "INSERT INTO gate_min VALUES (?,?,?,?) "
+                     "ON CONFLICT DO UPDATE SET n = n + excluded.n",
+    "gate_hour":     "INSERT INTO gate_hour VALUES (?,?,?,?) "
+                     "ON CONFLICT DO UPDATE SET n = n + excluded.n",
+}
+
+# source -> (log path, tables rebuilt from it)
+SOURCES = {
+    "tools":     (CC_EVENTS, ("tool_min", "tool_hour")),
+    "gates":     (HOOK_DECISIONS, ("gate_min", "gate_hour")),
+}
+
+_lock      = threading.RLock()
+_conn      = None
+_failed    = False
+_last_sync = 0.0
+
+
+def enabled(profile, since=None):
+    """True if the profile asked for the store and it could be opened.
+
+    With `since`, also that windows starting then are still exact: past
+    MINUTE_RETAIN, as with --at days back, their minutes are gone and the
+    caller should read the raw log instead.
+    """
+    if not profile.get("store") or _db() is None:
+        return False
+    if since is None:
+        return True
+    with _lock:
+        return since >= _minutes_from(_conn)
+
+
+def _db():
+    global _conn, _failed
+    if _conn is None and not _failed:
+        try:
+            DASH_DIR.mkdir(exist_ok=True)
+            conn = sqlite3.connect(str(DB_PATH), timeout=10, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            _conn = conn
+        except sqlite3.Error:
+            _failed = True
+    return _conn
+
+
+# ── Ingest ───────────────────────────────────────────────────────────────────
+
+def _stat(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _pending(path, cursor):
+    """(raw lines, tail, rebuild) for what `cursor` has not yet seen.
+
+    The cursor is (inode, offset) of the live file at the last sync. If the
+    file was compacted since, that inode is now `.1`: finish it, then read
+    the new live file from the start. Anything else means the history the
+    rollups were built from is gone, so the source is rebuilt from scratch.
+    """
+    path = str(path)
+    if cursor:
+        ino, offset = cursor
+        st = _stat(path)
+        if ino is None or (st and st.st_ino == ino and st.st_size >= offset):
+            tail = LineTail(path)
+            if ino is not None:
+                tail.resume(ino, offset)
+            return tail.iter_raw(), tail, False
+        st1 = _stat(f"{path}.1")
+        if st1 and st1.st_ino == ino and st1.st_size >= offset:
+            prev, tail = LineTail(f"{path}.1"), LineTail(path)
+            prev.resume(ino, offset)
+            return chain(prev.iter_raw(), tail.iter_raw()), tail, False
+    tail = LineTail(path, history=True)
+    return tail.iter_raw(), tail, True
+
+
+def _minutes_from(conn):
+    """Hour where per-minute rows start; minutes before it have been purged."""
+    return conn.execute("SELECT value FROM meta WHERE key = 'minutes_from'").fetchone()[0]
+
+
+def _bump(d, key, n=1):
+    d[key] = d.get(key, 0) + n
+
+
+def _fold_tools(acc, ev, floor):
+    tool = ev.get("tool") or "?"
+    epoch = event_epoch(ev, None)
+    if epoch:
+        if epoch >= floor:
+            _bump(acc["tool_min"], (int(epoch // 60) * 60, tool))
+        _bump(acc["tool_hour"], (int(epoch // 3600) * 3600, tool))
+
+
+def _fold_gates(acc, ev, floor):
+    hook = ev.get("hook") or "?"
+    decision = str(ev.get("decision") or ev.get("verdict") or "allow").lower()
+    epoch = event_epoch(ev, None)
+    if epoch:
+        if epoch >= floor:
+            _bump(acc["gate_min"], (int(epoch // 60) * 60, hook, decision))
+        _bump(acc["gate_hour"], (int(epoch // 3600) * 3600, hook, decision))
+
+
+FOLD = {"tools": _fold_tools, "gates": _fold_gates}
+
+
+def _flush(conn, acc):
+    for table, rows in acc.items():
+        if rows:
+            conn.executemany(UPSERT[table], (k + (n,) for k, n in rows.items()))
+            rows.clear()
+
+
+def _fold_scan(conn, out):
+    """Write a scan.scan() summary of cc_events into the tools tables."""
+    conn.executemany(UPSERT["tool_hour"], ((h, tool, n) for h, per in out["hours"].items()
+                                           for tool, n in per.items()))
+    conn.executemany(UPSERT["tool_min"], ((m, tool, n) for m, per in out["minutes"].items()
+                                          for tool, n in per.items()))
+
+
+def _ingest(conn, source, floor):
+    path, tables = SOURCES[source]
+    row = conn.execute("SELECT ino, offset FROM cursors WHERE source = ?", (source,)).fetchone()
+    raws, tail, rebuild = _pending(path, row)
+    if rebuild:
+        for table in tables:
+            conn.execute(f"DELETE FROM {table}")
+        st = _stat(path)
+        if source == "tools" and st and st.st_size >= scan.MIN_PARALLEL:
+            # Rotated segments stream through the fold below; the big live
+            # file goes through the parallel scanner instead.
+            out = scan.scan(path, key="tool", minutes_since=floor)
+            _fold_scan(conn, out)
+            tail = LineTail(str(path))
+            tail.resume(out["ino"], out["offset"])
+            rotated = (iter_lines(seg) for seg in segments(path)[:-1])
+            raws = chain(chain.from_iterable(rotated), tail.iter_raw())
+
+    fold, acc, n = FOLD[source], {t: {} for t in tables}, 0
+    for raw in raws:
+        try:
+            ev = json.loads(raw)
+        except ValueError:
+            continue
+        if isinstance(ev, dict):
+            fold(acc, ev, floor)
+            n += 1
+            if n % BATCH == 0:
+                _flush(conn, acc)
+    _flush(conn, acc)
+    conn.execute("INSERT OR REPLACE INTO cursors VALUES (?,?,?)", (source, tail.ino, tail.offset))
+
+
+def sync(force=False):
+    """Fold new log lines into the rollups, at most once per SYNC_EVERY."""
+    global _last_sync
+    conn = _db()
+    if conn is None:
+        return False
+    with _lock:
+        now = time.monotonic()
+        if not force and now - _last_sync < SYNC_EVERY:
+            return True
+        _last_sync = now
+        # Hour-aligned and never moved back, so --at cannot pretend purged
+        # minutes are still there
+        floor = max(int(clock() - MINUTE_RETAIN) // 3600 * 3600, _minutes_from(conn))
+        for source in SOURCES:
+            # One write transaction per source — the cursor moves with the rows,
+            # so dashboards sharing the database never double-count.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                _ingest(conn, source, floor)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        conn.execute("INSERT OR REPLACE INTO meta VALUES ('minutes_from', ?)", (floor,))
+        conn.execute("DELETE FROM tool_min WHERE ts < ?", (floor,))
+        conn.execute("DELETE FROM gate_min WHERE ts < ?", (floor,))
+    return True
+
+
+# ── Queries ──────────────────────────────────────────────────────────────────
+
+def _window(table, cols, since, until=None):
+    """Rows of SUM(n) grouped by `cols` over [since, until).
+
+    Whole hours come from `<table>_hour` and the ragged edges from
+    `<table>_min`, so the answer is exact to one minute inside MINUTE_RETAIN.
+    """
+    sync()
+    until = clock() if until is None else until
+    h0 = -(-int(since) // 3600) * 3600
+    h1 = int(until) // 3600 * 3600
+    parts, args = [], []
+    if h0 < h1:
+        parts.append(f"SELECT {cols}, n FROM {table}_hour WHERE ts >= ? AND ts < ?")
+        args += [h0, h1]
+        edges = [(since, h0), (h1, until)]
+    else:
+        edges = [(since, until)]
+    for a, b in edges:
+        if b > a:
+            parts.append(f"SELECT {cols}, n FROM {table}_min WHERE ts >= ? AND ts < ?")
+            args += [int(a), b]
+    if not parts:
+        return []
+    sql = f"SELECT {cols}, SUM(n) FROM ({' UNION ALL '.join(parts)}) GROUP BY {cols}"
+    with _lock:
+        return _conn.execute(sql, args).fetchall()
+
+
+def gate_counts(since, until=None):
+    """{(hook, decision): n} for gate decisions in [since, until)."""
+    return {(hook, d): n for hook, d, n in _window("gate", "hook, decision", since, until)}
+
+
+def tool_counts(since, until=None):
+    """{tool: n} for tool calls in [since, until)."""
+    return {tool: n for tool, n in _window("tool", "tool", since, until)}
+
@@ -0,0 +1,379 @@
+"""Per-session summary records, materialized to ~/.mirrordash/sessions.jsonl.
+
+update() follows cc_events and folds each session's events into an open
+accumulator. A session that has been quiet for IDLE seconds is closed: the
+gate blocks and warns inside its [start, end] window and its self-critique
+score are joined in, and one summary line is appended to the sidecar.
+Cross-session views read those lines instead of raw events.
+
+Read positions and open accumulators are checkpointed to sessions.state.json,
+so a restart resumes where the last run stopped. Several dashboards may share
+these files: update() holds an flock on sessions.lock and first adopts any
+state another process saved, so each session is closed and written once.
+
+For an instant in the past, load(until=T) gives the sessions closed by then
+and open_at(T) folds the ones still running from the LOOKBACK before it.
+"""
+import bisect
+import fcntl
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from .core import DASH_DIR, HOME, LOOKBACK, clock
+from .eventlog import (JsonlTail, event_epoch, iter_backward, iter_events,
+                       read_backward, segments)
+from . import scan
+
+CC_EVENTS      = HOME / ".mirrordna/bus/cc_events.jsonl"
+HOOK_DECISIONS = HOME / ".mirrordna/bus/hook_decisions.jsonl"
+SELF_CRITIQUE  = HOME / ".mirrordna/self_critique.jsonl"
+SIDECAR        = DASH_DIR / "sessions.jsonl"
+STATE          = DASH_DIR / "sessions.state.json"
+LOCK           = DASH_DIR / "sessions.lock"
+
+IDLE = 1800   # seconds without an event before a session counts as ended
+
+READ_TOOLS   = {"Read", "Glob", "Grep"}
+WRITE_TOOLS  = {"Write", "Edit"}
+EXEC_TOOLS   = {"Bash"}
+WEB_TOOLS    = {"WebFetch", "WebSearch"}
+AGENT_TOOLS  = {"Task", "TaskOutput"}
+CATEGORIES   = ("read", "write", "exec", "web", "agent", "mobile", "other")
+
+_lock    = threading.Lock()
+_events  = JsonlTail(str(CC_EVENTS), history=True)
+_gates   = JsonlTail(str(HOOK_DECISIONS), history=True)
+_crit    = JsonlTail(str(SELF_CRITIQUE))
+_open    = {}      # session_id -> accumulator
+_hits    = []      # sorted (epoch, is_block) for gate blocks/warns
+_scores  = {}      # session_id -> self-critique score
+_closed  = None    # session ids already in the sidecar
+_newest  = 0.0     # latest event epoch seen
+_stamp   = None    # (ino, mtime_ns, size) of STATE as this process last saw it
+_open_at = (None, [])   # (t, open_at(t)) for the last instant asked about
+
+
+def category(tool):
+    if tool in READ_TOOLS:   return "read"
+    if tool in WRITE_TOOLS:  return "write"
+    if tool in EXEC_TOOLS:   return "exec"
+    if tool in WEB_TOOLS:    return "web"
+    if tool in AGENT_TOOLS:  return "agent"
+    if "mobile" in tool.lower(): return "mobile"
+    return "other"
+
+
+def _new(epoch):
+    return {"start": epoch, "end": epoch, "events": 0,
+            "tools": dict.fromkeys(CATEGORIES, 0)}
+
+
+def _acc(sid, epoch):
+    a = _open.get(sid)
+    if a is None:
+        a = _open[sid] = _new(epoch)
+    return a
+
+
+def _tally(a, ev, epoch):
+    a["events"] += 1
+    a["tools"][category(ev.get("tool") or "?")] += 1
+    if epoch:
+        a["start"] = epoch if not a["start"] or epoch < a["start"] else a["start"]
+        a["end"] = max(a["end"], epoch)
+
+
+def _fold(ev):
+    global _newest
+    sid = ev.get("session_id")
+    if not sid or sid in _closed:
+        return
+    epoch = event_epoch(ev, 0.0)
+    _tally(_acc(sid, epoch), ev, epoch)
+    if epoch:
+        _newest = max(_newest, epoch)
+
+
+def _seed_from_scan():
+    """Cold start: rotated segments stream through _fold, the live file is scanned."""
+    global _newest
+    for seg in segments(CC_EVENTS)[:-1]:
+        for ev in iter_events(seg):
+            _fold(ev)
+    out = scan.scan(CC_EVENTS, key="tool")
+    for sid, s in out["sessions"].items():
+        if sid in _closed:
+            continue
+        a = _acc(sid, s["first"])
+        a["events"] += s["events"]
+        for tool, n in s["counts"].items():
+            a["tools"][category(tool)] += n
+        if s["first"] and (not a["start"] or s["first"] < a["start"]):
+            a["start"] = s["first"]
+        a["end"] = max(a["end"], s["last"])
+        _newest = max(_newest, s["last"])
+    _events.resume(out["ino"], out["offset"])
+
+
+def summary(sid, a):
+    """Summary record for an accumulator, joined with gates and critiques."""
+    return _record(sid, a, _hits, _scores)
+
+
+def _record(sid, a, hits, scores):
+    lo = bisect.bisect_left(hits, (a["start"], False))
+    hi = bisect.bisect_right(hits, (a["end"], True))
+    blocks = sum(1 for _, is_block in hits[lo:hi] if is_block)
+    reads, writes = a["tools"]["read"], a["tools"]["write"]
+    return {
+        "session_id": sid,
+        "start":      a["start"],
+        "end":        a["end"],
+        "events":     a["events"],
+        "tools":      dict(a["tools"]),
+        "rw_ratio":   round(reads / writes, 2) if writes else None,
+        "blocks":     blocks,
+        "warns":      hi - lo - blocks,
+        "score":      scores.get(sid),
+    }
+
+
+def _load_closed():
+    closed = set()
+    try:
+        with open(SIDECAR, "rb") as f:
+            for raw in f:
+                try:
+                    closed.add(json.loads(raw)["session_id"])
+                except (ValueError, KeyError, TypeError):
+                    pass
+    except OSError:
+        pass
+    return closed
+
+
+def _state_stamp():
+    try:
+        st = os.stat(STATE)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _load_state():
+    global _newest, _hits
+    try:
+        st = json.loads(STATE.read_text())
+    except (OSError, ValueError):
+        return False
+    for tail, key in ((_events, "events"), (_gates, "gates"), (_crit, "critiques")):
+        tail.resume(*st["cursors"][key])
+    _open.clear()
+    _open.update(st["open"])
+    _scores.clear()
+    _scores.update(st["scores"])
+    _hits = [tuple(h) for h in st["hits"]]
+    _newest = st["newest"]
+    return True
+
+
+def _save_state():
+    global _stamp
+    tmp = STATE.with_suffix(".tmp")
+    tmp.write_text(json.dumps({
+        "cursors": {"events":    [_events.ino, _events.offset],
+                    "gates":     [_gates.ino, _gates.offset],
+                    "critiques": [_crit.ino, _crit.offset]},
+        "open":   _open,
+        "scores": _scores,
+        "hits":   _hits,
+        "newest": _newest,
+    }))
+    os.replace(tmp, STATE)
+    _stamp = _state_stamp()
+
+
+def _sync():
+    """Adopt the sidecar and state another process wrote since this one looked."""
+    global _closed, _stamp
+    stamp = _state_stamp()
+    if _closed is not None and stamp == _stamp:
+        return
+    first, _stamp = _closed is None, stamp
+    _closed = _load_closed()
+    if not _load_state() and first and CC_EVENTS.exists():
+        _seed_from_scan()
+    # A run that stopped between appending to the sidecar and saving state
+    # left those sessions open; they are already written
+    for sid in _closed.intersection(_open):
+        del _open[sid]
+
+
+def update(now=None):
+    """Fold new events, close idle sessions and append their summaries.
+
+    Returns the summaries written by this call.
+    """
+    with _lock:
+        DASH_DIR.mkdir(parents=True, exist_ok=True)
+        with open(LOCK, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            _sync()
+            return _update(now)
+
+
+def _update(now):
+    global _hits
+    changed = False
+    for ev in _crit.read():
+        sid = ev.get("session_id")
+        if sid and sid not in _closed and isinstance(ev.get("score"), (int, float)):
+            _scores[sid] = ev["score"]
+            changed = True
+    _crit.reset = False
+
+    # check() first: a replaced file must drop derived state before the replay
+    _gates.check()
+    if _gates.reset:
+        _hits, _gates.reset = [], False
+    for ev in _gates.read():
+        v = str(ev.get("decision") or ev.get("verdict") or "").lower()
+        if "block" in v or "deny" in v or "warn" in v:
+            bisect.insort(_hits, (event_epoch(ev, 0.0), "warn" not in v))
+            changed = True
+
+    _events.check()
+    if _events.reset:
+        _open.clear()
+        _events.reset = False
+    for ev in _events.read():
+        _fold(ev)
+        changed = True
+
+    # A session ends once nothing has been logged for it in IDLE seconds
+    horizon = max(_newest, now if now is not None else clock())
+    done = [sid for sid, a in _open.items() if horizon - a["end"] >= IDLE]
+    written = []
+    if done:
+        with open(SIDECAR, "a") as f:
+            for sid in sorted(done, key=lambda s: _open[s]["end"]):
+                rec = summary(sid, _open.pop(sid))
+                f.write(json.dumps(rec) + "\n")
+                _closed.add(sid)
+                _scores.pop(sid, None)
+                written.append(rec)
+        floor = min((a["start"] for a in _open.values()), default=horizon - IDLE)
+        _hits = _hits[bisect.bisect_left(_hits, (floor, False)):]
+        changed = True
+
+    if changed:
+        _save_state()
+    return written
+
+
+def open_sessions():
+    """Summaries of sessions still in progress, most recent first."""
+    with _lock:
+        return sorted((summary(sid, a) for sid, a in _open.items()),
+                      key=lambda r: -r["end"])
+
+
+def load(limit=None, until=None):
+    """Closed-session summaries from the sidecar, newest first.
+
+    With `until`, only sessions that had already ended at that instant.
+    """
+    out = []
+    if not SIDECAR.exists():
+        return out
+    for raw in read_backward(SIDECAR):
+        try:
+            rec = json.loads(raw)
+        except ValueError:
+            continue
+        if until is not None and until - rec.get("end", 0) < IDLE:
+            continue
+        out.append(rec)
+        if limit and len(out) >= limit:
+            break
+    return out
+
+
+def _gate_hits(floor, until=None):
+    """Sorted (epoch, is_block) for gate blocks and warns from `floor` on."""
+    hits = []
+    for ev in iter_events(HOOK_DECISIONS, since=floor, until=until):
+        v = str(ev.get("decision") or ev.get("verdict") or "").lower()
+        epoch = event_epoch(ev, 0.0)
+        if epoch >= floor and ("block" in v or "deny" in v or "warn" in v):
+            hits.append((epoch, "warn" not in v))
+    hits.sort()
+    return hits
+
+
+def open_at(t):
+    """Summaries of sessions in progress at `t`, most recent first.
+
+    Read backward from `t` until every session seen in its last IDLE seconds
+    has had an IDLE gap (its start), and never past LOOKBACK.
+    """
+    global _open_at
+    if _open_at[0] == t:
+        return _open_at[1]
+    acc = {}
+    for raw in iter_backward(CC_EVENTS, until=t):
+        try:
+            ev = json.loads(raw)
+        except ValueError:
+            continue
+        epoch = event_epoch(ev, 0.0)
+        if epoch and (epoch < t - LOOKBACK
+                      or all(a["start"] - epoch >= IDLE for a in acc.values())
+                      and t - epoch >= IDLE):
+            break
+        sid = ev.get("session_id")
+        if sid and (sid in acc or t - epoch < IDLE):
+            _tally(acc.setdefault(sid, _new(epoch)), ev, epoch)
+    hits = _gate_hits(min((a["start"] for a in acc.values()), default=t), t) if acc else []
+    scores = {}
+    for ev in iter_events(SELF_CRITIQUE, until=t):
+        if ev.get("session_id") in acc and isinstance(ev.get("score"), (int, float)):
+            scores[ev["session_id"]] = ev["score"]
+    rows = sorted((_record(sid, a, hits, scores) for sid, a in acc.items()),
+                  key=lambda r: -r["end"])
+    _open_at = (t, rows)
+    return rows
+
+
+def group_by(limit=20):
+    """Summaries of the `limit` most recent sessions in one pass over raw events.
+
+    Used when the sidecar is unavailable. Linear in the log and bounded in
+    memory: only the `limit` most recently active sessions are kept, so a
+    session pushed out and then resumed is counted from its resumption.
+    """
+    recent = OrderedDict()
+    for ev in iter_events(CC_EVENTS):
+        sid = ev.get("session_id")
+        if not sid:
+            continue
+        epoch = event_epoch(ev, 0.0)
+        a = recent.get(sid)
+        if a is None:
+            a = recent[sid] = _new(epoch)
+            if len(recent) > limit:
+                recent.popitem(last=False)
+        else:
+            recent.move_to_end(sid)
+        _tally(a, ev, epoch)
+    if not recent:
+        return []
+
+    hits, scores = _gate_hits(min(a["start"] for a in recent.values())), {}
+    for ev in iter_events(SELF_CRITIQUE):
+        if ev.get("session_id") in recent and isinstance(ev.get("score"), (int, float)):
+            scores[ev["session_id"]] = ev["score"]
+
+    return [_record(sid, a, hits, scores) for sid, a in reversed(recent.items())]
@@ -1,15 +1,9 @@
 """Tool Flow — what tools I use, read/write ratio, last 10 actions."""
-import json
-import time
-from pathlib import Path
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.console import Group
-from rich import box
-from .core import clr
-
-CC_EVENTS = Path.home() / ".mirrordna/bus/cc_events.jsonl"
+from .core import clr, HOME, as_of, clock
+from .eventlog import event_epoch, iter_events, last_events, has_log
+from . import store
+
+CC_EVENTS = HOME / ".mirrordna/bus/cc_events.jsonl"
 
 READ_TOOLS  = {"Read", "Glob", "Grep"}
 WRITE_TOOLS = {"Write", "Edit"}
@@ -17,32 +11,53 @@ EXEC_TOOLS  = {"Bash"}
 WEB_TOOLS   = {"WebFetch", "WebSearch"}
 MOBILE_TOOLS = {t for t in [] if "mobile" in t}  # populated dynamically
 
+PROFILE_KEYS = ("store",)
+
+SPAN = 86400   # seconds the per-tool counts cover
+LAST = 8       # newest actions listed
+
+
+def collect(profile):
+    """Calls per tool over the past day and the newest LAST of them, oldest first."""
+    if not has_log(CC_EVENTS):
+        return None
+    cutoff = clock() - SPAN
+    if store.enabled(profile, cutoff):
+        events = last_events(CC_EVENTS, LAST, until=as_of(),
+                             keep=lambda ev: event_epoch(ev, 0.0) >= cutoff)
+        return {"events": events, "counts": store.tool_counts(cutoff)}
+    counts, events = {}, []
+    for ev in iter_events(CC_EVENTS, since=cutoff, until=as_of()):
+        if event_epoch(ev, 0.0) < cutoff:
+            continue
+        t = ev.get("tool", "?")
+        counts[t] = counts.get(t, 0) + 1
+        events.append(ev)
+        del events[:-LAST]
+    return {"events": events, "counts": counts}
 
-def render(profile):
+
+def metrics(data):
+    if not data or not data["counts"]:
+        return []
+    return [("mirrordash_tool_calls_per_minute", "Tool calls per minute over the last 24h",
+             [({"tool": t}, n * 60 / SPAN) for t, n in sorted(data["counts"].items())])]
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich.console import Group
+    from rich import box
     color = clr(profile.get("color", "deep_sky_blue1"))
 
-    if not CC_EVENTS.exists():
+    if data is None:
         return Panel(Text("  No tool events logged yet.", style="grey50"),
                      title=f"[{color}]TOOL FLOW[/{color}]",
                      border_style="grey30", box=box.SIMPLE_HEAD)
 
-    events = []
-    cutoff = time.time() - 86400
-    with open(CC_EVENTS) as f:
-        for raw in f:
-            try:
-                ev = json.loads(raw)
-                if ev.get("ts") or ev.get("epoch", 0) >= cutoff:
-                    events.append(ev)
-            except Exception:
-                pass
-
-    # Tool counts
-    counts = {}
-    recent = events[-200:] if len(events) > 200 else events
-    for ev in recent:
-        t = ev.get("tool", "?")
-        counts[t] = counts.get(t, 0) + 1
+    events, counts = data["events"], data["counts"]
 
     reads  = sum(counts.get(t, 0) for t in READ_TOOLS)
     writes = sum(counts.get(t, 0) for t in WRITE_TOOLS)
@@ -92,12 +107,12 @@ def render(profile):
             ratio_txt.append("good", style="green")
     ratio_txt.append(f"\n  ", style="grey50")
     ratio_txt.append(f"{total}", style="bold white")
-    ratio_txt.append(f" total tool calls logged\n", style="grey50")
+    ratio_txt.append(f" tool calls in the last 24h\n", style="grey50")
 
     # Last 8 actions
     last_txt = Text()
     last_txt.append("\n  LAST ACTIONS\n", style=f"bold {color}")
-    for ev in reversed(events[-8:]):
+    for ev in reversed(events):
         tool = ev.get("tool", "?")[:12]
         target = ev.get("target", ev.get("command", ""))[:50]
         tc = "cyan" if tool in READ_TOOLS else "yellow" if tool in WRITE_TOOLS else \
@@ -0,0 +1,158 @@
+"""Bounded-memory heavy-hitter counters for "most frequent X" panels.
+
+SpaceSaving keeps at most k counters no matter how many distinct items the
+stream holds. WindowedTopK keeps one SpaceSaving per time bucket plus an
+all-time one, and for each window length asked about, the combined counts of
+the buckets inside it. Those are updated as items arrive and as buckets age
+out, so "top items in the last N hours" never rescans history or re-merges
+every bucket.
+"""
+import heapq
+
+
+class SpaceSaving:
+    """Space-Saving top-k summary (Metwally et al., 2005).
+
+    Counts are overestimates by at most the evicted minimum; `total` is exact.
+    """
+
+    def __init__(self, k=64):
+        self.k      = k
+        self.counts = {}
+        self.total  = 0
+
+    def add(self, item, n=1):
+        """Count `item`; returns the (item, count) evicted for it, if any."""
+        self.total += n
+        c = self.counts
+        if item in c:
+            c[item] += n
+        elif len(c) < self.k:
+            c[item] = n
+        else:
+            victim = min(c, key=c.get)
+            left = c.pop(victim)
+            c[item] = left + n
+            return victim, left
+        return None
+
+    def merge(self, others):
+        """New summary holding the k largest combined counts of `others`.
+
+        An item one part evicted is missing from its sum, so a merged count
+        may be low as well as high, by at most the parts' smallest counters.
+        """
+        out = SpaceSaving(self.k)
+        combined = dict(self.counts)
+        for o in others:
+            out.total += o.total
+            for item, n in o.counts.items():
+                combined[item] = combined.get(item, 0) + n
+        out.total += self.total
+        out.counts = dict(heapq.nlargest(self.k, combined.items(), key=lambda kv: kv[1]))
+        return out
+
+    def top(self, n=8):
+        return heapq.nlargest(n, self.counts.items(), key=lambda kv: kv[1])
+
+
+class _Window:
+    """Combined bucket counts of one window length, from `floor` (exclusive) on."""
+
+    def __init__(self, floor):
+        self.floor   = floor
+        self.counts  = {}
+        self.total   = 0
+        self.summary = None   # SpaceSaving of the counts, until they change
+
+    def apply(self, item, n, evicted=None):
+        c = self.counts
+        if evicted:
+            victim, left = evicted
+            if c[victim] == left:
+                del c[victim]
+            else:
+                c[victim] -= left
+            c[item] = c.get(item, 0) + left
+        c[item] = c.get(item, 0) + n
+        self.total += n
+        self.summary = None
+
+    def apply_all(self, bucket):
+        c = self.counts
+        for item, n in bucket.counts.items():
+            c[item] = c.get(item, 0) + n
+        self.total += bucket.total
+        self.summary = None
+
+    def drop(self, bucket):
+        c = self.counts
+        for item, n in bucket.counts.items():
+            if c[item] == n:
+                del c[item]
+            else:
+                c[item] -= n
+        self.total -= bucket.total
+        self.summary = None
+
+
+class WindowedTopK:
+    """Top-k per sliding window, built from fixed-width time buckets.
+
+    Buckets older than `retain` seconds are dropped. Window answers are exact
+    to one bucket width. Each window length queried keeps running counts:
+    add() updates them in O(window lengths), a query first subtracts the
+    buckets that aged out (O(k) each), and its top-k is recomputed only when
+    the counts changed, in O(m log k) for m items in the window.
+    """
+
+    def __init__(self, k=64, bucket=600, retain=86400):
+        self.k       = k
+        self.bucket  = bucket
+        self.retain  = retain
+        self.buckets = {}            # bucket start -> SpaceSaving
+        self.all     = SpaceSaving(k)
+        self._windows = {}           # seconds -> _Window
+
+    def add(self, item, ts, n=1):
+        b = int(ts // self.bucket) * self.bucket
+        s = self.buckets.get(b)
+        if s is None:
+            s = self.buckets[b] = SpaceSaving(self.k)
+            floor = b - self.retain
+            for old in [x for x in self.buckets if x < floor]:
+                self._expire(old, self.buckets.pop(old))
+        evicted = s.add(item, n)
+        for w in self._windows.values():
+            if b > w.floor:
+                w.apply(item, n, evicted)
+        self.all.add(item, n)
+
+    def _expire(self, b, bucket):
+        for w in self._windows.values():
+            if b > w.floor:
+                w.drop(bucket)
+
+    def window(self, seconds, now):
+        """Summary of the last `seconds` (None = all time) ending at `now`."""
+        if seconds is None:
+            return self.all
+        floor = now - seconds - self.bucket
+        w = self._windows.get(seconds)
+        if w is None or floor < w.floor:
+            # First ask, or the clock went back: combine the buckets once
+            w = self._windows[seconds] = _Window(floor)
+            for b, s in self.buckets.items():
+                if b > floor:
+                    w.apply_all(s)
+        elif floor > w.floor:
+            for b, s in self.buckets.items():
+                if w.floor < b <= floor:
+                    w.drop(s)
+            w.floor = floor
+        if w.summary is None:
+            w.summary = SpaceSaving(self.k)
+            w.summary.total  = w.total
+            w.summary.counts = dict(heapq.nlargest(self.k, w.counts.items(), key=lambda kv: kv[1]))
+        return w.summary
+
@@ -1,21 +1,28 @@
 """Vault Access — which vault/system files I'm reading, where my attention goes."""
-import json
-import re
-import time
-from collections import Counter
 from pathlib import Path
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.console import Group
-from rich import box
-from .core import clr
-
-CC_EVENTS = Path.home() / ".mirrordna/bus/cc_events.jsonl"
-HOME = Path.home()
+from .core import clr, clock, HOME, LOOKBACK, as_of
+from .eventlog import JsonlTail, event_epoch, has_log, iter_events
+from .topk import WindowedTopK
+
+CC_EVENTS = HOME / ".mirrordna/bus/cc_events.jsonl"
 VAULT = HOME / "MirrorDNA-Vault"
 MIRRORDNA = HOME / ".mirrordna"
 
+READ_TOOLS  = {"Read", "Glob", "Grep"}
+WRITE_TOOLS = {"Write", "Edit"}
+
+WINDOWS = {"1h": 3600, "6h": 6 * 3600, "24h": 86400, "all": None}
+TOP_K   = 64     # counters kept per bucket — memory is bounded by this, not by paths seen
+
+PROFILE_KEYS = ("vault_window",)
+
+# Only Read/Write-family lines are decoded; the rest are skipped as raw bytes
+MATCH   = [f'"{t}"'.encode() for t in READ_TOOLS | WRITE_TOOLS]
+_tail   = JsonlTail(CC_EVENTS, match=MATCH, history=True)
+_reads  = WindowedTopK(TOP_K)
+_writes = WindowedTopK(TOP_K)
+_then   = (None, None, None)   # (t, reads, writes) over the LOOKBACK before t
+
 
 def _classify(path: str) -> tuple[str, str]:
     """Return (label, color) for a file path."""
@@ -30,47 +37,98 @@ def _classify(path: str) -> tuple[str, str]:
     return Path(path).name[:40], "grey60"
 
 
-def render(profile):
+def _ingest():
+    """Fold newly appended Read/Write events into the windowed counters."""
+    global _reads, _writes
+    _tail.check()
+    if _tail.reset:
+        _reads, _writes = WindowedTopK(TOP_K), WindowedTopK(TOP_K)
+        _tail.reset = False
+    now = clock()
+    for ev in _tail.read():
+        _add(_reads, _writes, ev, now)
+    return _reads, _writes
+
+
+def _counters_at(t):
+    """Fresh counters for the LOOKBACK before `t`, the longest window then shown."""
+    global _then
+    if _then[0] != t:
+        reads, writes = WindowedTopK(TOP_K), WindowedTopK(TOP_K)
+        for ev in iter_events(CC_EVENTS, since=t - LOOKBACK, match=MATCH, until=t):
+            if event_epoch(ev, t) >= t - LOOKBACK:
+                _add(reads, writes, ev, t)
+        _then = (t, reads, writes)
+    return _then[1:]
+
+
+def _add(reads, writes, ev, now):
+    target = ev.get("target", "")
+    if not target:
+        return
+    tool = ev.get("tool", "")
+    if tool in READ_TOOLS:
+        reads.add(target, event_epoch(ev, now))
+    elif tool in WRITE_TOOLS:
+        writes.add(target, event_epoch(ev, now))
+
+
+def collect(profile):
+    """Read/write totals per window and the most touched paths in `vault_window`.
+
+    In the past only the LOOKBACK before the instant is read, so "all" is
+    dropped and shown as "24h".
+    """
+    if not has_log(CC_EVENTS):
+        return None
+    at = as_of()
+    reads, writes = _counters_at(at) if at is not None else _ingest()
+    windows = WINDOWS if at is None else {k: v for k, v in WINDOWS.items() if v is not None}
+    window = profile.get("vault_window", "6h")
+    if window not in windows:
+        window = "24h" if window == "all" else "6h"
+    now = clock()
+    return {
+        "reads":       {label: reads.window(secs, now).total for label, secs in windows.items()},
+        "writes":      {label: writes.window(secs, now).total for label, secs in windows.items()},
+        "window":      window,
+        "top_read":    reads.window(windows[window], now).top(8),
+        "top_written": writes.window(windows[window], now).top(6),
+    }
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich.console import Group
+    from rich import box
     color = clr(profile.get("color", "deep_sky_blue1"))
 
-    if not CC_EVENTS.exists():
+    if data is None:
         return Panel(Text("  No events logged.", style="grey50"),
                      title=f"[{color}]VAULT ACCESS[/{color}]",
                      border_style="grey30", box=box.SIMPLE_HEAD)
 
-    reads = []
-    writes = []
-    cutoff = time.time() - 3600 * 6  # last 6h
-
-    with open(CC_EVENTS) as f:
-        for raw in f:
-            try:
-                ev = json.loads(raw)
-                ts = ev.get("epoch") or ev.get("ts")
-                tool = ev.get("tool", "")
-                target = ev.get("target", "")
-                if not target:
-                    continue
-                if tool in ("Read", "Glob", "Grep"):
-                    reads.append(target)
-                elif tool in ("Write", "Edit"):
-                    writes.append(target)
-            except Exception:
-                pass
-
-    # Top accessed
-    read_counts = Counter(reads)
-    write_counts = Counter(writes)
+    window = data["window"]
 
     t = Text()
-    t.append(f"  {len(reads)} reads  {len(writes)} writes  (all time)\n\n", style="grey50")
+    t.append("  reads  ", style="grey50")
+    for label, n in data["reads"].items():
+        t.append(f"{label} ", style="grey42")
+        t.append(f"{n}  ", style="grey70")
+    t.append("\n  writes ", style="grey50")
+    for label, n in data["writes"].items():
+        t.append(f"{label} ", style="grey42")
+        t.append(f"{n}  ", style="grey70")
+    t.append("\n\n")
 
     tbl = Table(show_header=False, box=None, padding=(0, 1), expand=True)
     tbl.add_column("count", width=5, no_wrap=True)
     tbl.add_column("file",  no_wrap=False, overflow="fold")
 
-    t.append("  MOST READ\n", style=f"bold {color}")
-    for path, count in read_counts.most_common(8):
+    t.append(f"  MOST READ  ({window})\n", style=f"bold {color}")
+    for path, count in data["top_read"]:
         label, fc = _classify(path)
         tbl.add_row(Text(f"{count}x", style="grey42"), Text(label, style=fc))
 
@@ -78,8 +136,8 @@ def render(profile):
     wtbl.add_column("count", width=5, no_wrap=True)
     wtbl.add_column("file",  no_wrap=False, overflow="fold")
 
-    wt = Text("\n  MOST WRITTEN\n", style="bold yellow")
-    for path, count in write_counts.most_common(6):
+    wt = Text(f"\n  MOST WRITTEN  ({window})\n", style="bold yellow")
+    for path, count in data["top_written"]:
         label, fc = _classify(path)
         wtbl.add_row(Text(f"{count}x", style="grey42"), Text(label, style="yellow"))
 
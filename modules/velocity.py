@@ -1,12 +1,10 @@
 """Velocity module — git commit velocity across repos, last 7 days."""
 from datetime import datetime, timedelta
-from pathlib import Path
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr, _run
+from .core import clr, _run, HOME
 
-REPOS_DIR = Path.home() / "repos"
+REPOS_DIR = HOME / "repos"
+
+PROFILE_KEYS = ()
 
 
 def _commits_last_7(repo_path):
@@ -25,9 +23,8 @@ def _commits_last_7(repo_path):
     return results
 
 
-def render(profile):
-    color = clr(profile.get("color"))
-
+def collect(profile):
+    """Commits per day over the last week across ~/repos, plus the first few messages."""
     # Scan repos dir for git repos
     repos = []
     if REPOS_DIR.exists():
@@ -61,8 +58,19 @@ def render(profile):
                 except Exception:
                     pass
 
+    return {"repos": len(repos), "total": total_commits, "days": day_counts,
+            "recent": recent_msgs}
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    color = clr(profile.get("color"))
+    day_counts = data["days"]
+
     t = Text()
-    t.append(f"  {total_commits}", style="bold white")
+    t.append(f"  {data['total']}", style="bold white")
     t.append(" commits / 7 days\n\n", style="grey50")
 
     # Sparkline — day 6 (oldest) → day 0 (today)
@@ -84,14 +92,14 @@ def render(profile):
     t.append("  ← today\n\n", style="grey23")
 
     # Recent commits
-    if recent_msgs:
+    if data["recent"]:
         t.append("  RECENT\n", style=f"bold {color}")
-        for date, repo, msg in recent_msgs[:4]:
+        for date, repo, msg in data["recent"][:4]:
             t.append(f"  {date}  ", style="grey42")
             t.append(f"{repo[:10]:<10}", style=color)
             t.append(f" {msg[:30]}\n", style="grey70")
 
-    if not repos:
+    if not data["repos"]:
         t.append("  No repos found in ~/repos/\n", style="grey30")
 
     return Panel(t, title=f"[{color}]VELOCITY[/{color}]",
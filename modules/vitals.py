@@ -1,9 +1,31 @@
-"""Vitals module — CPU, RAM, disk."""
+"""Vitals module — CPU, RAM, disk, plus network and block-device I/O rates.
+
+Sampling runs on a background thread; collect only reads the latest snapshot.
+"""
+import os
 import subprocess
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from .core import clr, _bar, _run
+import threading
+import time
+from collections import deque
+from .core import clr, _bar, _run, _spark
+
+NET_DEV    = "/proc/net/dev"
+DISKSTATS  = "/proc/diskstats"
+SYS_BLOCK  = "/sys/block"
+
+SAMPLE_EVERY = 2.0   # seconds between background samples
+HISTORY      = 60    # samples kept per series for sparklines
+SECTOR       = 512   # /proc/diskstats always counts 512-byte sectors
+
+PROFILE_KEYS = ("vitals_io",)
+
+_lock      = threading.Lock()
+_start     = threading.Lock()
+_thread    = None
+_snap      = {}      # latest cpu/ram/disk reading
+_net_hist  = {}      # iface -> {rx, tx, rxp, txp: deque}
+_disk_hist = {}      # device -> {r_iops, w_iops, r_bps, w_bps: deque}
+_prev_io   = None    # (monotonic, net counters, disk counters)
 
 
 def _cpu():
@@ -41,11 +63,211 @@ def _disk():
         return 0.0, 0, 0
 
 
-def render(profile):
+def _read_net():
+    """/proc/net/dev — iface -> (rx_bytes, rx_packets, tx_bytes, tx_packets)."""
+    out = {}
+    try:
+        with open(NET_DEV) as f:
+            lines = f.readlines()[2:]
+    except OSError:
+        return out
+    for line in lines:
+        name, _, rest = line.partition(":")
+        name = name.strip()
+        if not rest or name == "lo":
+            continue
+        f = rest.split()
+        try:
+            out[name] = (int(f[0]), int(f[1]), int(f[8]), int(f[9]))
+        except (IndexError, ValueError):
+            pass
+    return out
+
+
+def _whole_disks():
+    try:
+        return set(os.listdir(SYS_BLOCK))
+    except OSError:
+        return None
+
+
+def _read_diskstats():
+    """/proc/diskstats — device -> (reads, sectors_read, writes, sectors_written)."""
+    out = {}
+    try:
+        with open(DISKSTATS) as f:
+            lines = f.readlines()
+    except OSError:
+        return out
+    whole = _whole_disks()
+    for line in lines:
+        f = line.split()
+        if len(f) < 10:
+            continue
+        name = f[2]
+        if name.startswith(("loop", "ram", "zram")):
+            continue
+        if whole is not None and name not in whole:
+            continue  # partition — its I/O is already in the parent device
+        try:
+            out[name] = (int(f[3]), int(f[5]), int(f[7]), int(f[9]))
+        except ValueError:
+            pass
+    return out
+
+
+def _series(store, key, fields):
+    s = store.get(key)
+    if s is None:
+        s = store[key] = {k: deque(maxlen=HISTORY) for k in fields}
+    return s
+
+
+def _sample_io():
+    """Delta the raw counters against the previous sample into per-second rates."""
+    global _prev_io
+    now = time.monotonic()
+    net, disk = _read_net(), _read_diskstats()
+    prev, _prev_io = _prev_io, (now, net, disk)
+    if prev is None:
+        return
+    dt = now - prev[0]
+    if dt <= 0:
+        return
+
+    with _lock:
+        for name, (rb, rp, tb, tp) in net.items():
+            p = prev[1].get(name)
+            if not p:
+                continue
+            s = _series(_net_hist, name, ("rx", "tx", "rxp", "txp"))
+            # Counters reset when an interface is re-created — clamp at 0
+            s["rx"].append(max(0, rb - p[0]) / dt)
+            s["rxp"].append(max(0, rp - p[1]) / dt)
+            s["tx"].append(max(0, tb - p[2]) / dt)
+            s["txp"].append(max(0, tp - p[3]) / dt)
+        for name, (r, rs, w, ws) in disk.items():
+            p = prev[2].get(name)
+            if not p:
+                continue
+            s = _series(_disk_hist, name, ("r_iops", "w_iops", "r_bps", "w_bps"))
+            s["r_iops"].append(max(0, r - p[0]) / dt)
+            s["r_bps"].append(max(0, rs - p[1]) * SECTOR / dt)
+            s["w_iops"].append(max(0, w - p[2]) / dt)
+            s["w_bps"].append(max(0, ws - p[3]) * SECTOR / dt)
+        for store, live in ((_net_hist, net), (_disk_hist, disk)):
+            for gone in set(store) - set(live):
+                del store[gone]
+
+
+def _sample():
+    global _snap
+    snap = {"cpu": _cpu(), "ram": _ram(), "disk": _disk()}
+    _sample_io()
+    _snap = snap
+
+
+def _loop():
+    while True:
+        time.sleep(SAMPLE_EVERY)
+        try:
+            _sample()
+        except Exception:
+            pass
+
+
+def _ensure_sampler():
+    """Start the background sampler once; the first sample is taken inline."""
+    global _thread
+    with _start:
+        if _thread is None:
+            _sample()
+            _thread = threading.Thread(target=_loop, name="vitals-sampler", daemon=True)
+            _thread.start()
+
+
+def _rate(n):
+    if n >= 1024**3: return f"{n / 1024**3:.1f}G"
+    if n >= 1024**2: return f"{n / 1024**2:.1f}M"
+    if n >= 1024:    return f"{n / 1024:.0f}K"
+    return f"{n:.0f}B"
+
+
+def _io_text(net, disk, color):
+    """Busiest interfaces and block devices, newest rate plus sparkline."""
+    from rich.text import Text
+    t = Text()
+    t.append("\n  NET\n", style=f"bold {color}")
+    ifaces = sorted(net.items(), key=lambda kv: -(sum(kv[1]["rx"]) + sum(kv[1]["tx"])))[:3]
+    if not ifaces:
+        t.append("  sampling…\n", style="grey30")
+    for name, s in ifaces:
+        total = [a + b for a, b in zip(s["rx"], s["tx"])]
+        t.append(f"  {name[:8]:<8} ", style="grey70")
+        t.append(_spark(total, width=12, color="cyan"))
+        t.append(f"  ↓{_rate(s['rx'][-1])}/s ↑{_rate(s['tx'][-1])}/s", style="grey85")
+        t.append(f"  {s['rxp'][-1]:.0f}/{s['txp'][-1]:.0f} pkt/s\n", style="grey42")
+
+    t.append("\n  DISK I/O\n", style=f"bold {color}")
+    devs = sorted(disk.items(), key=lambda kv: -(sum(kv[1]["r_bps"]) + sum(kv[1]["w_bps"])))[:3]
+    if not devs:
+        t.append("  sampling…\n", style="grey30")
+    for name, s in devs:
+        total = [a + b for a, b in zip(s["r_bps"], s["w_bps"])]
+        t.append(f"  {name[:8]:<8} ", style="grey70")
+        t.append(_spark(total, width=12, color="yellow"))
+        t.append(f"  r {_rate(s['r_bps'][-1])}/s w {_rate(s['w_bps'][-1])}/s", style="grey85")
+        t.append(f"  {s['r_iops'][-1]:.0f}/{s['w_iops'][-1]:.0f} iops\n", style="grey42")
+    return t
+
+
+def collect(profile):
+    """Latest sample, plus the I/O rate history when `vitals_io` is set."""
+    _ensure_sampler()
+    data = dict(_snap)
+    if profile.get("vitals_io"):
+        with _lock:
+            data["net"] = {k: {f: list(d) for f, d in v.items()} for k, v in _net_hist.items()}
+            data["io"] = {k: {f: list(d) for f, d in v.items()} for k, v in _disk_hist.items()}
+    return data
+
+
+def metrics(data):
+    out = [
+        ("mirrordash_cpu_percent",  "CPU in use",       [({}, data["cpu"])]),
+        ("mirrordash_ram_percent",  "Memory in use",    [({}, data["ram"][0])]),
+        ("mirrordash_disk_percent", "Root disk in use", [({}, data["disk"][0])]),
+    ]
+    if "net" not in data:
+        return out
+    # Latest rate of each series; the history is only for the sparklines
+    net, disk_bps, disk_iops = [], [], []
+    for name, h in sorted(data["net"].items()):
+        for f, direction in (("rx", "receive"), ("tx", "transmit")):
+            if h[f]:
+                net.append(({"iface": name, "direction": direction}, h[f][-1]))
+    for name, h in sorted(data["io"].items()):
+        for f, g, direction in (("r_bps", "r_iops", "read"), ("w_bps", "w_iops", "write")):
+            labels = {"device": name, "direction": direction}
+            if h[f]:
+                disk_bps.append((labels, h[f][-1]))
+            if h[g]:
+                disk_iops.append((labels, h[g][-1]))
+    return out + [
+        ("mirrordash_net_bytes_per_second",     "Network throughput by interface", net),
+        ("mirrordash_disk_io_bytes_per_second", "Block device throughput",         disk_bps),
+        ("mirrordash_disk_iops",                "Block device operations per second", disk_iops),
+    ]
+
+
+def render(data, profile):
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
     color = clr(profile.get("color"))
-    cpu = _cpu()
-    ram_pct, ram_used, ram_total = _ram()
-    disk_pct, disk_used, disk_total = _disk()
+    cpu = data["cpu"]
+    ram_pct, ram_used, ram_total = data["ram"]
+    disk_pct, disk_used, disk_total = data["disk"]
 
     def bar_color(pct):
         return "red" if pct > 85 else "yellow" if pct > 60 else "green"
@@ -63,6 +285,9 @@ def render(profile):
     t.append(_bar(disk_pct, 100, width=18, color=bar_color(disk_pct)))
     t.append(f"  {disk_used}/{disk_total}G\n", style="grey85")
 
+    if "net" in data:
+        t.append_text(_io_text(data["net"], data["io"], color))
+
     frame = profile.get("_frame", 0)
     critical = cpu > 85 or ram_pct > 85
     if critical:
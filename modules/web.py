@@ -0,0 +1,251 @@
+"""Web dashboard — the profile layout as HTML, panels updated over SSE.
+
+    python3 mirrordash.py -p glass --web 8750
+
+One collector feeds every viewer. The dashboard calls update() once per
+refresh; a panel whose data differs from last time gets the next sequence
+number and one pre-encoded Server-Sent Event,
+
+    id: 42
+    event: panel
+    data: {"panel": "risk_score", "data": {...}}
+
+which is written as-is to every open /events stream. Collected data holds no
+ages or clock readings, so a panel whose sources are unchanged sends nothing,
+and the collection cost is the same however many browsers watch.
+A browser that reconnects sends Last-Event-ID and gets only what changed
+since. GET /state returns every panel at once.
+
+Only split modules have data to send; render-only modules show a note.
+"""
+import html
+import http.server
+import json
+import threading
+
+from . import collector
+
+HOST      = "127.0.0.1"   # local only; put a proxy in front to share it
+KEEPALIVE = 15.0          # seconds between comments on an idle stream
+
+
+class Hub:
+    """Latest data per panel, and the event stream viewers follow."""
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.cond    = threading.Condition()
+        self.seq     = 0
+        self.panels  = {}   # name -> (seq, payload JSON, SSE message bytes)
+        self.server  = None
+
+    def update(self, tick, names, profile):
+        """Publish every panel whose data changed in this tick."""
+        changed = False
+        for name in dict.fromkeys(names):
+            mod = collector.load(name)
+            if mod is None or not collector.is_split(mod):
+                continue
+            try:
+                body = {"panel": name, "data": tick.collect(name, mod, profile)}
+            except Exception as e:
+                body = {"panel": name, "error": f"{type(e).__name__}: {e}"}
+            payload = json.dumps(body, sort_keys=True, default=str)
+            with self.cond:
+                old = self.panels.get(name)
+                if old is not None and old[1] == payload:
+                    continue
+                self.seq += 1
+                msg = f"id: {self.seq}\nevent: panel\ndata: {payload}\n\n".encode()
+                self.panels[name] = (self.seq, payload, msg)
+                changed = True
+        if changed:
+            with self.cond:
+                self.cond.notify_all()
+
+    def since(self, seq):
+        """(messages for panels changed after `seq`, current seq). Call with cond held."""
+        return [m for s, _, m in self.panels.values() if s > seq], self.seq
+
+    def state(self):
+        with self.cond:
+            return {"seq": self.seq,
+                    "panels": {name: json.loads(p) for name, (_, p, _) in self.panels.items()}}
+
+    def start(self, port, host=HOST):
+        """Serve the page and event stream from a daemon thread; returns self."""
+        self.server = http.server.ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.hub = self
+        threading.Thread(target=self.server.serve_forever, name="web", daemon=True).start()
+        return self
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        hub  = self.server.hub
+        path = self.path.split("?")[0]
+        if path == "/":
+            self._send(page(hub.profile).encode(), "text/html; charset=utf-8")
+        elif path == "/state":
+            self._send(json.dumps(hub.state(), default=str).encode(), "application/json")
+        elif path == "/events":
+            self._stream(hub)
+        else:
+            self.send_error(404)
+
+    def _stream(self, hub):
+        try:
+            last = int(self.headers.get("Last-Event-ID") or 0)
+        except ValueError:
+            last = 0
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            self.wfile.write(b"retry: 3000\n\n")
+            while True:
+                with hub.cond:
+                    if last > hub.seq:
+                        last = 0   # the id is from before a restart: resend everything
+                    hub.cond.wait_for(lambda: hub.seq > last, timeout=KEEPALIVE)
+                    msgs, last = hub.since(last)
+                self.wfile.write(b"".join(msgs) or b": keepalive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def _cell(name):
+    mod = collector.load(name)
+    if mod is None:
+        note = f"modules/{name}.py not found"
+    elif not collector.is_split(mod):
+        note = "render-only module — shown in the terminal view"
+    else:
+        note = "waiting for data…"
+    n = html.escape(name, quote=True)
+    return (f'<section class="panel" data-panel="{n}"><h2>{n}</h2>'
+            f'<div class="body"><span class="dim">{html.escape(note)}</span></div></section>')
+
+
+def _stack(items):
+    """One column of cells; a nested list is a row of cells."""
+    out = []
+    for item in items:
+        if isinstance(item, list):
+            out.append('<div class="row">' + "".join(_cell(n) for n in item) + "</div>")
+        else:
+            out.append(_cell(item))
+    return "".join(out)
+
+
+def _body(profile):
+    cfg_layout = profile.get("layout")
+    if cfg_layout:
+        left  = profile.get("left_ratio", 2)
+        right = profile.get("right_ratio", 3)
+        return (f'<div class="row"><div class="col" style="flex:{int(left)}">'
+                f'{_stack(cfg_layout.get("left", []))}</div>'
+                f'<div class="col" style="flex:{int(right)}">'
+                f'{_stack(cfg_layout.get("right", []))}</div></div>')
+    # Auto grid, grouped the same way as the terminal view
+    wide = set(profile.get("wide", []))
+    cols = profile.get("columns", 2)
+    rows, buf = [], []
+    for name in profile.get("modules", []):
+        if name in wide:
+            if buf:
+                rows.append(buf); buf = []
+            rows.append([name])
+        else:
+            buf.append(name)
+            if len(buf) == cols:
+                rows.append(buf); buf = []
+    if buf:
+        rows.append(buf)
+    return _stack(rows) or '<p class="dim">No modules.</p>'
+
+
+def page(profile):
+    return _PAGE.format(
+        title=html.escape(str(profile.get("name", "MirrorDash"))),
+        description=html.escape(str(profile.get("description", ""))),
+        body=_body(profile),
+    )
+
+
+_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>{title} — MirrorDash</title>
+<style>
+body {{ background:#0b0d10; color:#c8ccd0; font:13px/1.4 ui-monospace,Menlo,monospace; margin:0; }}
+header {{ padding:8px 14px; border-bottom:1px solid #2a6f86; }}
+header b {{ color:#5fd7ff; }}
+main {{ padding:8px; }}
+.row {{ display:flex; gap:8px; }}
+.col {{ display:flex; flex-direction:column; gap:8px; min-width:0; }}
+.row > .panel {{ flex:1; }}
+.panel {{ border:1px solid #2a3a44; border-radius:4px; padding:6px 10px; margin-bottom:8px; overflow:auto; max-height:60vh; min-width:0; }}
+.panel.flash {{ border-color:#5fd7ff; }}
+h2 {{ margin:0 0 4px; font-size:12px; color:#5fd7ff; text-transform:uppercase; letter-spacing:.08em; }}
+table {{ border-collapse:collapse; }}
+td {{ padding:0 8px 0 0; vertical-align:top; }}
+td.k {{ color:#7d8a94; }}
+ul {{ margin:0; padding-left:16px; }}
+.dim {{ color:#55606a; }} .err {{ color:#ff6b6b; }} .num {{ color:#e8e8a0; }}
+</style></head>
+<body><header><b>◆ MIRRORDASH</b> — {title} <span class="dim">{description}</span>
+<span id="status" class="dim"></span></header>
+<main>{body}</main>
+<script>
+const MAX_ITEMS = 50;
+function el(tag, cls, text) {{
+  const e = document.createElement(tag);
+  if (cls) e.className = cls;
+  if (text !== undefined) e.textContent = text;
+  return e;
+}}
+function view(v) {{
+  if (v === null || v === undefined) return el("span", "dim", "—");
+  if (typeof v === "number") return el("span", "num", Number.isInteger(v) ? String(v) : v.toFixed(3));
+  if (typeof v !== "object") return el("span", "", String(v));
+  if (Array.isArray(v)) {{
+    if (!v.length) return el("span", "dim", "[]");
+    if (v.every(x => x === null || typeof x !== "object")) return el("span", "", v.map(String).join("  "));
+    const ul = el("ul");
+    v.slice(-MAX_ITEMS).forEach(x => {{ const li = el("li"); li.appendChild(view(x)); ul.appendChild(li); }});
+    return ul;
+  }}
+  const t = el("table");
+  for (const [k, x] of Object.entries(v)) {{
+    const tr = el("tr");
+    tr.appendChild(el("td", "k", k));
+    const td = el("td"); td.appendChild(view(x)); tr.appendChild(td);
+    t.appendChild(tr);
+  }}
+  return t;
+}}
+const events = new EventSource("events");
+events.addEventListener("panel", e => {{
+  const m = JSON.parse(e.data);
+  document.querySelectorAll(`[data-panel="${{CSS.escape(m.panel)}}"]`).forEach(p => {{
+    const body = p.querySelector(".body");
+    body.replaceChildren("error" in m ? el("span", "err", m.error) : view(m.data));
+    p.classList.add("flash"); setTimeout(() => p.classList.remove("flash"), 600);
+  }});
+  document.getElementById("status").textContent = "  updated " + new Date().toLocaleTimeString();
+}});
+events.onerror = () => {{ document.getElementById("status").textContent = "  reconnecting…"; }};
+</script></body></html>
+"""
@@ -0,0 +1,109 @@
+"""model_monitor's Ollama polling against a fake Ollama on localhost."""
+import json
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules import model_monitor as mm
+
+PS   = {"models": [{"name": "qwen2.5:7b", "size_vram": 5_000_000_000}]}
+TAGS = {"models": [{"name": "qwen2.5:7b"}, {"name": "llama3.2:3b"}]}
+
+
+class FakeOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, like Ollama
+
+    def do_GET(self):
+        srv = self.server
+        with srv.lock:
+            srv.hits.append((self.path, self.client_address))
+        if srv.barrier is not None:
+            srv.barrier.wait()   # only passes if ps and tags arrive together
+        if srv.down:
+            body, status = b"{}", 503
+        else:
+            body, status = json.dumps({"/api/ps": PS, "/api/tags": TAGS}[self.path]).encode(), 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Drop the socket without "Connection: close", as an idle timeout would
+        self.close_connection = srv.hang_up
+
+    def log_message(self, *args):
+        pass
+
+
+class PollTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.srv = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllama)
+        cls.srv.daemon_threads = True
+        cls.srv.lock = threading.Lock()
+        threading.Thread(target=cls.srv.serve_forever, daemon=True).start()
+        mm.OLLAMA_BASE = f"http://127.0.0.1:{cls.srv.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.srv.shutdown()
+        cls.srv.server_close()
+
+    def setUp(self):
+        self.srv.hits, self.srv.barrier = [], None
+        self.srv.down = self.srv.hang_up = False
+        mm._tags, mm._tags_at, mm._fails, mm._retry_at = None, 0.0, 0, 0.0
+
+    def paths(self):
+        return [p for p, _ in self.srv.hits]
+
+    def test_ps_and_tags_in_parallel(self):
+        self.srv.barrier = threading.Barrier(2, timeout=2)
+        ps, tags, retry_in = mm._poll()
+        self.assertEqual((ps, tags, retry_in), (PS, TAGS, 0))
+        self.assertEqual(sorted(self.paths()), ["/api/ps", "/api/tags"])
+
+    def test_tags_reused_within_ttl(self):
+        mm._poll()
+        ps, tags, _ = mm._poll()
+        self.assertEqual((ps, tags), (PS, TAGS))
+        self.assertEqual(self.paths().count("/api/tags"), 1)
+        mm._tags_at -= mm.TAGS_TTL
+        mm._poll()
+        self.assertEqual(self.paths().count("/api/tags"), 2)
+        self.assertEqual(self.paths().count("/api/ps"), 3)
+
+    def test_retry_after_server_closes_keepalive(self):
+        self.srv.hang_up = True
+        self.assertEqual(mm._ollama("/api/ps"), PS)
+        self.assertEqual(mm._ollama("/api/ps"), PS)   # stale socket, then a fresh one
+        self.assertEqual(self.paths(), ["/api/ps", "/api/ps"])
+        self.assertNotEqual(self.srv.hits[0][1], self.srv.hits[1][1])
+
+    def test_backoff_grows_and_resets(self):
+        self.srv.down = True
+        delays = []
+        for _ in range(4):
+            ps, tags, retry_in = mm._poll()
+            self.assertIsNone(ps)
+            delays.append(retry_in)
+            n = len(self.srv.hits)
+            self.assertIsNone(mm._poll()[0])   # still backing off: no request
+            self.assertEqual(len(self.srv.hits), n)
+            mm._retry_at = 0.0                 # as if the delay had passed
+        self.assertEqual(delays, [2, 4, 8, 16])
+
+        mm._fails = 10
+        self.assertEqual(mm._poll()[2], mm.BACKOFF_MAX)
+
+        self.srv.down, mm._retry_at = False, 0.0
+        ps, tags, retry_in = mm._poll()
+        self.assertEqual((ps, retry_in, mm._fails), (PS, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
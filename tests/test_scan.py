@@ -0,0 +1,59 @@
+"""scan's byte ranges, and that a parallel scan adds up to a serial one."""
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules import scan
+
+TOOLS = ["Read", "Edit", "Bash", "Grep", "WebFetch"]
+
+
+def write_log(path, n=3000, seed=7):
+    rnd = random.Random(seed)
+    lines = []
+    for i in range(n):
+        ev = {"epoch": 1_700_000_000 + i * 7, "tool": rnd.choice(TOOLS),
+              "session_id": f"s{i // 400}", "target": "x" * rnd.randrange(80)}
+        lines.append(json.dumps(ev))
+        if i % 500 == 0:
+            lines += ["not json", "[1]"]   # one of each kind of bad line
+    path.write_text("\n".join(lines) + '\n{"epoch": 1, "tool": "Re')   # writer mid-append
+
+
+class ScanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = Path(tempfile.mkdtemp()) / "cc_events.jsonl"
+        write_log(self.path)
+        self.data = self.path.read_bytes()
+
+    def test_split_ranges_are_contiguous_and_newline_aligned(self):
+        end = self.data.rfind(b"\n") + 1
+        for parts in (1, 2, 3, 7, 64):
+            ranges = scan.split_ranges(self.path, parts)
+            self.assertLessEqual(len(ranges), parts)
+            self.assertEqual(ranges[0][0], 0)
+            self.assertEqual(ranges[-1][1], end)   # the partial line is left out
+            for (_, b), (a, _) in zip(ranges, ranges[1:]):
+                self.assertEqual(a, b)
+            for _, b in ranges:
+                self.assertEqual(self.data[b - 1:b], b"\n")
+
+    def test_parallel_matches_serial(self):
+        with mock.patch.object(scan, "BLOCK", 4096):   # many blocks per range
+            serial = scan.scan(self.path, workers=1, minutes_since=0)
+        with mock.patch.object(scan, "MIN_PARALLEL", 0):
+            parallel = scan.scan(self.path, workers=3, minutes_since=0)
+        self.assertEqual(parallel, serial)
+        self.assertEqual((serial["lines"], serial["bad"]), (3000, 12))
+        self.assertEqual(sum(serial["counts"].values()), 3000)
+        self.assertEqual(serial["offset"], self.data.rfind(b"\n") + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
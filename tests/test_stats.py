@@ -0,0 +1,100 @@
+"""Running statistics against the straightforward whole-list formulas."""
+import math
+import random
+import statistics
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules import behavioral_metrics
+from modules.stats import Welford, Windowed
+
+
+def drift(scores):
+    """σ/μ as behavioral_metrics computed it from the full list of scores."""
+    if len(scores) >= 2:
+        mu = sum(scores) / len(scores)
+        sigma = math.sqrt(sum((s - mu) ** 2 for s in scores) / len(scores))
+        return sigma / mu if mu > 0 else 0.0
+    return 0.0 if scores else None
+
+
+def baseline(entries):
+    """drift, mistakes, recurring, half-life, patterns, sessions, from scratch."""
+    spans = {}
+    for i, e in enumerate(entries):
+        for r in e.get("recurring", []):
+            spans.setdefault(r[:50], [i, i])[1] = i
+    lifetimes = [b - a + 1 for a, b in spans.values()]
+    return (drift([e["score"] for e in entries if e.get("score") is not None]),
+            sum(len(e.get("mistakes", [])) for e in entries),
+            sum(len(e.get("recurring", [])) for e in entries),
+            sum(lifetimes) / len(lifetimes) if lifetimes else None,
+            len(spans), len(entries))
+
+
+class WelfordTest(unittest.TestCase):
+
+    def test_matches_mean_and_pvariance(self):
+        rnd = random.Random(1)
+        values = [rnd.uniform(0, 10) for _ in range(500)]
+        w = Welford()
+        for i, x in enumerate(values, 1):
+            w.add(x)
+            if i % 50 == 0:
+                self.assertAlmostEqual(w.mean, statistics.fmean(values[:i]), places=9)
+                self.assertAlmostEqual(w.var, statistics.pvariance(values[:i]), places=9)
+                self.assertAlmostEqual(w.cv(), drift(values[:i]), places=9)
+
+    def test_windowed_tracks_the_last_slots(self):
+        rnd = random.Random(2)
+        for size in (1, 3, 10):
+            w, seen = Windowed(size), []
+            for _ in range(300):
+                x = rnd.choice([rnd.randint(1, 10), rnd.uniform(0, 10), None])
+                w.add(x)
+                seen.append(x)
+                tail = [v for v in seen[-size:] if v is not None]
+                self.assertEqual(w.n, len(tail))
+                if tail:
+                    self.assertAlmostEqual(w.mean, statistics.fmean(tail), places=9)
+                    # removals leave float residue in the variance
+                    self.assertAlmostEqual(w.cv(), drift(tail), places=6)
+                else:
+                    self.assertIsNone(w.cv())
+
+    def test_cv_edges(self):
+        w = Welford()
+        self.assertIsNone(w.cv())
+        w.add(7)
+        self.assertEqual(w.cv(), 0.0)
+        w.remove(7)
+        self.assertEqual((w.n, w.mean, w.var), (0, 0.0, 0.0))
+
+
+class CritiqueStatsTest(unittest.TestCase):
+
+    def test_views_match_the_baseline_numbers(self):
+        rnd = random.Random(3)
+        patterns = [f"pattern {i} " + "x" * 60 for i in range(8)]
+        stats, entries = behavioral_metrics._CritiqueStats(), []
+        for i in range(120):
+            e = {"mistakes": ["m"] * rnd.randint(0, 4),
+                 "recurring": rnd.sample(patterns, rnd.randint(0, 3))}
+            if rnd.random() < 0.8:
+                e["score"] = rnd.randint(1, 10)
+            stats.add(e)
+            entries.append(e)
+            for window in (None,) + behavioral_metrics.WINDOWS:
+                got = stats.view(window)
+                want = baseline(entries[-window:] if window else entries)
+                self.assertEqual(got[1:], want[1:], (i, window))
+                if want[0] is None:
+                    self.assertIsNone(got[0])
+                else:
+                    self.assertAlmostEqual(got[0], want[0], places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""store's rollup windows against counts taken straight from the raw logs."""
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules import core, eventlog, scan, store
+
+NOW   = 1_700_006_400.0          # on an hour boundary
+TOOLS = ["Read", "Edit", "Bash", "Grep"]
+HOOKS = ["pre_write", "publish_gate"]
+
+
+class RollupTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.events, self.gates = tmp / "cc_events.jsonl", tmp / "hook_decisions.jsonl"
+        self.rnd = random.Random(5)
+        self.tools, self.decisions = [], []
+        self.append(NOW - 5 * 3600, NOW - 600, 900)
+        core.set_clock(lambda: NOW)
+        self.addCleanup(core.set_clock)
+        for patch in (mock.patch.object(store, "DASH_DIR", tmp),
+                      mock.patch.object(store, "DB_PATH", tmp / "events.db"),
+                      mock.patch.dict(store.SOURCES, {
+                          "tools": (self.events, store.SOURCES["tools"][1]),
+                          "gates": (self.gates, store.SOURCES["gates"][1])}),
+                      mock.patch.object(store, "_conn", None),
+                      mock.patch.object(store, "_last_sync", 0.0)):
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(lambda: store._conn and store._conn.close())
+
+    def append(self, lo, hi, n):
+        with open(self.events, "a") as ev, open(self.gates, "a") as gates:
+            for epoch in sorted(self.rnd.uniform(lo, hi) for _ in range(n)):
+                tool = self.rnd.choice(TOOLS)
+                ev.write(json.dumps({"epoch": epoch, "tool": tool}) + "\n")
+                self.tools.append((epoch, tool))
+                if self.rnd.random() < 0.3:
+                    hook, d = self.rnd.choice(HOOKS), self.rnd.choice(["allow", "warn", "block"])
+                    gates.write(json.dumps({"epoch": epoch, "hook": hook, "decision": d}) + "\n")
+                    self.decisions.append((epoch, hook, d))
+
+    def raw(self, since, until):
+        tools, gates = {}, {}
+        for epoch, tool in self.tools:
+            if since <= epoch < until:
+                tools[tool] = tools.get(tool, 0) + 1
+        for epoch, hook, d in self.decisions:
+            if since <= epoch < until:
+                gates[(hook, d)] = gates.get((hook, d), 0) + 1
+        return tools, gates
+
+    def check(self):
+        store.sync(force=True)
+        # Minute-aligned windows: inside one hour, across hours, ragged at both ends
+        for since, until in ((NOW - 3600, NOW), (NOW - 2 * 3600 - 420, NOW - 1200),
+                             (NOW - 1800, NOW - 1500), (NOW - 6 * 3600, NOW)):
+            self.assertEqual((store.tool_counts(since, until), store.gate_counts(since, until)),
+                             self.raw(since, until), (NOW - since, NOW - until))
+
+    def test_windows_match_raw_counts(self):
+        self.assertTrue(store.enabled({"store": True}, NOW - 86400))
+        self.check()
+
+    def test_incremental_and_after_compaction(self):
+        self.check()
+        self.append(NOW - 600, NOW - 300, 200)
+        self.check()
+        eventlog.compact(self.events)   # the next sync finishes .1 first
+        self.append(NOW - 300, NOW - 1, 200)
+        self.check()
+
+    def test_rebuild_through_the_parallel_scanner(self):
+        with mock.patch.object(scan, "MIN_PARALLEL", 0):
+            self.check()
+
+    def test_purged_minutes_send_callers_to_the_raw_log(self):
+        store.sync(force=True)
+        self.assertFalse(store.enabled({"store": True}, NOW - store.MINUTE_RETAIN - 3600))
+        self.assertFalse(store.enabled({}, NOW))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""SpaceSaving's error bounds, and WindowedTopK's windows against exact counts."""
+import random
+import sys
+import unittest
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.topk import SpaceSaving, WindowedTopK
+
+
+def stream(seed, n=20000, distinct=500):
+    rnd = random.Random(seed)
+    return [f"/vault/{int(rnd.paretovariate(1.1)) % distinct}" for _ in range(n)]
+
+
+class SpaceSavingTest(unittest.TestCase):
+
+    def check_bounds(self, s, true, total):
+        self.assertEqual(s.total, total)
+        self.assertLessEqual(len(s.counts), s.k)
+        floor = min(s.counts.values())
+        for item, n in s.counts.items():
+            # Never under, and over by at most the smallest counter (<= total / k)
+            self.assertGreaterEqual(n, true[item])
+            self.assertLessEqual(n - true[item], floor)
+        self.assertLessEqual(floor, total / s.k)
+        for item, n in true.items():
+            if n > total / s.k:   # every heavy hitter is kept
+                self.assertIn(item, s.counts)
+
+    def test_bounds(self):
+        for seed, k in ((1, 8), (2, 32), (3, 64)):
+            items = stream(seed)
+            s = SpaceSaving(k)
+            for item in items:
+                s.add(item)
+            self.check_bounds(s, Counter(items), len(items))
+
+    def test_merge_error_is_bounded_by_the_parts(self):
+        parts, true = [], Counter()
+        for seed in range(4):
+            items = stream(seed, n=5000)
+            s = SpaceSaving(16)
+            for item in items:
+                s.add(item)
+            parts.append(s)
+            true.update(items)
+        merged = SpaceSaving(16).merge(parts)
+        self.assertEqual(merged.total, sum(true.values()))
+        # A part over-counts a kept item, or missed an evicted one, by at most its floor
+        slack = sum(min(p.counts.values()) for p in parts)
+        for item, n in merged.counts.items():
+            self.assertLessEqual(abs(n - true[item]), slack)
+        top = max(true, key=true.get)
+        self.assertEqual(merged.top(1)[0][0], top)
+
+
+class WindowedTest(unittest.TestCase):
+
+    def test_window_totals_are_exact_to_a_bucket(self):
+        rnd = random.Random(4)
+        w = WindowedTopK(k=8, bucket=60, retain=3600)
+        seen, t = [], 10_000.0
+        for i in range(5000):
+            t += rnd.expovariate(1 / 3)
+            item = f"d{int(rnd.paretovariate(1.2)) % 50}"
+            w.add(item, t)
+            seen.append((t, item))
+            if i % 97 == 0:
+                for secs in (300, 1800):
+                    floor = t - secs - 60   # whole buckets that start after this
+                    want = sum(1 for ts, _ in seen if ts // 60 * 60 > floor)
+                    self.assertEqual(w.window(secs, t).total, want)
+        self.assertEqual(w.window(None, t).total, len(seen))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""web.Hub's event stream, served on localhost and fed by a stub tick."""
+import http.client
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules import collector, eventlog, gate_activity, net_activity, tool_flow, web
+
+PANELS = ["gate_activity", "tool_flow"]   # split modules; the stub supplies their data
+
+
+class StubTick:
+    def __init__(self, data):
+        self.data = data
+
+    def collect(self, name, mod, profile):
+        return self.data[name]
+
+
+class StreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.hub = web.Hub({"modules": PANELS}).start(0)
+        self.addCleanup(self.hub.server.server_close)
+        self.addCleanup(self.hub.server.shutdown)
+        self.publish({"gate_activity": {"blocks": 1}, "tool_flow": {"rate": 2}})
+
+    def publish(self, data):
+        self.hub.update(StubTick(data), PANELS, {})
+
+    def open(self, last_id=None):
+        c = http.client.HTTPConnection(*self.hub.server.server_address, timeout=0.5)
+        self.addCleanup(c.close)
+        c.request("GET", "/events", headers={"Last-Event-ID": str(last_id)} if last_id else {})
+        r = c.getresponse()
+        self.assertEqual(r.getheader("Content-Type"), "text/event-stream")
+        self.assertEqual(self.read(r), ["retry: 3000"])
+        return r
+
+    def read(self, r):
+        """Lines of the next message, up to the blank line that ends it."""
+        lines = []
+        while True:
+            line = r.fp.readline().decode().rstrip("\n")
+            if not line:
+                return lines
+            lines.append(line)
+
+    def test_only_changes_are_sent(self):
+        r = self.open(last_id=2)
+        self.publish({"gate_activity": {"blocks": 1}, "tool_flow": {"rate": 2}})
+        self.assertEqual(self.hub.seq, 2)
+        self.publish({"gate_activity": {"blocks": 1}, "tool_flow": {"rate": 5}})
+        self.assertEqual(self.hub.seq, 3)
+
+        msg = self.read(r)
+        self.assertEqual(msg[:2], ["id: 3", "event: panel"])
+        self.assertEqual(len(msg), 3)
+        self.assertEqual(json.loads(msg[2].removeprefix("data: ")),
+                         {"panel": "tool_flow", "data": {"rate": 5}})
+        with self.assertRaises(TimeoutError):   # nothing else is on its way
+            r.fp.readline()
+
+    def test_last_event_id_resumes(self):
+        self.publish({"gate_activity": {"blocks": 4}, "tool_flow": {"rate": 2}})
+        self.assertEqual(self.hub.panels["gate_activity"][0], 3)
+
+        r = self.open(last_id=2)
+        msg = self.read(r)
+        self.assertEqual(msg[0], "id: 3")
+        self.assertIn('"blocks": 4', msg[2])
+
+        r = self.open()   # a first connection gets every panel
+        ids = sorted(self.read(r)[0] for _ in PANELS)
+        self.assertEqual(ids, ["id: 2", "id: 3"])
+
+    def test_state(self):
+        c = http.client.HTTPConnection(*self.hub.server.server_address, timeout=2)
+        self.addCleanup(c.close)
+        c.request("GET", "/state")
+        state = json.loads(c.getresponse().read())
+        self.assertEqual(state["seq"], 2)
+        self.assertEqual(state["panels"]["tool_flow"]["data"], {"rate": 2})
+
+
+class UnchangedLogsTest(unittest.TestCase):
+    """Real collections of logs that did not change publish nothing new."""
+
+    def setUp(self):
+        tmp = Path(tempfile.mkdtemp())
+        now = time.time()
+        events, gates = tmp / "cc_events.jsonl", tmp / "hook_decisions.jsonl"
+        events.write_text("".join(json.dumps(ev) + "\n" for ev in [
+            {"epoch": now - 300, "tool": "Read", "target": "README.md"},
+            {"epoch": now - 200, "tool": "WebFetch", "target": "https://docs.python.org/3/"},
+            {"epoch": now - 100, "tool": "Bash", "command": "curl https://example.com/x"},
+        ]))
+        gates.write_text("".join(json.dumps(ev) + "\n" for ev in [
+            {"epoch": now - 250, "hook": "pre_write", "decision": "allow"},
+            {"epoch": now - 50, "hook": "pre_write", "decision": "block"},
+        ]))
+        for patch in (mock.patch.object(tool_flow, "CC_EVENTS", events),
+                      mock.patch.object(gate_activity, "HOOK_DECISIONS", gates),
+                      mock.patch.object(net_activity, "_index", {}),
+                      mock.patch.object(net_activity, "_tail", eventlog.JsonlTail(
+                          events, match=net_activity.MATCH, history=True))):
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.names = ["gate_activity", "net_activity", "tool_flow"]
+        self.hub = web.Hub({"modules": self.names})
+
+    def update(self):
+        profile = {"collect_workers": 0}
+        self.hub.update(collector.Tick(profile).start(self.names, profile), self.names, profile)
+
+    def test_seq_stays_put(self):
+        self.update()
+        self.assertEqual(self.hub.seq, 3)
+        self.assertNotIn("error", self.hub.panels["net_activity"][1])
+        time.sleep(1.1)   # a clock reading in the data would now differ
+        self.update()
+        self.assertEqual(self.hub.seq, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()